@@ -1,48 +1,196 @@
+import argparse
+import csv
+import hashlib
 import json
 import os
+import time
+from collections import Counter
 
-def load_current_verbs(filename="verbs.json"):
-    if not os.path.exists(filename):
+from deck_index import DeckIndex
+from storage import DEFAULT_PATH, open_storage
+
+REQUIRED_FIELDS = ("verb", "turkish", "sentence")
+BATCH_SIZE = 5000
+
+
+def load_current_verbs(filename=DEFAULT_PATH):
+    storage = open_storage(filename)
+    if not storage.exists():
+        storage.close()
         return [], 0
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = storage.load()
+    storage.close()
     if not data:
         return [], 0
-    max_id = max(item["id"] for item in data)
+    max_id = DeckIndex.from_items(data).max_id
     return data, max_id
 
-def add_new_verbs(new_verbs, filename="verbs.json"):
-    current_data, max_id = load_current_verbs(filename)
-    current_verbs_set = {item["verb"].lower() for item in current_data}
-    
-    added_count = 0
-    skipped_count = 0
-    
-    for verb_data in new_verbs:
-        if verb_data["verb"].lower() in current_verbs_set:
-            print(f"Skipping duplicate: {verb_data['verb']}")
-            skipped_count += 1
-            continue
-            
-        max_id += 1
-        verb_data["id"] = max_id
-        # Set defaults if missing
-        if "weight" not in verb_data:
-            verb_data["weight"] = 100
-        if "correct_count" not in verb_data:
-            verb_data["correct_count"] = 0
-            
-        current_data.append(verb_data)
-        current_verbs_set.add(verb_data["verb"].lower())
-        added_count += 1
-        
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(current_data, f, ensure_ascii=False, indent=2)
-        
-    print(f"Added {added_count} new verbs. Skipped {skipped_count} duplicates.")
-    print(f"Total verbs: {len(current_data)}")
+
+# --- Streaming readers: each yields one dict per input row ---
+
+def read_csv(path, delimiter=","):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f, delimiter=delimiter):
+            yield row
+
+
+def read_tsv(path):
+    return read_csv(path, delimiter="\t")
+
+
+def read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Reported as invalid by validate_row
+                yield None
+
+
+def read_json(path):
+    # Plain JSON arrays (e.g. another verbs.json) are not streamable with the
+    # standard library; they are loaded once and then iterated.
+    with open(path, "r", encoding="utf-8") as f:
+        yield from json.load(f)
+
+
+READERS = {
+    ".csv": read_csv,
+    ".tsv": read_tsv,
+    ".jsonl": read_jsonl,
+    ".ndjson": read_jsonl,
+    ".json": read_json,
+}
+
+
+def read_rows(path, fmt=None):
+    ext = "." + fmt if fmt else os.path.splitext(path)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Unsupported input format: {ext}")
+    return READERS[ext](path)
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# --- Validation and deduplication ---
+
+def verb_hash(verb):
+    # 8-byte digest of the lowercased verb; much smaller than keeping every
+    # verb string in memory for huge decks
+    return hashlib.blake2b(verb.strip().lower().encode("utf-8"), digest_size=8).digest()
+
+
+def validate_row(row):
+    # Returns (card, None) or (None, reason)
+    if not isinstance(row, dict):
+        return None, "malformed row"
+    card = {}
+    for field in REQUIRED_FIELDS:
+        value = row.get(field)
+        if not isinstance(value, str) or not value.strip():
+            return None, f"missing {field}"
+        card[field] = value.strip()
+    category = row.get("category")
+    card["category"] = category.strip() if isinstance(category, str) and category.strip() else "General"
+    card["weight"] = 100
+    card["correct_count"] = 0
+    return card, None
+
+
+def import_rows(rows, filename=DEFAULT_PATH, batch_size=BATCH_SIZE):
+    # Streams rows into the deck in batches and returns a summary report
+    start = time.perf_counter()
+    storage = open_storage(filename)
+
+    known = set()
+    max_id = 0
+    existing = 0
+    if storage.exists():
+        for item in storage.iter_cards():
+            known.add(verb_hash(item["verb"]))
+            max_id = max(max_id, item["id"])
+            existing += 1
+
+    report = {"read": 0, "added": 0, "duplicates": 0, "invalid": Counter()}
+    for batch in batched(rows, batch_size):
+        report["read"] += len(batch)
+        to_write = []
+        for row in batch:
+            card, reason = validate_row(row)
+            if card is None:
+                report["invalid"][reason] += 1
+                continue
+            key = verb_hash(card["verb"])
+            if key in known:
+                report["duplicates"] += 1
+                continue
+            known.add(key)
+            max_id += 1
+            card["id"] = max_id
+            to_write.append(card)
+        if to_write:
+            storage.add_cards(to_write)
+            report["added"] += len(to_write)
+
+    storage.compact()
+    storage.close()
+
+    elapsed = time.perf_counter() - start
+    report["invalid"] = dict(report["invalid"])
+    report["total"] = existing + report["added"]
+    report["seconds"] = round(elapsed, 3)
+    report["rows_per_sec"] = round(report["read"] / elapsed) if elapsed > 0 else 0
+    return report
+
+
+def print_report(report):
+    invalid = sum(report["invalid"].values())
+    print(f"Read {report['read']} rows in {report['seconds']}s ({report['rows_per_sec']} rows/sec)")
+    print(f"Added {report['added']} new verbs. Skipped {report['duplicates']} duplicates, {invalid} invalid.")
+    for reason, count in sorted(report["invalid"].items()):
+        print(f"  {reason}: {count}")
+    print(f"Total verbs: {report['total']}")
+
+
+def add_new_verbs(new_verbs, filename=DEFAULT_PATH):
+    report = import_rows(new_verbs, filename)
+    print_report(report)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import verbs from CSV, TSV, JSONL or JSON files.")
+    parser.add_argument("inputs", nargs="+", help="files with verb, turkish, sentence[, category] columns")
+    parser.add_argument("--deck", default=DEFAULT_PATH, help=f"target deck (default: {DEFAULT_PATH})")
+    parser.add_argument("--format", choices=["csv", "tsv", "jsonl", "ndjson", "json"],
+                        help="input format (default: from file extension)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--report", help="also write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    def all_rows():
+        for path in args.inputs:
+            yield from read_rows(path, args.format)
+
+    report = import_rows(all_rows(), args.deck, args.batch_size)
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
 
 if __name__ == "__main__":
-    # Example usage / Test
-    # existing verbs won't be re-added
-    pass
+    main()
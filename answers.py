@@ -0,0 +1,224 @@
+import re
+import unicodedata
+
+# Yazılan cevapta kabul edilen en fazla harf hatası, cevabın uzunluğuna göre
+# (kısa kelimelerde tek harf başka bir kelime demek olabilir)
+TYPO_LIMITS = ((3, 0), (7, 1))
+MAX_TYPOS = 2
+
+# Türkçe büyük/küçük harf (I -> ı, İ -> i; str.lower "İ"yi "i̇" yapar) ve
+# Türkçe harflerin aksansız karşılıkları tek tabloda
+TURKISH_FOLD = str.maketrans("IİıÇçĞğÖöŞşÜüÂâÎîÛû", "iiiccggoossuuaaiiuu")
+PUNCTUATION = re.compile(r"[^\w\s]")
+PARENTHESES = re.compile(r"\([^)]*\)")
+SEPARATORS = re.compile(r"[,;]|\s/\s")
+
+
+def normalize(text):
+    # "  Kaldırmak!" -> "kaldirmak": Türkçe küçük harf, aksan/şapka ve
+    # noktalama yok sayılır, boşluklar teklenir. ı da i olur; klavyesinde
+    # Türkçe harf olmayan öğrenci "yuksek" yazabilsin.
+    text = text.translate(TURKISH_FOLD).lower()
+    if not text.isascii():
+        # Diğer aksanlı harfler (é, ñ ...)
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(PUNCTUATION.sub(" ", text).split())
+
+
+def answer_forms(text):
+    # Kabul edilen yazımlar: "azaltmak (tüketim) / kesmek (ağaç)" ->
+    # {"azaltmak tuketim", "azaltmak", "kesmek agac", "kesmek"}
+    forms = set()
+    for part in SEPARATORS.split(text):
+        forms.add(normalize(part))
+        bare = PARENTHESES.sub(" ", part)
+        forms.add(normalize(bare))
+        # Parantez dışındaki boşluksuz eğik çizgi de ayırıcıdır ("kapmak/tutmak")
+        for piece in bare.split("/"):
+            forms.add(normalize(piece))
+    forms.discard("")
+    return forms
+
+
+def typo_limit(text):
+    for length, limit in TYPO_LIMITS:
+        if len(text) <= length:
+            return limit
+    return MAX_TYPOS
+
+
+def distance(a, b):
+    # Levenshtein uzaklığı, bit paralel (Myers / Hyyrö): kısa olan kelimenin
+    # her harfi bir bit; uzun kelimenin harf başına birkaç tamsayı işlemi
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(b)
+    if m == 0:
+        return len(a)
+    peq = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv & full
+    return score
+
+
+class BKTree:
+    # Burkhard-Keller ağacı: düğüm [kelime, {uzaklık: çocuk}]. Üçgen eşitsizliği
+    # sayesinde `limit` uzaklıktaki kelimeler için sadece |d - uzaklık| <= limit
+    # olan dallara inilir; arama desteyi taramaz.
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, word):
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            d = distance(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word, limit):
+        # [(uzaklık, kelime)], en yakından uzağa
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            d = distance(word, node[0])
+            if d <= limit:
+                found.append((d, node[0]))
+            for key, child in node[1].items():
+                if d - limit <= key <= d + limit:
+                    stack.append(child)
+        found.sort()
+        return found
+
+
+class AnswerMatch:
+    # correct: kabul edildi mi, typos: kabul edilen yazımdan uzaklık,
+    # confused: cevap başka bir kartın anlamına uyuyorsa o kartın konumu
+    __slots__ = ("correct", "typos", "confused")
+
+    def __init__(self, correct, typos=0, confused=None):
+        self.correct = correct
+        self.typos = typos
+        self.confused = confused
+
+
+class AnswerIndex:
+    # Yazılı cevap modu için normalize Türkçe anlam indeksi. Kontrol önce
+    # kartın kendi yazımlarına (birkaç karşılaştırma), sonra aynı İngilizce
+    # fiilin destedeki diğer kartlarına bakar; deste boyutundan bağımsızdır.
+    # Yanlış cevabın hangi kelimeyle karıştırıldığı tüm yazımların BK-ağacında
+    # aranır; yazım tablosu ve ağaç ilk yanlış cevapta (ya da prepare() ile
+    # önceden) kurulur, desteye eklenen kartlarla büyür.
+    def __init__(self, vocab):
+        self.vocab = vocab
+        self.forms = {}         # deste konumu -> kabul edilen yazımlar (ilk soruda)
+        self.by_verb = {}       # küçük harfli fiil -> [deste konumu]
+        self.by_form = {}       # yazım -> [deste konumu]
+        self.tree = BKTree()
+        self._indexed = 0       # by_form / tree'ye eklenen kart sayısı
+        self._built = 0
+        self._sync()
+
+    def _sync(self):
+        # Desteye sonradan eklenen kartlar
+        verbs = self.vocab.verbs
+        while self._built < len(verbs):
+            self.by_verb.setdefault(verbs[self._built].lower(), []).append(self._built)
+            self._built += 1
+
+    def expected(self, position):
+        forms = self.forms.get(position)
+        if forms is None:
+            forms = self.forms[position] = answer_forms(self.vocab.turkish[position])
+        return forms
+
+    def prepare(self):
+        # Karıştırma araması için yazım tablosu ve BK-ağacı
+        self._sync()
+        while self._indexed < self._built:
+            for form in self.expected(self._indexed):
+                positions = self.by_form.get(form)
+                if positions is None:
+                    self.by_form[form] = [self._indexed]
+                    self.tree.add(form)
+                else:
+                    positions.append(self._indexed)
+            self._indexed += 1
+
+    def _match(self, position, typed, limit):
+        # Kartın yazımlarına en yakın uzaklık (limit aşılırsa None)
+        best = None
+        for form in self.expected(position):
+            if abs(len(form) - len(typed)) > limit:
+                continue
+            d = distance(typed, form)
+            if d <= limit and (best is None or d < best):
+                best = d
+        return best
+
+    def _typos(self, position, typed):
+        # Yazımın kabul edilen harf hatası sayısı; kabul edilmezse None
+        if typed in self.expected(position):
+            return 0
+        limit = typo_limit(typed)
+        # Aynı fiil destede farklı anlamlarla birden fazla kez olabilir
+        best = None
+        for other in self.by_verb.get(self.vocab.verbs[position].lower(), (position,)):
+            d = self._match(other, typed, limit)
+            if d is not None and (best is None or d < best):
+                best = d
+        return best
+
+    def check(self, position, text):
+        self._sync()
+        # "kapmak, yakalamak" gibi birden fazla anlam yazıldıysa hepsi doğru olmalı
+        parts = [normalize(part) for part in SEPARATORS.split(text)]
+        parts = [part for part in parts if part]
+        if not parts:
+            return AnswerMatch(False)
+        typos = [self._typos(position, part) for part in parts]
+        if None not in typos:
+            return AnswerMatch(True, sum(typos))
+        # Yanlış: başka bir kartın anlamı mı yazıldı?
+        typed = parts[typos.index(None)]
+        self.prepare()
+        positions = self.by_form.get(typed)
+        if positions is None:
+            # Tek harf farkı yeter; daha geniş arama ağacın büyük kısmını gezer
+            found = self.tree.search(typed, min(typo_limit(typed), 1))
+            positions = self.by_form[found[0][1]] if found else None
+        return AnswerMatch(False, confused=positions[0] if positions else None)
@@ -0,0 +1,63 @@
+"""Yazılı cevap kontrolü: doğru / yazım hatalı / yanlış cevap başına süre ve
+karıştırma araması için BK-ağacının kurulum süresi. Sentetik anlamlar
+rastgele Türkçe harflerden üretilir (synthetic.py'deki "anlamNmak" biçimi
+birbirine çok yakın olduğu için BK-ağacını yanıltır).
+
+    python benchmarks/bench_answers.py [--sizes 1000 10000 100000] [--answers 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from answers import AnswerIndex
+from card_store import Vocabulary
+
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+
+def make_vocab(count, seed=0):
+    rng = random.Random(seed)
+
+    def word():
+        return "".join(rng.choice(LETTERS) for _ in range(rng.randrange(4, 10))) + rng.choice(("mak", "mek"))
+
+    vocab = Vocabulary()
+    for i in range(count):
+        turkish = word() + (" / " + word() if rng.random() < 0.3 else "")
+        vocab.append({"id": i + 1, "verb": f"verb{i}", "turkish": turkish, "sentence": "", "category": "General"})
+    return vocab
+
+
+def per_answer(index, answers):
+    start = time.perf_counter()
+    for position, text in answers:
+        index.check(position, text)
+    return (time.perf_counter() - start) / len(answers) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--answers", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'doğru':>10} {'hatalı':>10} {'yanlış':>10} {'ağaç':>9}")
+    for size in args.sizes:
+        vocab = make_vocab(size)
+        index = AnswerIndex(vocab)
+        positions = [random.randrange(size) for _ in range(args.answers)]
+        exact = per_answer(index, [(p, vocab.turkish[p].upper()) for p in positions])
+        typo = per_answer(index, [(p, vocab.turkish[p].split(" / ")[0][:-1]) for p in positions])
+        start = time.perf_counter()
+        index.prepare()
+        build = time.perf_counter() - start
+        wrong = per_answer(index, [(p, vocab.turkish[(p + 1) % size][:-2] + "x") for p in positions])
+        print(f"{size:>10} {exact:>8.1f}µs {typo:>8.1f}µs {wrong:>8.1f}µs {build:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
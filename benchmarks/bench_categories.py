@@ -0,0 +1,61 @@
+"""Kategori oturumunda soru seçimi: her soruda tüm desteyi filtreleyip seçmek
+ile kategori kuyrukları (CategoryQueue) karşılaştırması.
+
+    python benchmarks/bench_categories.py [--sizes 10000 100000 1000000] [--questions 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_queue import CardQueue, CategoryQueue
+from card_store import CardStore
+from synthetic import make_items
+
+SCOPE = ["Travel", "Work"]
+
+
+def filtered_select(store, now):
+    # Eski yol: kapsamdaki kartları her soruda yeniden topla, vakti gelenlerden
+    # ağırlıklı seç, yoksa ağırlıklı rastgele
+    categories = store.vocab.categories
+    progress = store.progress
+    scope = set(SCOPE)
+    members = [i for i in range(len(store)) if categories[i] in scope]
+    due = [i for i in members if progress.next_review[i] <= now]
+    pool = due or members
+    return random.choices(pool, weights=[progress.weight[i] for i in pool])[0]
+
+
+def per_question(select, questions):
+    start = time.perf_counter()
+    for _ in range(questions):
+        select()
+    return (time.perf_counter() - start) / questions * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--questions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'filtre':>12} {'kuyruk':>12} {'kurulum':>10}")
+    for size in args.sizes:
+        store = CardStore.from_dicts(make_items(size))
+        now = time.time()
+        start = time.perf_counter()
+        queue = CategoryQueue(CardQueue(store.queue_items()), store.progress, store.vocab.categories)
+        queue.set_scope(SCOPE)
+        build = time.perf_counter() - start
+        # Eski yol yavaş; daha az soruyla ölçülür
+        legacy = per_question(lambda: filtered_select(store, now), min(args.questions, 50))
+        fast = per_question(lambda: queue.select(now), args.questions)
+        print(f"{size:>10} {legacy:>10.1f}µs {fast:>10.1f}µs {build:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
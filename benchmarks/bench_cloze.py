@@ -0,0 +1,65 @@
+"""Boşluk doldurma: ters indeksin kurulum süresi, soru başına boşluk +
+çeldirici süresi ve bir fiilin geçtiği cümleleri bulma (indeks / tüm
+desteyi tarama). Gerçek destenin cümleleri çoğaltılarak büyütülür.
+
+    python benchmarks/bench_cloze.py [--sizes 1000 10000 100000] [--questions 2000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from card_store import Vocabulary
+from cloze import ClozeIndex, find_blank
+
+
+def make_vocab(count):
+    with open(os.path.join(ROOT, "verbs.json"), encoding="utf-8") as f:
+        cards = json.load(f)
+    vocab = Vocabulary()
+    for i in range(count):
+        card = cards[i % len(cards)]
+        vocab.append({"id": i + 1, "verb": card["verb"], "turkish": card["turkish"],
+                      "sentence": card["sentence"], "category": card.get("category", "General")})
+    return vocab
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--questions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'kurulum':>9} {'soru':>10} {'cümleler':>10} {'tarama':>10}")
+    for size in args.sizes:
+        vocab = make_vocab(size)
+        start = time.perf_counter()
+        index = ClozeIndex(vocab)
+        build = time.perf_counter() - start
+        positions = [p for p in random.sample(range(size), min(size, args.questions)) if index.blank(p)]
+
+        start = time.perf_counter()
+        for position in positions:
+            index.prompt(position)
+            index.distractors(position, 3)
+        question = (time.perf_counter() - start) / len(positions) * 1e6
+
+        verbs = [vocab.verbs[p] for p in positions[:200]]
+        start = time.perf_counter()
+        for verb in verbs:
+            index.sentences_with(verb)
+        lookup = (time.perf_counter() - start) / len(verbs) * 1e6
+        start = time.perf_counter()
+        for verb in verbs[:20]:
+            [p for p, sentence in enumerate(vocab.sentences) if find_blank(verb, sentence) is not None]
+        scan = (time.perf_counter() - start) / len(verbs[:20]) * 1e6
+        print(f"{size:>10} {build:>8.2f}s {question:>8.1f}µs {lookup:>8.1f}µs {scan / 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Şık üretme gecikmesi: eski (tüm desteyi kopyala + random.sample) yöntem ile
+DistractorEngine karşılaştırması.
+
+    python benchmarks/bench_distractors.py [--sizes 1000 100000] [--questions 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_store import CardStore
+from distractors import DistractorEngine
+from synthetic import make_items
+
+
+def legacy_options(store, position):
+    # Eski Game.get_valid_distractors + seçenek karıştırma
+    turkish = store.vocab.turkish
+    candidates = [i for i in range(len(turkish)) if i != position]
+    options = [turkish[i] for i in random.sample(candidates, 3)] + [turkish[position]]
+    random.shuffle(options)
+    return options
+
+
+def engine_options(engine, store, position, hard=False):
+    options = engine.sample(position, 3, hard=hard) + [store.vocab.turkish[position]]
+    random.shuffle(options)
+    return options
+
+
+def per_question(func, positions, *args, **kwargs):
+    start = time.perf_counter()
+    for position in positions:
+        func(*args, position, **kwargs)
+    return (time.perf_counter() - start) / len(positions) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--questions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'eski':>12} {'motor':>12} {'motor/zor':>12} {'kurulum':>10}")
+    for size in args.sizes:
+        store = CardStore.from_dicts(make_items(size))
+        start = time.perf_counter()
+        engine = DistractorEngine(store.vocab)
+        build = time.perf_counter() - start
+        positions = [random.randrange(size) for _ in range(args.questions)]
+        legacy = per_question(legacy_options, positions[:200], store)
+        fast = per_question(engine_options, positions, engine, store)
+        hard = per_question(engine_options, positions, engine, store, hard=True)
+        print(f"{size:>10} {legacy:>10.1f}µs {fast:>10.1f}µs {hard:>10.1f}µs {build:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
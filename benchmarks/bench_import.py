@@ -0,0 +1,49 @@
+"""Toplu içe aktarma hızı (satır/sn): sentetik CSV -> JSON ve SQLite desteleri.
+
+    python benchmarks/bench_import.py [--rows 100000] [--batch-size 5000]
+"""
+import argparse
+import csv
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from add_words import import_rows, read_rows
+from synthetic import make_items
+
+
+def write_csv(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["verb", "turkish", "sentence", "category"],
+                                extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, "words.csv")
+        write_csv(source, make_items(args.rows))
+        for deck in ("verbs.json", "verbs.db"):
+            target = os.path.join(workdir, deck)
+            if deck.endswith(".json"):
+                shutil.copy(os.path.join(root, "verbs.json"), target)
+            report = import_rows(read_rows(source), target, args.batch_size)
+            print(f"{deck:>11}: {report['read']} satır, {report['added']} eklendi, "
+                  f"{report['seconds']}s, {report['rows_per_sec']} satır/sn")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Eski (nesne / dict listesi) ve yeni (sütunlu CardStore) deste gösterimlerinin
+bellek karşılaştırması.
+
+    python benchmarks/bench_memory.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_queue import CardQueue, OverlayQueue
+from card_store import CardStore, OverlayProgress
+from srs import DueForecast
+from synthetic import make_items
+
+
+class LegacyVerbCard:
+    # Eski main.VerbCard: örnek başına __dict__ ile dokuz alan
+    def __init__(self, data):
+        self.id = data["id"]
+        self.verb = data["verb"]
+        self.turkish = data["turkish"]
+        self.sentence = data["sentence"]
+        self.category = data.get("category", "General")
+        self.weight = data.get("weight", 100)
+        self.correct_count = data.get("correct_count", 0)
+        self.last_reviewed = data.get("last_reviewed", 0)
+        self.next_review = data.get("next_review", 0)
+
+
+def legacy_objects(items):
+    return [LegacyVerbCard(item) for item in items]
+
+
+def legacy_dicts(items):
+    # Eski streamlit_app.load_data çıktısı
+    return [{
+        "id": item["id"],
+        "verb": item["verb"],
+        "turkish": item["turkish"],
+        "sentence": item["sentence"],
+        "category": item.get("category", "General"),
+        "weight": item.get("weight", 100),
+        "correct_count": item.get("correct_count", 0),
+        "next_review": item.get("next_review", 0),
+    } for item in items]
+
+
+def column_store(items):
+    return CardStore.from_dicts(items)
+
+
+def session_progress(store, queue, forecast, touched=100):
+    # Yeni düzende oturum başına tutulan kısım (streamlit_app ile aynı):
+    # `touched` kart değişmiş seyrek ilerleme ve kuyruk katmanı, vade
+    # tahmininin kopyası
+    deck = CardStore(store.vocab, OverlayProgress(store.progress))
+    for index in range(min(touched, len(store))):
+        deck.progress.correct_count[index] = 1
+        deck.progress.next_review[index] = 1.0
+    deck.queue = OverlayQueue(queue)
+    forecast = forecast.copy()
+    for index in deck.progress.changes:
+        deck.sync(index)
+        forecast.move(store.progress.next_review[index], deck.progress.next_review[index])
+    return deck, forecast
+
+
+def measure(build, *args):
+    gc.collect()
+    tracemalloc.start()
+    result = build(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'VerbCard':>12} {'dict list':>12} {'CardStore':>12} {'oturum*':>12}")
+    for size in args.sizes:
+        objects = measure(lambda: legacy_objects(make_items(size)))
+        dicts = measure(lambda: legacy_dicts(make_items(size)))
+        store = column_store(make_items(size))
+        columns = measure(lambda: column_store(make_items(size)))
+        queue = CardQueue(store.queue_items())
+        forecast = DueForecast(store.progress.next_review)
+        session = measure(session_progress, store, queue, forecast)
+        del store, queue, forecast
+        print(f"{size:>10} {objects / 2**20:>10.1f}MB {dicts / 2**20:>10.1f}MB "
+              f"{columns / 2**20:>10.1f}MB {session / 2**10:>10.1f}KB")
+    print("* 100 kart çalışılmış bir Streamlit oturumunun ek belleği (seçim kuyruğu dahil)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Streamlit tıklaması başına soru hazırlama maliyeti: her soruda seçim + şıklar
+(QuizSession) ile planlanmış partiden soru alma (SessionPlanner). Planlayıcının
+parti maliyeti ayrıca gösterilir; Streamlit'te bu iş sayfa çizildikten sonra
+arka planda yapılır.
+
+    python benchmarks/bench_planner.py [--sizes 1000 100000 1000000] [--questions 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_queue import CardQueue
+from card_store import CardStore
+from distractors import DistractorEngine
+from session import PLAN_SIZE, QuizSession, SessionPlanner
+from srs import DailyBudget, DueForecast, SchedulePolicy
+from synthetic import make_items
+
+
+def make_session(items):
+    store = CardStore.from_dicts(items)
+    store.queue = CardQueue(store.queue_items())
+    store.policy = SchedulePolicy(DueForecast(store.progress.next_review))
+    # Limitsiz bütçe: ölçüm boyunca plan limit yüzünden yeniden kurulmasın
+    budget = DailyBudget(new_limit=10**9, review_limit=10**9)
+    return QuizSession(store, DistractorEngine(store.vocab), budget)
+
+
+def run(quiz, questions):
+    # Tıklama başına: sonraki soruyu al (cevap işleme her iki yolda aynı)
+    clicks = 0.0
+    for _ in range(questions):
+        start = time.perf_counter()
+        question = quiz.next_question()
+        clicks += time.perf_counter() - start
+        quiz.submit(question.card.turkish)
+        if isinstance(quiz, SessionPlanner):
+            quiz.prefetch(background=False)
+    return clicks / questions * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--questions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'her soruda':>12} {'plandan':>12} {'parti':>10}")
+    for size in args.sizes:
+        items = list(make_items(size))
+        direct = run(make_session(items), args.questions)
+        planner = SessionPlanner(make_session(items))
+        start = time.perf_counter()
+        planner.fill()
+        batch = (time.perf_counter() - start) * 1000
+        planned = run(planner, args.questions)
+        print(f"{size:>10} {direct:>10.1f}µs {planned:>10.1f}µs {batch:>7.2f}ms ({PLAN_SIZE} soru)")
+
+
+if __name__ == "__main__":
+    main()
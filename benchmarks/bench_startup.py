@@ -0,0 +1,70 @@
+"""Açılış süresi: JSON ayrıştırma (eski yol), snapshot'sız ilk açılış (soğuk:
+ayrıştır + snapshot yaz) ve snapshot'tan açılış (sıcak). "ilk soru" sütunu,
+Game'in ilk soruda kurduğu seçim kuyruğu, vade tahmini ve şık havuzlarını da içerir.
+
+    python benchmarks/bench_startup.py [--sizes 1000 100000 1000000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_queue import CardQueue
+from card_store import CardStore
+from distractors import DistractorEngine
+from snapshot import snapshot_path
+from srs import DueForecast
+from storage import JsonStorage
+from synthetic import make_items
+
+
+def timed(func):
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def legacy_load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return CardStore.from_dicts(json.load(f))
+
+
+def first_question(storage):
+    # Game.load_data + build_indexes
+    store = storage.load_store()
+    store.queue = CardQueue(store.queue_items())
+    DueForecast(store.progress.next_review)
+    DistractorEngine(store.vocab)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'kart':>10} {'json':>9} {'soğuk':>9} {'sıcak':>9} {'ilk soru':>9} {'snapshot':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "verbs.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(list(make_items(size)), f, ensure_ascii=False, indent=2)
+            storage = JsonStorage(path)
+
+            legacy, _ = timed(lambda: legacy_load(path))
+            cold, _ = timed(storage.load_store)
+            warm, _ = timed(storage.load_store)
+            first, _ = timed(lambda: first_question(storage))
+            megabytes = os.path.getsize(snapshot_path(path)) / 1e6
+            storage.close()
+        print(f"{size:>10} {legacy:>8.3f}s {cold:>8.3f}s {warm:>8.3f}s {first:>8.3f}s {megabytes:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""server.py için yük testi: eşzamanlı öğrenciler keep-alive bağlantılarla
+soru ister ve cevap verir; istek/sn, gecikme yüzdelikleri ve sunucunun
+kullanıcı başına bellek artışı (/api/health rss_mb) raporlanır.
+
+Varsayılan olarak geçici bir klasörde sentetik deste ile sunucuyu kendisi başlatır:
+
+    python benchmarks/load_test.py [--users 1000] [--rounds 20] [--cards 10000]
+    python benchmarks/load_test.py --url http://127.0.0.1:8765   # çalışan sunucu
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from synthetic import make_items
+
+
+class Client:
+    # Tek keep-alive bağlantı üzerinden sıralı JSON istekleri
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+        await self.writer.drain()
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        length = 0
+        for line in head.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":", 1)[1])
+        data = await self.reader.readexactly(length) if length else b""
+        return status, json.loads(data) if data else None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def learner(host, port, name, rounds, latencies, errors, rng):
+    client = Client(host, port)
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            status, question = await client.request("GET", f"/api/next?user={name}")
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+                continue
+            if question.get("done"):
+                break
+            start = time.perf_counter()
+            status, _ = await client.request("POST", f"/api/answer?user={name}",
+                                             {"id": question["id"], "answer": rng.choice(question["options"])})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        errors.append(type(e).__name__)
+    finally:
+        client.close()
+
+
+async def health(host, port):
+    client = Client(host, port)
+    try:
+        _, data = await client.request("GET", "/api/health")
+        return data
+    finally:
+        client.close()
+
+
+async def run(host, port, users, rounds, concurrency):
+    latencies = array('d')
+    errors = []
+    limit = asyncio.Semaphore(concurrency)
+    rng = random.Random(0)
+
+    async def one(i):
+        async with limit:
+            await learner(host, port, f"load{i}", rounds, latencies, errors, rng)
+
+    before = await health(host, port)
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(users)))
+    elapsed = time.perf_counter() - start
+    after = await health(host, port)
+    return elapsed, latencies, errors, before, after
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(host, port, process, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("server exited")
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="çalışan sunucu (verilmezse geçici sunucu başlatılır)")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=20, help="öğrenci başına soru")
+    parser.add_argument("--concurrency", type=int, default=1_000, help="aynı anda açık bağlantı")
+    parser.add_argument("--cards", type=int, default=10_000)
+    args = parser.parse_args()
+
+    server = None
+    workdir = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        workdir = tempfile.TemporaryDirectory()
+        deck = os.path.join(workdir.name, "verbs.json")
+        with open(deck, "w", encoding="utf-8") as f:
+            json.dump(list(make_items(args.cards)), f)
+        host, port = "127.0.0.1", free_port()
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "server.py"), "--port", str(port), "--deck", deck,
+             "--progress-dir", os.path.join(workdir.name, "progress")],
+            stdout=subprocess.DEVNULL)
+        wait_for(host, port, server)
+
+    try:
+        elapsed, latencies, errors, before, after = asyncio.run(run(host, port, args.users, args.rounds, args.concurrency))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+            workdir.cleanup()
+
+    latencies = sorted(latencies)
+    count = len(latencies)
+    print(f"öğrenci={args.users} eşzamanlı={min(args.users, args.concurrency)} soru/öğrenci={args.rounds}")
+    print(f"istek           : {count} ({len(errors)} hata) {elapsed:.2f}s")
+    print(f"istek/sn        : {count / elapsed:,.0f}")
+    if count:
+        p50 = latencies[count // 2] * 1000
+        p99 = latencies[min(count - 1, int(count * 0.99))] * 1000
+        print(f"gecikme         : p50 {p50:.2f}ms  p99 {p99:.2f}ms  max {latencies[-1] * 1000:.2f}ms")
+    # Bellekte tutulan kullanıcılar (max_users üstü atılır) üzerinden RSS artışı
+    users = after["users"] - before["users"]
+    if before.get("rss_mb") is not None and after.get("rss_mb") is not None:
+        grown = after["rss_mb"] - before["rss_mb"]
+        per_user = f"  kullanıcı başına {grown * 1024 / users:.1f} KB" if users > 0 else ""
+        print(f"bellek (RSS)    : {before['rss_mb']:.1f} -> {after['rss_mb']:.1f} MB{per_user}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Başsız oyun simülasyonu: modellenmiş öğrenciler QuizSession üzerinden sentetik
+desteye cevap verir; saat sanaldır (günlük limit dolunca ertesi sabaha geçilir).
+
+Raporlanan değerler: saniyedeki soru sayısı, next_question gecikmesi (p50/p99,
+kart seçimi + şıklar), en yüksek bellek (RSS) ve cevap başına diske yazılan bayt.
+
+    python benchmarks/simulate.py [--cards 10000] [--learners 4] [--answers 200000]
+                                  [--mode game|web] [--backend json|sqlite] [--no-limits]
+
+game: her öğrencinin kendi destesi ve deposu (main.Game gibi),
+web:  paylaşılan deste + öğrenci başına seyrek katman ve günlük (streamlit_app gibi).
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_queue import CardQueue
+from card_store import CardStore, OverlayProgress
+from distractors import DistractorEngine
+from journal import ProgressJournal
+from review_log import ReviewLog
+from session import QuizSession
+from srs import NEW_PER_DAY, REVIEWS_PER_DAY, DailyBudget, DueForecast, SchedulePolicy
+from stats import DAY, day_start
+from storage import open_storage
+from synthetic import make_items
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class SimClock:
+    # Sanal saat; QuizSession.clock olarak verilir
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def next_morning(self):
+        self.now = day_start(self.now) + DAY + 9 * 3600
+
+
+class Learner:
+    # Basit unutma modeli: her kartın gizli bir zorluğu, öğrencinin her kart
+    # için bir hafıza gücü (gün) var; hatırlama olasılığı exp(-geçen / güç).
+    # Bilmediği soruda dört şıktan birini tahmin eder.
+    def __init__(self, session, clock, rng):
+        self.session = session
+        self.clock = clock
+        self.rng = rng
+        self.ability = rng.uniform(0.6, 0.95)
+        self.strength = {}
+        self.seen = {}
+
+    def knows(self, index):
+        difficulty = (index * 2654435761 % 1000) / 1000
+        strength = self.strength.get(index)
+        if strength is None:
+            return self.rng.random() < self.ability * (1 - difficulty) * 0.3
+        elapsed = (self.clock.now - self.seen[index]) / DAY
+        return self.rng.random() < self.ability * math.exp(-elapsed / strength)
+
+    def answer(self, question):
+        index = question.card.index
+        if self.knows(index):
+            choice = question.card.turkish
+        else:
+            choice = self.rng.choice(question.options)
+        self.clock.now += self.rng.uniform(2, 8)
+        correct = choice == question.card.turkish
+        strength = self.strength.get(index, 0.3)
+        self.strength[index] = strength * 2.5 if correct else max(0.3, strength * 0.6)
+        self.seen[index] = self.clock.now
+        return self.session.submit(choice)
+
+
+def io_written():
+    # Sürecin write() ile yazdığı toplam bayt (Linux); yoksa None
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bayt
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_budget(args):
+    if args.no_limits:
+        return DailyBudget(math.inf, math.inf)
+    return DailyBudget(NEW_PER_DAY, REVIEWS_PER_DAY)
+
+
+def game_learners(args, items, workdir, start):
+    # main.Game: öğrenci başına tam deste, depo ve cevap günlüğü
+    ext = ".db" if args.backend == "sqlite" else ".json"
+    learners = []
+    for i in range(args.learners):
+        deck = CardStore.from_dicts(items)
+        deck.queue = CardQueue(deck.queue_items(), now=start)
+        deck.policy = SchedulePolicy(DueForecast(deck.progress.next_review))
+        storage = open_storage(os.path.join(workdir, f"learner{i}{ext}"))
+        storage.save_all(items)
+
+        def save(card, storage=storage, deck=deck):
+            storage.save_progress([card.progress_dict()])
+            if storage.needs_compaction:
+                storage.save_all([c.to_dict() for c in deck])
+
+        clock = SimClock(start)
+        reviews = ReviewLog(os.path.join(workdir, f"learner{i}.reviews.bin"))
+        session = QuizSession(deck, DistractorEngine(deck.vocab), make_budget(args), reviews,
+                              save=save, clock=clock, rng=random.Random(i))
+        learners.append(Learner(session, clock, random.Random(1000 + i)))
+    return learners
+
+
+def web_learners(args, items, workdir, start):
+    # streamlit_app: paylaşılan kelimeler, öğrenci başına OverlayProgress + günlük
+    base = CardStore.from_dicts(items)
+    distractors = DistractorEngine(base.vocab)
+    learners = []
+    for i in range(args.learners):
+        deck = CardStore(base.vocab, OverlayProgress(base.progress))
+        deck.queue = CardQueue(deck.queue_items(), now=start)
+        deck.policy = SchedulePolicy(DueForecast(deck.progress.next_review))
+        journal = ProgressJournal(os.path.join(workdir, f"learner{i}.jsonl"))
+
+        def save(card, journal=journal, deck=deck):
+            journal.append(card.progress_dict())
+            if journal.count > max(100, 4 * len(deck.progress.changes)):
+                journal.rewrite([deck[i].progress_dict() for i in deck.progress.changes])
+
+        clock = SimClock(start)
+        reviews = ReviewLog(os.path.join(workdir, f"learner{i}.reviews.bin"))
+        session = QuizSession(deck, distractors, make_budget(args), reviews,
+                              save=save, clock=clock, rng=random.Random(i))
+        learners.append(Learner(session, clock, random.Random(1000 + i)))
+    return learners
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--learners", type=int, default=4)
+    parser.add_argument("--answers", type=int, default=200_000, help="toplam cevap (tüm öğrenciler)")
+    parser.add_argument("--mode", choices=["game", "web"], default="game")
+    parser.add_argument("--backend", choices=["json", "sqlite"], default="json", help="game modunda depo")
+    parser.add_argument("--no-limits", action="store_true", help="günlük yeni/tekrar limitlerini kapat")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    items = list(make_items(args.cards, args.seed))
+    start = day_start(time.time()) + 9 * 3600
+
+    with tempfile.TemporaryDirectory() as workdir:
+        setup_start = time.perf_counter()
+        build = game_learners if args.mode == "game" else web_learners
+        learners = build(args, items, workdir, start)
+        setup = time.perf_counter() - setup_start
+
+        latencies = array('d')
+        correct = 0
+        days = 0
+        written_before = io_written()
+        run_start = time.perf_counter()
+        answers = 0
+        while answers < args.answers:
+            learner = learners[answers % len(learners)]
+            t0 = time.perf_counter()
+            question = learner.session.next_question()
+            latencies.append(time.perf_counter() - t0)
+            if question is None:
+                # Bugünlük limit doldu ya da vadesi gelen kart yok
+                learner.clock.next_morning()
+                days += 1
+                continue
+            correct += learner.answer(question)["correct"]
+            answers += 1
+        elapsed = time.perf_counter() - run_start
+        written_after = io_written()
+
+        for learner in learners:
+            learner.session.reviews.close()
+
+    latencies = sorted(latencies)
+    print(f"mod={args.mode} depo={args.backend if args.mode == 'game' else 'journal'} "
+          f"kart={args.cards} öğrenci={args.learners} kurulum={setup:.2f}s")
+    print(f"cevap           : {answers} ({correct / answers * 100:.1f}% doğru, {days} gün geçişi)")
+    print(f"soru/sn         : {answers / elapsed:,.0f}")
+    print(f"next_question   : p50 {percentile(latencies, 0.5) * 1e6:.1f}µs  "
+          f"p99 {percentile(latencies, 0.99) * 1e6:.1f}µs")
+    rss = peak_rss_mb()
+    print(f"en yüksek RSS   : {rss:.1f} MB" if rss is not None else "en yüksek RSS   : n/a")
+    if written_before is not None:
+        print(f"yazılan/cevap   : {(written_after - written_before) / answers:,.0f} bayt")
+    else:
+        print("yazılan/cevap   : n/a")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import random
+
+CATEGORIES = ["Fitness", "Daily Conversation", "Work", "Travel", "Emotions", "General"]
+
+
+def make_items(count, seed=0):
+    # verbs.json biçiminde sentetik kartlar (her çağrıda yeni string nesneleri)
+    rng = random.Random(seed)
+    for i in range(1, count + 1):
+        verb = f"verb{i}"
+        yield {
+            "id": i,
+            "verb": verb,
+            "turkish": f"anlam{i}mak",
+            "sentence": f"I {verb} every day before {rng.randrange(1000)} o'clock.",
+            "category": rng.choice(CATEGORIES),
+            "weight": 100,
+            "correct_count": 0,
+        }
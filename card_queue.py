@@ -0,0 +1,505 @@
+import contextlib
+import heapq
+import random
+import time
+from array import array
+
+# Yeni kartlar destedeki sıralarına göre ilk N kart içinden seçilir
+NEW_CARD_WINDOW = 10
+
+
+class FenwickTree:
+    # Ağırlıklı rastgele seçim için ikili indeksli ağaç (Fenwick).
+    # Güncelleme, toplam ve ağırlığa göre arama O(log n).
+    def __init__(self, values=()):
+        self.values = array('d', values)
+        self._tree = array('d', [0.0]) * (len(self.values) + 1)
+        self._rebuild()
+
+    def __len__(self):
+        return len(self.values)
+
+    def _rebuild(self):
+        n = len(self.values)
+        tree = array('d', [0.0]) * (n + 1)
+        for i in range(1, n + 1):
+            tree[i] += self.values[i - 1]
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << n.bit_length() if n else 0
+
+    def copy(self):
+        clone = FenwickTree.__new__(FenwickTree)
+        clone.values = array('d', self.values)
+        clone._tree = array('d', self._tree)
+        clone._top = self._top
+        return clone
+
+    def prefix(self, count):
+        # İlk `count` değerin toplamı
+        total = 0.0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def total(self):
+        return self.prefix(len(self.values))
+
+    def append(self, value):
+        self.values.append(value)
+        i = len(self.values)
+        # Yeni düğüm (i - lowbit(i), i] aralığını kapsar
+        low = i - (i & -i)
+        self._tree.append(value + self.prefix(i - 1) - self.prefix(low))
+        if i >= self._top:
+            self._top = 1 << i.bit_length()
+
+    def set(self, index, value):
+        delta = value - self.values[index]
+        if delta == 0:
+            return
+        self.values[index] = value
+        i = index + 1
+        n = len(self.values)
+        while i <= n:
+            self._tree[i] += delta
+            i += i & -i
+
+    def find(self, target):
+        # Önek toplamı `target` değerini aşan ilk indeks
+        pos = 0
+        step = self._top
+        n = len(self.values)
+        while step:
+            nxt = pos + step
+            if nxt <= n and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return pos
+
+    def sample(self):
+        # Değerlerle orantılı rastgele indeks; toplam sıfırsa None
+        for _ in range(2):
+            total = self.total()
+            if total <= 0:
+                return None
+            index = self.find(random.random() * total)
+            if index < len(self.values) and self.values[index] > 0:
+                return index
+            # Kayan nokta birikimi: ağacı yeniden kur ve tekrar dene
+            self._rebuild()
+        return None
+
+
+class CardQueue:
+    # Kart seçim kuyruğu. Kartlar destedeki konumlarıyla (0..n-1) tutulur.
+    # Öncelik sırası select_next_card ile aynıdır:
+    #   1. Vakti gelmiş kartlar (ağırlığa göre)
+    #   2. Yeni kartlar (ilk NEW_CARD_WINDOW içinden)
+    #   3. Tüm deste (ağırlığa göre)
+    # next_review için min-heap, vakti gelmiş / yeni / planlanmış / hiç
+    # görülmemiş kartlar için Fenwick ağaçları kullanılır; her işlem O(log n).
+    # Hiç planlanmamış (next_review == 0) kartlar planlanmışlardan ayrı
+    # ağaçlarda tutulur: günlük yeni kart limiti dolunca hiçbir öncelikte
+    # seçilmezler, tekrar limiti dolunca da planlanmış kartlar seçilmez.
+    def __init__(self, cards=(), now=None):
+        if now is None:
+            now = time.time()
+        # Sütunlar tek geçişte toplanır, ağaçlar O(n) kurulur (kart kart
+        # eklemek O(n log n); sunucuda her kullanıcı için bir kuyruk kurulur)
+        self._next_review = array('d')
+        self._is_due = bytearray()
+        self._heap = []
+        scheduled = array('d')
+        due = array('d')
+        fresh = array('d')
+        new = array('d')
+        for position, (next_review, correct_count, weight) in enumerate(cards):
+            self._next_review.append(next_review)
+            unscheduled = next_review <= 0
+            scheduled.append(0.0 if unscheduled else weight)
+            new.append(1.0 if unscheduled and correct_count == 0 else 0.0)
+            fresh.append(weight if unscheduled else 0.0)
+            if next_review <= now:
+                self._is_due.append(1)
+                due.append(0.0 if unscheduled else weight)
+            else:
+                self._is_due.append(0)
+                due.append(0.0)
+                self._heap.append((next_review, position))
+        heapq.heapify(self._heap)
+        self._due = FenwickTree(due)
+        self._fresh = FenwickTree(fresh)
+        self._scheduled = FenwickTree(scheduled)
+        self._new = FenwickTree(new)
+        # Ağaç değerleri her değiştiğinde artar (OverlayQueue önbelleği için)
+        self.version = 0
+
+    def __len__(self):
+        return len(self._next_review)
+
+    def copy(self):
+        # Sütun kopyası (bellek kopyası); paylaşılan kuyruk yerine bağımsız
+        # bir kuyruk gerektiğinde (OverlayQueue ile karşılaştırma testleri)
+        clone = CardQueue.__new__(CardQueue)
+        clone._next_review = array('d', self._next_review)
+        clone._is_due = bytearray(self._is_due)
+        clone._heap = list(self._heap)
+        clone._due = self._due.copy()
+        clone._fresh = self._fresh.copy()
+        clone._scheduled = self._scheduled.copy()
+        clone._new = self._new.copy()
+        clone.version = self.version
+        return clone
+
+    def add(self, next_review, correct_count, weight, now=None):
+        if now is None:
+            now = time.time()
+        self.version += 1
+        position = len(self._next_review)
+        self._next_review.append(next_review)
+        fresh = next_review <= 0
+        self._scheduled.append(0.0 if fresh else weight)
+        self._new.append(1.0 if fresh and correct_count == 0 else 0.0)
+        self._fresh.append(weight if fresh else 0.0)
+        if next_review <= now:
+            self._is_due.append(1)
+            self._due.append(0.0 if fresh else weight)
+        else:
+            self._is_due.append(0)
+            self._due.append(0.0)
+            heapq.heappush(self._heap, (next_review, position))
+        return position
+
+    def update(self, position, next_review, correct_count, weight, now=None):
+        if now is None:
+            now = time.time()
+        self.version += 1
+        self._next_review[position] = next_review
+        fresh = next_review <= 0
+        self._scheduled.set(position, 0.0 if fresh else weight)
+        self._new.set(position, 1.0 if fresh and correct_count == 0 else 0.0)
+        self._fresh.set(position, weight if fresh else 0.0)
+        if next_review <= now:
+            self._is_due[position] = 1
+            self._due.set(position, 0.0 if fresh else weight)
+        else:
+            self._is_due[position] = 0
+            self._due.set(position, 0.0)
+            heapq.heappush(self._heap, (next_review, position))
+            if len(self._heap) > 2 * len(self._next_review) + 64:
+                self._compact_heap()
+
+    def _compact_heap(self):
+        # Eskimiş heap girdilerini temizle
+        self._heap = [(self._next_review[pos], pos)
+                      for pos in range(len(self._next_review))
+                      if not self._is_due[pos]]
+        heapq.heapify(self._heap)
+
+    def _promote_due(self, now):
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            next_review, position = heapq.heappop(heap)
+            # Kart sonradan güncellendiyse bu girdi eskimiştir
+            if self._is_due[position] or self._next_review[position] != next_review:
+                continue
+            self._is_due[position] = 1
+            self._due.set(position, self._scheduled.values[position])
+            self.version += 1
+
+    def due_weight(self, now=None, allow_new=True, allow_review=True):
+        # 1. öncelikteki (vakti gelmiş + hiç görülmemiş) kartların toplam ağırlığı
+        if not self._next_review:
+            return 0.0
+        self._promote_due(time.time() if now is None else now)
+        return ((self._due.total() if allow_review else 0.0)
+                + (self._fresh.total() if allow_new else 0.0))
+
+    def select(self, now=None, allow_new=True, allow_review=True):
+        # allow_new / allow_review: günlük limitler (srs.DailyBudget)
+        if not self._next_review:
+            return None
+        self._promote_due(time.time() if now is None else now)
+
+        # 1. Öncelik: Vakti gelmiş kartlar (hiç görülmemişler dahil)
+        due_total = self._due.total() if allow_review else 0.0
+        fresh_total = self._fresh.total() if allow_new else 0.0
+        if due_total + fresh_total > 0:
+            if random.random() * (due_total + fresh_total) < due_total:
+                position = self._due.sample()
+            else:
+                position = self._fresh.sample()
+            if position is not None:
+                return position
+
+        # 2. Öncelik: Yeni (hiç planlanmamış) kartlar, küçük gruplar halinde
+        new_total = int(round(self._new.total())) if allow_new else 0
+        if new_total > 0:
+            k = random.randrange(min(new_total, NEW_CARD_WINDOW))
+            position = self._new.find(k + 0.5)
+            if position < len(self._next_review):
+                return position
+
+        # 3. Öncelik: Ağırlıklı rastgele; yeni kart limiti dolduysa sadece
+        # planlanmış kartlar, tekrar limiti dolduysa sadece yeniler arasından
+        scheduled_total = self._scheduled.total() if allow_review else 0.0
+        fresh_total = self._fresh.total() if allow_new else 0.0
+        if scheduled_total + fresh_total <= 0:
+            return None
+        if random.random() * (scheduled_total + fresh_total) < scheduled_total:
+            return self._scheduled.sample()
+        return self._fresh.sample()
+
+
+class OverlayQueue:
+    # Paylaşılan (sunucuda herkesin ortak) CardQueue üzerine kullanıcıya özel
+    # seyrek katman (card_store.OverlayProgress gibi): kullanıcının değiştirdiği
+    # kartlar küçük bir yerel CardQueue'da tutulur, temel kuyrukta "maskeli"
+    # sayılır. Seçim temel ağaçlardan maskeli kartları dışlayarak (ret
+    # örneklemesi) ve yerel kuyruktan ağırlıkla orantılı yapılır; bellek deste
+    # boyutuyla değil çalışılan kart sayısıyla büyür. Temel kuyruğa sadece
+    # zamana bağlı (herkes için aynı) vade terfisi yazılır; katmanlar farklı
+    # iş parçacıklarındaysa (Streamlit oturumları) ortak bir `lock` verilir,
+    # terfi ve seçim onun altında yapılır.
+    # Öncelik sırası ve günlük limitler CardQueue.select ile aynıdır.
+    def __init__(self, base, now=None, lock=None):
+        self.base = base
+        self.lock = contextlib.nullcontext() if lock is None else lock
+        self.local = CardQueue(now=now)
+        self.slots = {}             # deste konumu -> yerel konum
+        self.positions = array('q') # yerel konum -> deste konumu
+        self._masked = None         # temel ağaçlarda maskeli kartların toplamı
+        self._masked_key = None
+
+    def __len__(self):
+        return len(self.base)
+
+    def add(self, next_review, correct_count, weight, now=None):
+        raise TypeError("OverlayQueue paylaşılan desteye kart ekleyemez")
+
+    def update(self, position, next_review, correct_count, weight, now=None):
+        slot = self.slots.get(position)
+        if slot is None:
+            self.slots[position] = self.local.add(next_review, correct_count, weight, now=now)
+            self.positions.append(position)
+        else:
+            self.local.update(slot, next_review, correct_count, weight, now=now)
+
+    def _masked_totals(self):
+        # Temel kuyruk sadece vade terfisinde değişir; toplamlar o zaman ya da
+        # yeni kart maskelenince yeniden hesaplanır (O(değişen kart))
+        key = (self.base.version, len(self.slots))
+        if self._masked_key != key:
+            base = self.base
+            self._masked = {tree: sum(getattr(base, tree).values[p] for p in self.slots)
+                            for tree in ("_due", "_fresh", "_scheduled")}
+            self._masked_key = key
+        return self._masked
+
+    def _sample_base(self, tree, available):
+        # Maskeli kartlar reddedilir; neredeyse tüm ağırlık maskeliyse tarama
+        for _ in range(64):
+            position = tree.sample()
+            if position is None:
+                return None
+            if position not in self.slots:
+                return position
+        target = random.random() * available
+        for position, value in enumerate(tree.values):
+            if value > 0 and position not in self.slots:
+                target -= value
+                if target < 0:
+                    return position
+        return None
+
+    def _pick(self, trees):
+        # trees: ("_due" / "_fresh" / "_scheduled"); temel + yerel ağaçlardan
+        # toplam ağırlıkla orantılı seçim
+        masked = self._masked_totals()
+        parts = []
+        for name in trees:
+            base_total = getattr(self.base, name).total()
+            available = base_total - masked[name]
+            # Çıkarmadan kalan kayan nokta artığı seçilmesin
+            if available > base_total * 1e-9:
+                parts.append((available, name, True))
+            local = getattr(self.local, name).total()
+            if local > 0:
+                parts.append((local, name, False))
+        total = sum(part[0] for part in parts)
+        if total <= 0:
+            return None
+        target = random.random() * total
+        for weight, name, shared in parts:
+            target -= weight
+            if target < 0:
+                break
+        if shared:
+            return self._sample_base(getattr(self.base, name), weight)
+        slot = getattr(self.local, name).sample()
+        return None if slot is None else self.positions[slot]
+
+    def _promote(self, now):
+        self.base._promote_due(now)
+        self.local._promote_due(now)
+
+    def due_weight(self, now=None, allow_new=True, allow_review=True):
+        with self.lock:
+            return self._due_weight(time.time() if now is None else now, allow_new, allow_review)
+
+    def _due_weight(self, now, allow_new, allow_review):
+        self._promote(now)
+        masked = self._masked_totals()
+        total = 0.0
+        for name, allowed in (("_due", allow_review), ("_fresh", allow_new)):
+            if allowed:
+                total += (getattr(self.base, name).total() - masked[name]
+                          + getattr(self.local, name).total())
+        return max(total, 0.0)
+
+    def _new_window(self):
+        # Destedeki sırasıyla ilk NEW_CARD_WINDOW yeni kart (maskeliler hariç)
+        base_new = self.base._new
+        window = []
+        count = int(round(base_new.total()))
+        k = 0
+        while k < count and len(window) < NEW_CARD_WINDOW:
+            position = base_new.find(k + 0.5)
+            if position >= len(self.base):
+                break
+            if position not in self.slots:
+                window.append(position)
+            k += 1
+        local_new = self.local._new.values
+        window += [self.positions[slot] for slot in range(len(local_new)) if local_new[slot] > 0]
+        window.sort()
+        return window[:NEW_CARD_WINDOW]
+
+    def select(self, now=None, allow_new=True, allow_review=True):
+        if not len(self.base):
+            return None
+        with self.lock:
+            return self._select(time.time() if now is None else now, allow_new, allow_review)
+
+    def _select(self, now, allow_new, allow_review):
+        self._promote(now)
+
+        # 1. Vakti gelmiş kartlar (hiç görülmemişler dahil)
+        trees = (("_due",) if allow_review else ()) + (("_fresh",) if allow_new else ())
+        position = self._pick(trees) if trees else None
+        if position is not None:
+            return position
+
+        # 2. Yeni (hiç planlanmamış) kartlar, küçük gruplar halinde
+        if allow_new:
+            window = self._new_window()
+            if window:
+                return random.choice(window)
+
+        # 3. Ağırlıklı rastgele (limitlere uyan gruplar)
+        trees = (("_scheduled",) if allow_review else ()) + (("_fresh",) if allow_new else ())
+        return self._pick(trees) if trees else None
+
+
+class CategoryQueue:
+    # Kategoriye göre daraltılmış oturumlar için CardQueue sarmalayıcısı.
+    # Tüm deste kuyruğunun (base) yanında her kategori için ayrı bir CardQueue
+    # (kendi due heap'i ve Fenwick ağaçları) tutulur; seçim sadece oturumdaki
+    # kategorilerin kuyruklarına bakar, tüm desteyi filtrelemez.
+    # CardQueue ile aynı arayüz (add / update / select), CardStore.queue olabilir.
+    #   scope: None = tüm deste, yoksa {kategori: kota}; kota o kategoriden
+    #   sorulacak soru sayısıdır (None = sınırsız).
+    def __init__(self, base, progress, categories, now=None):
+        if now is None:
+            now = time.time()
+        self.base = base
+        # Deste sütunu (Vocabulary.categories); yeni kartların kategorisi buradan
+        self.categories = categories
+        self.members = {}           # kategori -> array('q') deste konumları
+        self.local = array('q')     # deste konumu -> kategori içindeki konum
+        for position, category in enumerate(categories):
+            members = self.members.get(category)
+            if members is None:
+                members = self.members[category] = array('q')
+            self.local.append(len(members))
+            members.append(position)
+        self.queues = {
+            category: CardQueue(((progress.next_review[p], progress.correct_count[p], progress.weight[p])
+                                 for p in members), now=now)
+            for category, members in self.members.items()
+        }
+        self.scope = None
+        self.served = {}
+
+    def __len__(self):
+        return len(self.base)
+
+    def set_scope(self, scope):
+        # scope: None, kategori listesi ya da {kategori: kota}
+        if scope is not None and not isinstance(scope, dict):
+            scope = dict.fromkeys(scope)
+        self.scope = scope or None
+        self.served = dict.fromkeys(self.scope, 0) if self.scope else {}
+
+    @property
+    def finished(self):
+        # Tüm kategorilerin kotası doldu mu
+        return bool(self.scope) and all(
+            quota is not None and self.served[category] >= quota
+            for category, quota in self.scope.items())
+
+    def add(self, next_review, correct_count, weight, now=None):
+        position = self.base.add(next_review, correct_count, weight, now=now)
+        category = self.categories[position]
+        members = self.members.get(category)
+        if members is None:
+            members = self.members[category] = array('q')
+            self.queues[category] = CardQueue()
+        self.local.append(len(members))
+        members.append(position)
+        self.queues[category].add(next_review, correct_count, weight, now=now)
+        return position
+
+    def update(self, position, next_review, correct_count, weight, now=None):
+        self.base.update(position, next_review, correct_count, weight, now=now)
+        self.queues[self.categories[position]].update(
+            self.local[position], next_review, correct_count, weight, now=now)
+
+    def release(self, position):
+        # select'in saydığı ama sorulmadan atılan kart (session.SessionPlanner)
+        category = self.categories[position]
+        if self.scope and self.served.get(category):
+            self.served[category] -= 1
+
+    def select(self, now=None, allow_new=True, allow_review=True):
+        if self.scope is None:
+            return self.base.select(now, allow_new, allow_review)
+        if now is None:
+            now = time.time()
+        open_categories = [category for category, quota in self.scope.items()
+                           if category in self.queues and (quota is None or self.served[category] < quota)]
+        # Vakti gelmiş kartı olan kategoriler önce; kotalı oturumda en geride
+        # kalan kategori (sorulan / kota), kotasızda vade ağırlığına göre
+        due = {category: self.queues[category].due_weight(now, allow_new, allow_review)
+               for category in open_categories}
+        quotas_set = any(self.scope[category] is not None for category in open_categories)
+        if quotas_set:
+            order = sorted(open_categories, key=lambda category: (
+                due[category] <= 0, self.served[category] / (self.scope[category] or 1), random.random()))
+        else:
+            # Ağırlıklı rastgele sıralama (u^(1/w)): ilk kategori vade
+            # ağırlığıyla orantılı seçilir, tüm deste kuyruğundaki gibi
+            order = sorted(open_categories, key=lambda category: (
+                due[category] <= 0,
+                -random.random() ** (1 / due[category]) if due[category] > 0 else random.random()))
+        for category in order:
+            local = self.queues[category].select(now, allow_new, allow_review)
+            if local is not None:
+                self.served[category] += 1
+                return self.members[category][local]
+        return None
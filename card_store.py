@@ -0,0 +1,297 @@
+import sys
+import time
+from array import array
+
+from deck_index import DeckIndex
+from srs import DEFAULT_EASE, SchedulePolicy
+
+DEFAULT_CATEGORY = "General"
+DEFAULT_WEIGHT = 100
+
+# Öğrenme ilerlemesi alanları (kelime içeriği deste dosyasında kalır)
+# ease/stability: SRS algoritmasının kart durumu (bkz. srs.py)
+PROGRESS_FIELDS = ("correct_count", "weight", "last_reviewed", "next_review", "ease", "stability")
+
+
+class Vocabulary:
+    # Kelime içeriği (verb, turkish, sentence, category) sütunlar halinde.
+    # Yüklendikten sonra kayıtlar değişmez, sadece sona ekleme yapılır;
+    # bu yüzden tek bir nesne tüm oturumlar arasında paylaşılabilir.
+    # `deck_index` (DeckIndex) id/fiil/kategori aramalarını O(1) yapar; ilk
+    # erişimde kurulur (açılışta, özellikle snapshot'tan yüklerken gerekmez).
+    __slots__ = ("ids", "verbs", "turkish", "sentences", "categories", "_deck_index")
+
+    def __init__(self, items=()):
+        self.ids = array('q')
+        self.verbs = []
+        self.turkish = []
+        self.sentences = []
+        self.categories = []
+        self._deck_index = None
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def deck_index(self):
+        if self._deck_index is None:
+            self._deck_index = DeckIndex.from_columns(self.ids, self.verbs, self.categories)
+        return self._deck_index
+
+    def append(self, data):
+        self.ids.append(data["id"])
+        self.verbs.append(data["verb"])
+        self.turkish.append(data["turkish"])
+        self.sentences.append(data["sentence"])
+        # Kategori sayısı az, aynı string nesnesini paylaş
+        category = sys.intern(data.get("category", DEFAULT_CATEGORY))
+        self.categories.append(category)
+        position = len(self.ids) - 1
+        if self._deck_index is not None:
+            self._deck_index.add(data["id"], data["verb"], category, position)
+        return position
+
+
+class Progress:
+    # Öğrenciye özel sayısal ilerleme, her alan için tek bir array sütunu
+    __slots__ = PROGRESS_FIELDS
+
+    def __init__(self, items=()):
+        self.correct_count = array('q')
+        self.weight = array('d')
+        self.last_reviewed = array('d')
+        self.next_review = array('d')
+        self.ease = array('d')
+        self.stability = array('d')
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return len(self.correct_count)
+
+    def append(self, data):
+        self.correct_count.append(data.get("correct_count", 0))
+        self.weight.append(data.get("weight", DEFAULT_WEIGHT))
+        self.last_reviewed.append(data.get("last_reviewed", 0))
+        self.next_review.append(data.get("next_review", 0))
+        self.ease.append(data.get("ease", DEFAULT_EASE))
+        self.stability.append(data.get("stability", 0))
+        return len(self.correct_count) - 1
+
+    def copy(self):
+        # Sütun kopyası (array kopyalama tek bir bellek kopyasıdır)
+        clone = Progress()
+        for field in PROGRESS_FIELDS:
+            setattr(clone, field, array(getattr(self, field).typecode, getattr(self, field)))
+        return clone
+
+
+class _OverlayColumn:
+    # Temel sütun + değişen kartlar; Progress sütunu gibi indekslenir
+    __slots__ = ("field", "base", "changes")
+
+    def __init__(self, field, base, changes):
+        self.field = field
+        self.base = base
+        self.changes = changes
+
+    def __len__(self):
+        return len(self.base)
+
+    def __getitem__(self, index):
+        record = self.changes.get(index)
+        if record is not None and self.field in record:
+            return record[self.field]
+        return self.base[index]
+
+    def __setitem__(self, index, value):
+        self.changes.setdefault(index, {})[self.field] = value
+
+    def __iter__(self):
+        changes = self.changes
+        field = self.field
+        for index, value in enumerate(self.base):
+            record = changes.get(index)
+            if record is not None and field in record:
+                value = record[field]
+            yield value
+
+
+class OverlayProgress:
+    # Paylaşılan (salt okunur) temel Progress üzerine seyrek bir katman.
+    # Sadece değişen kartlar `changes` içinde tutulur (index -> {alan: değer}),
+    # böylece oturum belleği deste boyutuyla değil çalışılan kart sayısıyla büyür.
+    __slots__ = PROGRESS_FIELDS + ("base", "changes")
+
+    def __init__(self, base):
+        self.base = base
+        self.changes = {}
+        for field in PROGRESS_FIELDS:
+            setattr(self, field, _OverlayColumn(field, getattr(base, field), self.changes))
+
+    def __len__(self):
+        return len(self.base)
+
+    def append(self, data):
+        raise TypeError("OverlayProgress paylaşılan desteye kart ekleyemez")
+
+
+def _number(value):
+    # array('d') tam sayıları 100.0 olarak döndürür; JSON çıktısı değişmesin
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+
+def _vocab_field(column):
+    def get(self):
+        return getattr(self.store.vocab, column)[self.index]
+    return property(get)
+
+
+def _progress_field(column):
+    def get(self):
+        return getattr(self.store.progress, column)[self.index]
+
+    def set(self, value):
+        getattr(self.store.progress, column)[self.index] = value
+    return property(get, set)
+
+
+class VerbCard:
+    # Destedeki tek bir karta hafif bir görünüm (store + index).
+    # Veriler CardStore sütunlarında durur, kart nesnesi erişimde oluşturulur.
+    __slots__ = ("store", "index")
+
+    id = _vocab_field("ids")
+    verb = _vocab_field("verbs")
+    turkish = _vocab_field("turkish")
+    sentence = _vocab_field("sentences")
+    category = _vocab_field("categories")
+    weight = _progress_field("weight")
+    correct_count = _progress_field("correct_count")
+    last_reviewed = _progress_field("last_reviewed")
+    next_review = _progress_field("next_review")
+    ease = _progress_field("ease")
+    stability = _progress_field("stability")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, VerbCard) and self.store is other.store and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "verb": self.verb,
+            "turkish": self.turkish,
+            "sentence": self.sentence,
+            "category": self.category,
+            "weight": _number(self.weight),
+            "correct_count": self.correct_count,
+            "last_reviewed": _number(self.last_reviewed),
+            "next_review": _number(self.next_review),
+            "ease": _number(self.ease),
+            "stability": _number(self.stability)
+        }
+
+    def progress_dict(self):
+        record = {"id": self.id}
+        for field in PROGRESS_FIELDS:
+            record[field] = getattr(self, field)
+        return record
+
+    def apply_progress(self, record):
+        for field in PROGRESS_FIELDS:
+            if field in record:
+                setattr(self, field, record[field])
+
+    def update_weight(self, is_correct, now=None):
+        now = time.time() if now is None else now
+
+        if is_correct:
+            self.correct_count += 1
+            # Ağırlığı düşür (daha az çıksın)
+            self.weight = max(1, self.weight * 0.5)
+        else:
+            # Yanlışsa hemen tekrar sor
+            self.correct_count = 0
+            self.weight = 100 # Ağırlığı sıfırla/artır
+
+        # Yeni vade seçili algoritmadan (heuristic/SM-2/FSRS); üst sınır, fuzz
+        # ve yük dengeleme srs.py'de. Geçen süre için eski last_reviewed gerekir.
+        self.next_review = self.store.policy.review(self, is_correct, now)
+        self.last_reviewed = now
+
+        # Seçim kuyruğunu güncel tut
+        self.store.sync(self.index, now)
+
+
+class CardStore:
+    # Paylaşılan Vocabulary + öğrenciye özel Progress. Sıralı bir dizi gibi
+    # davranır: store[i] bir VerbCard görünümü döndürür.
+    __slots__ = ("vocab", "progress", "queue", "policy")
+
+    def __init__(self, vocab=None, progress=None):
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self.progress = progress if progress is not None else Progress()
+        # İsteğe bağlı seçim kuyruğu (card_queue.CardQueue)
+        self.queue = None
+        # Aralık politikası (srs.SchedulePolicy); yük dengeleme için
+        # Game/oturum bunu destenin vade tahminiyle değiştirir
+        self.policy = SchedulePolicy()
+
+    @classmethod
+    def from_dicts(cls, items):
+        store = cls()
+        for item in items:
+            store.vocab.append(item)
+            store.progress.append(item)
+        return store
+
+    def __len__(self):
+        return len(self.vocab)
+
+    @property
+    def deck_index(self):
+        return self.vocab.deck_index
+
+    def by_id(self, card_id):
+        position = self.vocab.deck_index.position(card_id)
+        return None if position is None else VerbCard(self, position)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.vocab)
+        if not 0 <= index < len(self.vocab):
+            raise IndexError(index)
+        return VerbCard(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.vocab)):
+            yield VerbCard(self, index)
+
+    def append(self, data):
+        index = self.vocab.append(data)
+        self.progress.append(data)
+        if self.queue is not None:
+            self.queue.add(self.progress.next_review[index],
+                           self.progress.correct_count[index],
+                           self.progress.weight[index])
+        return VerbCard(self, index)
+
+    def queue_items(self):
+        # CardQueue için (next_review, correct_count, weight) üçlüleri
+        progress = self.progress
+        return zip(progress.next_review, progress.correct_count, progress.weight)
+
+    def sync(self, index, now=None):
+        if self.queue is not None:
+            progress = self.progress
+            self.queue.update(index, progress.next_review[index],
+                              progress.correct_count[index], progress.weight[index], now=now)
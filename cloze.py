@@ -0,0 +1,274 @@
+import random
+import re
+from array import array
+
+# Boşluk doldurma sorusunda fiilin yerine konan işaret
+BLANK = "_____"
+# Düzensiz fiiller: yalın hal -> (geçmiş zaman, geçmiş ortaç)
+IRREGULAR = {
+    verb: tuple(forms.split("/")) for verb, forms in (entry.split("=") for entry in """
+    arise=arose/arisen awake=awoke/awoken be=was/been bear=bore/born beat=beat/beaten
+    become=became/become begin=began/begun bend=bent/bent bet=bet/bet bind=bound/bound
+    bite=bit/bitten bleed=bled/bled blow=blew/blown break=broke/broken breed=bred/bred
+    bring=brought/brought build=built/built burn=burnt/burnt burst=burst/burst buy=bought/bought
+    cast=cast/cast catch=caught/caught choose=chose/chosen cling=clung/clung come=came/come
+    cost=cost/cost creep=crept/crept cut=cut/cut deal=dealt/dealt dig=dug/dug do=did/done
+    draw=drew/drawn dream=dreamt/dreamt drink=drank/drunk drive=drove/driven dwell=dwelt/dwelt
+    eat=ate/eaten fall=fell/fallen feed=fed/fed feel=felt/felt fight=fought/fought
+    find=found/found flee=fled/fled fling=flung/flung fly=flew/flown forbid=forbade/forbidden
+    foresee=foresaw/foreseen forget=forgot/forgotten forgive=forgave/forgiven
+    freeze=froze/frozen get=got/gotten give=gave/given go=went/gone grind=ground/ground
+    grow=grew/grown hang=hung/hung have=had/had hear=heard/heard hide=hid/hidden hit=hit/hit
+    hold=held/held hurt=hurt/hurt keep=kept/kept kneel=knelt/knelt knit=knit/knit
+    know=knew/known lay=laid/laid lead=led/led lean=leant/leant leap=leapt/leapt
+    learn=learnt/learnt leave=left/left lend=lent/lent let=let/let lie=lay/lain light=lit/lit
+    lose=lost/lost make=made/made mean=meant/meant meet=met/met mow=mowed/mown
+    overcome=overcame/overcome pay=paid/paid prove=proved/proven put=put/put quit=quit/quit
+    read=read/read ride=rode/ridden ring=rang/rung rise=rose/risen run=ran/run saw=sawed/sawn
+    say=said/said see=saw/seen seek=sought/sought sell=sold/sold send=sent/sent set=set/set
+    sew=sewed/sewn shake=shook/shaken shear=sheared/shorn shed=shed/shed shine=shone/shone
+    shoot=shot/shot show=showed/shown shrink=shrank/shrunk shut=shut/shut sing=sang/sung
+    sink=sank/sunk sit=sat/sat slay=slew/slain sleep=slept/slept slide=slid/slid
+    sling=slung/slung slit=slit/slit sow=sowed/sown speak=spoke/spoken speed=sped/sped
+    spend=spent/spent spill=spilt/spilt spin=spun/spun spit=spat/spat split=split/split
+    spread=spread/spread spring=sprang/sprung stand=stood/stood steal=stole/stolen
+    stick=stuck/stuck sting=stung/stung stink=stank/stunk stride=strode/stridden
+    strike=struck/struck string=strung/strung strive=strove/striven swear=swore/sworn
+    sweep=swept/swept swell=swelled/swollen swim=swam/swum swing=swung/swung take=took/taken
+    teach=taught/taught tear=tore/torn tell=told/told think=thought/thought throw=threw/thrown
+    thrust=thrust/thrust tread=trod/trodden undergo=underwent/undergone
+    understand=understood/understood undertake=undertook/undertaken upset=upset/upset
+    wake=woke/woken wear=wore/worn weave=wove/woven weep=wept/wept wet=wet/wet win=won/won
+    wind=wound/wound withdraw=withdrew/withdrawn wring=wrung/wrung write=wrote/written
+    """.split())
+}
+# Çeldirici ararken bağlam havuzundan bakılan en fazla kart
+CONTEXT_SAMPLE = 200
+TOKEN = re.compile(r"[A-Za-z]+(?:'[a-z]+)?")
+VOWELS = set("aeiou")
+# Vurgusu son hecede olup son harfi ikilenen çok heceli fiiller (transferred)
+DOUBLED = set("""
+    admit commit submit permit omit emit transmit refer prefer transfer confer defer
+    infer occur recur incur compel expel propel repel control patrol regret equip
+    """.split())
+
+
+def _doubles(word):
+    # Tek heceli, ünsüz-ünlü-ünsüz ile biten fiiller son harfi ikiler (run -> running)
+    if word in DOUBLED:
+        return True
+    return (len(word) >= 3 and word[-1] not in VOWELS and word[-1] not in "wxy"
+            and word[-2] in VOWELS and word[-3] not in VOWELS
+            and len(re.findall(r"[aeiou]+", word)) == 1)
+
+
+def inflections(word):
+    # Tek kelimelik fiilin çekimleri: {"base", "s", "ing", "past", "participle"}
+    if word.endswith(("s", "x", "z", "ch", "sh", "o")):
+        third = word + "es"
+    elif word.endswith("y") and len(word) > 1 and word[-2] not in VOWELS:
+        third = word[:-1] + "ies"
+    else:
+        third = word + "s"
+    if word.endswith("ie"):
+        ing = word[:-2] + "ying"
+    elif word.endswith("e") and not word.endswith(("ee", "ye", "oe")) and len(word) > 2:
+        ing = word[:-1] + "ing"
+    elif _doubles(word):
+        ing = word + word[-1] + "ing"
+    else:
+        ing = word + "ing"
+    if word in IRREGULAR:
+        past, participle = IRREGULAR[word]
+    else:
+        if word.endswith("e"):
+            past = word + "d"
+        elif word.endswith("y") and len(word) > 1 and word[-2] not in VOWELS:
+            past = word[:-1] + "ied"
+        elif _doubles(word):
+            past = word + word[-1] + "ed"
+        else:
+            past = word + "ed"
+        participle = past
+    if word == "be":
+        third = "is"
+    return {"base": word, "s": third, "ing": ing, "past": past, "participle": participle}
+
+
+def surface_forms(word):
+    # Cümlede aranacak yazımlar -> çekim adı (iki heceli fiillerin ikilenmiş
+    # ve ikilenmemiş hali de kabul edilir: "admitted", "visited")
+    forms = {}
+    for label, form in inflections(word).items():
+        forms.setdefault(form, label)
+    if word in IRREGULAR:
+        # Düzenli hali de yaygın olanlar (burned, leaped, spilled)
+        forms.setdefault(word + "d" if word.endswith("e") else word + "ed", "past")
+    if word[-1:] not in VOWELS and word[-1:] not in "wxy" and word[-2:-1] in VOWELS:
+        forms.setdefault(word + word[-1] + "ed", "past")
+        forms.setdefault(word + word[-1] + "ing", "ing")
+    if word == "be":
+        forms.update({"am": "s", "are": "base", "were": "past", "being": "ing"})
+    return forms
+
+
+def inflect(verb, label):
+    # "give up", "past" -> "gave up" (öbek fiillerde ilk kelime çekimlenir)
+    first, _, rest = verb.lower().partition(" ")
+    form = inflections(first)[label]
+    return f"{form} {rest}" if rest else form
+
+
+class Blank:
+    # Cümlede fiilin bulunduğu yer: [start, end) karakter aralığı, cümledeki
+    # yazımı ve çekim adı; boşluklu cümle ve şıklar bundan üretilir
+    __slots__ = ("start", "end", "text", "label")
+
+    def __init__(self, start, end, text, label):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.label = label
+
+
+def find_blank(verb, sentence, tokens=None):
+    # Fiilin (çekimli hali dahil) cümledeki ilk geçtiği yer; öbek fiillerde
+    # kalan kelimeler hemen ardından gelmeli ("broke down"). Yoksa None.
+    words = verb.lower().split()
+    if not words:
+        return None
+    forms = surface_forms(words[0])
+    if tokens is None:
+        tokens = list(TOKEN.finditer(sentence))
+    for i, match in enumerate(tokens):
+        label = forms.get(match.group().lower())
+        if label is None:
+            continue
+        rest = tokens[i + 1:i + len(words)]
+        if [m.group().lower() for m in rest] != words[1:]:
+            continue
+        end = rest[-1].end() if rest else match.end()
+        return Blank(match.start(), end, sentence[match.start():end].lower(), label)
+    return None
+
+
+class ClozeIndex:
+    # Örnek cümleler üzerinde ters indeks (yükleme sırasında bir kez kurulur):
+    #   postings: küçük harfli kelime -> [deste konumu] (cümlesinde geçen kartlar)
+    #   before / after: boşluktan hemen önceki / sonraki kelime -> [deste konumu]
+    # Bir fiilin geçtiği tüm cümleler postings ile, aynı bağlama uyan çeldirici
+    # fiiller before/after ile bulunur; soru başına deste taranmaz.
+    def __init__(self, vocab):
+        self.vocab = vocab
+        self.postings = {}
+        self.before = {}
+        self.after = {}
+        self.blanks = []        # deste konumu -> Blank ya da None
+        self._built = 0
+        self._sync()
+
+    def _sync(self):
+        # Desteye sonradan eklenen kartlar
+        while self._built < len(self.vocab):
+            self._add(self._built)
+            self._built += 1
+
+    def _add(self, position):
+        sentence = self.vocab.sentences[position]
+        tokens = list(TOKEN.finditer(sentence))
+        for token in {match.group().lower() for match in tokens}:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array('q')
+            postings.append(position)
+        blank = find_blank(self.vocab.verbs[position], sentence, tokens)
+        self.blanks.append(blank)
+        if blank is None:
+            return
+        previous = [m.group().lower() for m in tokens if m.end() <= blank.start]
+        following = [m.group().lower() for m in tokens if m.start() >= blank.end]
+        if previous:
+            self.before.setdefault(previous[-1], []).append(position)
+        if following:
+            self.after.setdefault(following[0], []).append(position)
+
+    def blank(self, position):
+        self._sync()
+        return self.blanks[position]
+
+    def prompt(self, position):
+        # "My car _____ on the highway." (fiil bulunamadıysa None)
+        blank = self.blank(position)
+        if blank is None:
+            return None
+        sentence = self.vocab.sentences[position]
+        return sentence[:blank.start] + BLANK + sentence[blank.end:]
+
+    def sentences_with(self, verb, limit=None):
+        # Fiilin (herhangi bir çekimiyle) geçtiği cümlelerin kartları
+        self._sync()
+        words = verb.lower().split()
+        if not words:
+            return []
+        candidates = set()
+        for form in surface_forms(words[0]):
+            candidates.update(self.postings.get(form, ()))
+        found = []
+        for position in sorted(candidates):
+            if len(words) == 1 or find_blank(verb, self.vocab.sentences[position]) is not None:
+                found.append(position)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def distractors(self, position, count=3):
+        # Aynı bağlamda (boşluğun önünde / arkasında aynı kelime) kullanılmış
+        # fiiller önce, sonra destenin geri kalanından rastgele; hepsi doğru
+        # cevapla aynı çekimde ("ran" için "walked", "jumped")
+        blank = self.blank(position)
+        verbs = self.vocab.verbs
+        sentence = self.vocab.sentences[position]
+        tokens = [m.group().lower() for m in TOKEN.finditer(sentence[:blank.start])]
+        following = [m.group().lower() for m in TOKEN.finditer(sentence[blank.end:])]
+        scores = {}
+        for pool in (self.before.get(tokens[-1], ()) if tokens else (),
+                     self.after.get(following[0], ()) if following else ()):
+            if len(pool) > CONTEXT_SAMPLE:
+                # "the" gibi sık kelimelerin havuzu büyük; soru süresi deste
+                # boyutuna bağlı kalmasın
+                pool = random.sample(pool, CONTEXT_SAMPLE)
+            for other in pool:
+                scores[other] = scores.get(other, 0) + 1
+        ranked = sorted(scores, key=lambda other: (-scores[other], random.random()))
+
+        turkish = self.vocab.turkish
+        words = len(verbs[position].split())
+        chosen = []
+        used = {verbs[position].lower()}
+        seen = {blank.text}
+
+        def take(other, exact=True):
+            verb = verbs[other].lower()
+            length = len(verb.split())
+            if exact and length != words or (words > 1) != (length > 1):
+                # Öbek fiile öbek fiil, tek kelimeye tek kelime
+                return
+            if verb in used or turkish[other] == turkish[position]:
+                # Aynı fiil ya da eş anlamlı kart
+                return
+            used.add(verb)
+            option = inflect(verb, blank.label)
+            if option not in seen:
+                seen.add(option)
+                chosen.append(option)
+
+        for other in ranked:
+            if len(chosen) >= count:
+                break
+            take(other)
+        attempts = 0
+        while len(chosen) < count and attempts < 64 and len(verbs) > 1:
+            # Bağlam yetmedi: rastgele fiiller (önce aynı uzunlukta öbek fiiller)
+            attempts += 1
+            take(random.randrange(len(verbs)), exact=attempts <= 32)
+        return chosen
@@ -0,0 +1,49 @@
+class DeckIndex:
+    # Deste için sabit zamanlı arama tabloları:
+    #   positions:  kart id -> destedeki konum
+    #   verbs:      verb.lower() -> kart id (tekrar kontrolü)
+    #   categories: kategori -> [kart id, ...]
+    #   max_id:     en büyük kart id (yeni id = max_id + 1)
+    # Yükleme ve ekleme sırasında güncellenir; kelime içeriği değişmediği için
+    # ilerleme güncellemeleri indeksi etkilemez.
+    def __init__(self):
+        self.positions = {}
+        self.verbs = {}
+        self.categories = {}
+        self.max_id = 0
+
+    @classmethod
+    def from_items(cls, items):
+        index = cls()
+        for position, item in enumerate(items):
+            index.add(item["id"], item["verb"], item.get("category", "General"), position)
+        return index
+
+    @classmethod
+    def from_columns(cls, ids, verbs, categories):
+        # Vocabulary sütunlarından (sözlük oluşturmadan)
+        index = cls()
+        add = index.add
+        for position, (card_id, verb, category) in enumerate(zip(ids, verbs, categories)):
+            add(card_id, verb, category, position)
+        return index
+
+    def __len__(self):
+        return len(self.positions)
+
+    def add(self, card_id, verb, category, position):
+        self.positions[card_id] = position
+        # Aynı fiil birden fazla varsa ilki geçerli
+        self.verbs.setdefault(verb.lower(), card_id)
+        self.categories.setdefault(category, []).append(card_id)
+        if card_id > self.max_id:
+            self.max_id = card_id
+
+    def position(self, card_id):
+        return self.positions.get(card_id)
+
+    def has_verb(self, verb):
+        return verb.lower() in self.verbs
+
+    def next_id(self):
+        return self.max_id + 1
@@ -0,0 +1,117 @@
+import random
+
+# Rastgele çekimde vazgeçmeden önceki deneme sayısı (küçük havuzlar için)
+MAX_ATTEMPTS = 32
+# "Zor" modda benzerlik için değerlendirilen aday sayısı
+HARD_CANDIDATES = 12
+
+
+def meaning_key(text):
+    return " ".join(text.lower().split())
+
+
+def alternatives(text):
+    # "kaldırmak, yükseltmek" -> {"kaldırmak", "yükseltmek"}
+    # ("meydana gelmek / gerçekleşmek" gibi boşluklu eğik çizgi de ayırıcıdır)
+    text = text.replace(";", ",").replace(" / ", ",")
+    return {meaning_key(part) for part in text.split(",") if part.strip()}
+
+
+class DistractorEngine:
+    # Yanlış şıklar için önceden hesaplanmış havuzlar.
+    # Aynı Türkçe karşılığa sahip kartlar tek bir "anlam" olarak tutulur, böylece
+    # aynı görünen iki şık çıkmaz. Doğru cevabın eş anlamlıları (ortak bir
+    # alternatifi olan anlamlar) dışlanır. Seçim, havuzdan reddetmeli örnekleme
+    # ile yapılır; soru başına tüm desteyi kopyalamaya gerek kalmaz.
+    def __init__(self, vocab):
+        self.vocab = vocab
+        self.meanings = []          # anlam id -> gösterilecek metin
+        self.keys = []              # anlam id -> normalize metin
+        self.meaning_of = []        # deste konumu -> anlam id
+        self.by_key = {}            # normalize metin -> anlam id
+        self.by_alternative = {}    # alternatif -> {anlam id}
+        self.by_category = {}       # kategori -> [anlam id] (tekrarsız)
+        self._category_seen = {}    # kategori -> {anlam id}
+        self._built = 0
+        self._sync()
+
+    def _sync(self):
+        # Desteye sonradan eklenen kartları havuzlara ekle
+        while self._built < len(self.vocab):
+            self._add(self._built)
+            self._built += 1
+
+    def _add(self, position):
+        text = self.vocab.turkish[position]
+        key = meaning_key(text)
+        meaning = self.by_key.get(key)
+        if meaning is None:
+            meaning = len(self.meanings)
+            self.by_key[key] = meaning
+            self.meanings.append(text)
+            self.keys.append(key)
+            for alt in alternatives(text):
+                self.by_alternative.setdefault(alt, set()).add(meaning)
+        self.meaning_of.append(meaning)
+
+        category = self.vocab.categories[position]
+        seen = self._category_seen.setdefault(category, set())
+        if meaning not in seen:
+            seen.add(meaning)
+            self.by_category.setdefault(category, []).append(meaning)
+
+    def synonyms(self, meaning):
+        # Doğru anlamla en az bir alternatifi ortak olan anlamlar (kendisi dahil)
+        result = {meaning}
+        for alt in alternatives(self.meanings[meaning]):
+            result |= self.by_alternative.get(alt, set())
+        return result
+
+    def _draw(self, pool, count, excluded):
+        # Havuzdan `count` farklı anlam; reddetmeli örnekleme, gerekirse tarama
+        chosen = []
+        attempts = 0
+        while pool and len(chosen) < count and attempts < MAX_ATTEMPTS * count:
+            attempts += 1
+            meaning = pool[random.randrange(len(pool))]
+            if meaning in excluded:
+                continue
+            excluded.add(meaning)
+            chosen.append(meaning)
+        if len(chosen) < count:
+            # Havuz küçük ya da çoğu dışlanmış: kalanları doğrudan tara
+            rest = [m for m in pool if m not in excluded]
+            chosen.extend(random.sample(rest, min(count - len(chosen), len(rest))))
+        return chosen
+
+    def _similarity(self, key, meaning):
+        # Küçük puan = daha benzer (uzunluk farkı ve ortak önek)
+        other = self.keys[meaning]
+        prefix = 0
+        for a, b in zip(key, other):
+            if a != b:
+                break
+            prefix += 1
+        return abs(len(key) - len(other)) - 2 * prefix
+
+    def sample(self, position, count=3, hard=False):
+        self._sync()
+        if not self.meanings:
+            return []
+        correct = self.meaning_of[position]
+        excluded = self.synonyms(correct)
+
+        chosen = []
+        if hard:
+            # Önce aynı kategoriden adaylar, benzer uzunluk/önek olanlar öne
+            pool = self.by_category.get(self.vocab.categories[position], [])
+            candidates = self._draw(pool, HARD_CANDIDATES, set(excluded))
+            key = self.keys[correct]
+            candidates.sort(key=lambda m: self._similarity(key, m))
+            chosen = candidates[:count]
+            excluded.update(chosen)
+
+        if len(chosen) < count:
+            pool = range(len(self.meanings))
+            chosen += self._draw(pool, count - len(chosen), excluded)
+        return [self.meanings[m] for m in chosen]
@@ -0,0 +1,140 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+
+from answers import normalize
+from persistence import atomic_write
+from storage import DEFAULT_PATH, open_storage
+
+try:
+    import brotli
+except ImportError:  # isteğe bağlı; yoksa sadece .gz üretilir
+    brotli = None
+
+# Manifest biçimi değişirse artırılır (istemci tanımadığı sürümü reddeder)
+BUNDLE_VERSION = 1
+# Parçalarda sadece kelime içeriği; ilerleme alanları istemcide tutulur
+FIELDS = ("id", "verb", "turkish", "sentence")
+# Büyük kategoriler bu kadar kartlık parçalara bölünür
+CHUNK_CARDS = 2000
+DEFAULT_OUT = os.path.join("web-app", "public", "deck")
+MANIFEST = "manifest.json"
+CHUNK_FILE = re.compile(r"^[a-z0-9-]+\.[0-9a-f]{12}\.json(\.gz|\.br)?$")
+
+
+def slug(category):
+    # "Daily Conversation" -> "daily-conversation" (dosya adı için)
+    return "-".join(re.sub(r"[^a-z0-9]+", " ", normalize(category)).split()) or "general"
+
+
+def group_cards(cards, chunk_cards=CHUNK_CARDS):
+    # Kategori -> [satır]; satırlar id sırasında, kategori adı parçada bir kez
+    groups = {}
+    for card in cards:
+        row = [card[field] for field in FIELDS]
+        groups.setdefault(card.get("category") or "General", []).append(row)
+    for category in sorted(groups):
+        rows = sorted(groups[category])
+        for part, start in enumerate(range(0, len(rows), chunk_cards)):
+            name = slug(category) if part == 0 else f"{slug(category)}-{part + 1}"
+            yield category, name, rows[start:start + chunk_cards]
+
+
+def encode(rows):
+    # Küçültülmüş JSON (girinti ve boşluk yok, Türkçe karakterler kaçışsız)
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_chunk(out_dir, name, data):
+    # İçerik hash'li dosya adı: değişmeyen parça aynı adla kalır ve yeniden
+    # yazılmaz; istemci onu önbellekten alır. Sıkıştırılmış kopyalar
+    # (gzip; brotli kuruluysa .br) sunucunun gzip_static benzeri
+    # seçenekleri için yanında durur.
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{name}.{digest}.json"
+    path = os.path.join(out_dir, filename)
+    written = not os.path.exists(path)
+    variants = {"": data, ".gz": None, ".br": None}
+    if written or not os.path.exists(path + ".gz"):
+        # mtime=0: aynı içerik her seferinde aynı bayt dizisi
+        variants[".gz"] = gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None and (written or not os.path.exists(path + ".br")):
+        variants[".br"] = brotli.compress(data, quality=11)
+    for suffix, payload in variants.items():
+        if payload is not None and (suffix or written):
+            atomic_write(path + suffix, lambda f, payload=payload: f.write(payload), binary=True)
+    entry = {"file": filename, "hash": digest, "bytes": len(data)}
+    for suffix in (".gz", ".br"):
+        if os.path.exists(path + suffix):
+            entry[suffix[1:] + "_bytes"] = os.path.getsize(path + suffix)
+    return entry, written
+
+
+def export_bundle(deck=DEFAULT_PATH, out_dir=DEFAULT_OUT, chunk_cards=CHUNK_CARDS, prune=True):
+    start = time.perf_counter()
+    storage = open_storage(deck)
+    try:
+        if not storage.exists():
+            raise FileNotFoundError(deck)
+        cards = list(storage.iter_cards())
+    finally:
+        storage.close()
+    os.makedirs(out_dir, exist_ok=True)
+
+    chunks = []
+    report = {"cards": len(cards), "chunks": 0, "written": 0, "reused": 0, "pruned": 0,
+              "bytes": 0, "gz_bytes": 0}
+    for category, name, rows in group_cards(cards, chunk_cards):
+        entry, written = write_chunk(out_dir, name, encode(rows))
+        chunks.append(dict(category=category, cards=len(rows), **entry))
+        report["chunks"] += 1
+        report["written" if written else "reused"] += 1
+        report["bytes"] += entry["bytes"]
+        report["gz_bytes"] += entry.get("gz_bytes", 0)
+
+    # Deste sürümü: parça hash'lerinden türetilir, içerik değişmedikçe aynı kalır
+    version = hashlib.sha256("".join(chunk["hash"] for chunk in chunks).encode()).hexdigest()[:12]
+    manifest = {"format": BUNDLE_VERSION, "version": version, "fields": list(FIELDS),
+                "cards": len(cards), "chunks": chunks}
+    # Manifest en son yazılır: yarım kalan bir dışa aktarım eski manifesti
+    # (ve onun parçalarını) geçerli bırakır
+    atomic_write(os.path.join(out_dir, MANIFEST),
+                 lambda f: json.dump(manifest, f, ensure_ascii=False, separators=(",", ":")))
+
+    if prune:
+        # Artık manifestte olmayan eski parçalar
+        keep = {chunk["file"] + suffix for chunk in chunks for suffix in ("", ".gz", ".br")}
+        for filename in os.listdir(out_dir):
+            if CHUNK_FILE.match(filename) and filename not in keep:
+                os.remove(os.path.join(out_dir, filename))
+                report["pruned"] += 1
+
+    report["version"] = version
+    report["seconds"] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the deck as a content-hashed, category-chunked bundle for the web app.")
+    parser.add_argument("--deck", default=DEFAULT_PATH, help=f"source deck (default: {DEFAULT_PATH})")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"output directory (default: {DEFAULT_OUT})")
+    parser.add_argument("--chunk-cards", type=int, default=CHUNK_CARDS,
+                        help="split categories into chunks of at most this many cards")
+    parser.add_argument("--keep-stale", action="store_true", help="do not delete chunks from older exports")
+    args = parser.parse_args()
+
+    report = export_bundle(args.deck, args.out, args.chunk_cards, prune=not args.keep_stale)
+    print(f"{report['cards']} cards -> {report['chunks']} chunks in {args.out} "
+          f"(version {report['version']}, {report['seconds']}s)")
+    print(f"  written {report['written']}, unchanged {report['reused']}, removed {report['pruned']} stale files")
+    print(f"  {report['bytes'] / 1000:.1f} KB JSON, {report['gz_bytes'] / 1000:.1f} KB gzip"
+          + ("" if brotli is not None else " (install brotli for .br files)"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import json
+import os
+
+from persistence import atomic_write
+
+
+class ProgressJournal:
+    # İlerleme kayıtları için sadece-ekleme (append-only) günlük dosyası.
+    # Her satır tek bir kartın son durumudur: {"id": .., "correct_count": .., ...}
+    # Her cevapta tüm deste yerine tek satır yazılır; belirli sayıda kayıttan
+    # sonra Game günlüğü deste dosyasına sıkıştırır (compaction).
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._file = None
+
+    def replay(self):
+        # Günlükteki kayıtları sırayla okuyup kart id -> son durum döndürür
+        # (aynı kartın kayıtları birleştirilir, sonraki alanlar öncekileri ezer).
+        # Çökme sırasında yarım kalan son satır atılır.
+        records = {}
+        self.count = 0
+        if not os.path.exists(self.path):
+            return records
+
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        complete = raw[:raw.rfind(b"\n") + 1]
+        if len(complete) != len(raw):
+            # Yarım satırı kes ki sonraki eklemeler bozuk satıra yapışmasın
+            with open(self.path, "r+b") as f:
+                f.truncate(len(complete))
+
+        for line in complete.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                records.setdefault(record["id"], {}).update(record)
+            except (ValueError, KeyError, TypeError):
+                continue
+            self.count += 1
+        return records
+
+    def append(self, record):
+        self.append_many([record])
+
+    def append_many(self, records):
+        # Birden fazla kaydı tek yazma + flush ile ekle
+        lines = [json.dumps(record, ensure_ascii=False, separators=(",", ":")) for record in records]
+        if not lines:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        self.count += len(lines)
+
+    def rewrite(self, records):
+        # Günlüğü sadece verilen son durumlarla yeniden yaz (geçici dosya + rename)
+        self.close()
+        def write(f):
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        atomic_write(self.path, write)
+        self.count = len(records)
+
+    def clear(self):
+        # Sıkıştırma sonrası günlüğü boşalt
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.count = 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
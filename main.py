@@ -1,229 +1,272 @@
-import json
-import random
 import os
 import sys
-import time
 from colorama import init, Fore, Style
 
+import metrics
+from answers import AnswerIndex
+from card_queue import CardQueue
+from card_store import CardStore
+from cloze import ClozeIndex
+from distractors import DistractorEngine
+from persistence import WriteBehind
+from review_log import ReviewLog
+from session import QuizSession, parse_scope
+from srs import DailyBudget, DueForecast, SchedulePolicy
+from stats import LEARNED_THRESHOLD, compute_stats
+from storage import DEFAULT_PATH, open_storage, reviews_path
+from terminal import Screen, read_key
+
 # Windows için renkleri etkinleştir
 init(autoreset=True)
 
-DATA_FILE = "verbs.json"
-
-class VerbCard:
-    def __init__(self, data):
-        self.id = data["id"]
-        self.verb = data["verb"]
-        self.turkish = data["turkish"]
-        self.sentence = data["sentence"]
-        self.category = data.get("category", "General")
-        self.weight = data.get("weight", 100)
-        self.correct_count = data.get("correct_count", 0)
-        self.last_reviewed = data.get("last_reviewed", 0)
-        self.next_review = data.get("next_review", 0)
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "verb": self.verb,
-            "turkish": self.turkish,
-            "sentence": self.sentence,
-            "category": self.category,
-            "weight": self.weight,
-            "correct_count": self.correct_count,
-            "last_reviewed": self.last_reviewed,
-            "next_review": self.next_review
-        }
-
-    def update_weight(self, is_correct):
-        now = time.time()
-        self.last_reviewed = now
-
-        if is_correct:
-            self.correct_count += 1
-            # Basit SRS: Doğru bilme sayısına göre aralığı artır (Saniye cinsinden)
-            # 1. Doğru: 1 dakika, 2. Doğru: 10 dakika, 3. Doğru: 1 gün, vb.
-            if self.correct_count == 1:
-                interval = 60 # 1 dakika
-            elif self.correct_count == 2:
-                interval = 600 # 10 dakika
-            elif self.correct_count == 3:
-                interval = 86400 # 1 gün
-            else:
-                interval = 86400 * (2 ** (self.correct_count - 3)) # Üstel artış
-
-            self.next_review = now + interval
-            # Ağırlığı düşür (daha az çıksın)
-            self.weight = max(1, self.weight * 0.5)
-        else:
-            # Yanlışsa hemen tekrar sor
-            self.correct_count = 0
-            self.next_review = now 
-            self.weight = 100 # Ağırlığı sıfırla/artır
+# Deste dosyası (.json ya da .db/.sqlite); KELIME_DATA ile değiştirilebilir.
+# JSON'da her cevap progress.jsonl günlüğüne eklenir ve belirli aralıklarla
+# desteye sıkıştırılır, SQLite'ta tek satır güncellenir (bkz. storage.py)
+DATA_FILE = DEFAULT_PATH
+# True: yanlış şıklar önce aynı kategoriden ve benzer uzunlukta seçilir
+HARD_DISTRACTORS = False
+# Hızlı mod: cevaplar tek tuşla (Enter yok), sonuç bir sonraki sorunun
+# üstünde gösterilir. KELIME_FAST=1 ya da `python main.py --fast`
+FAST_MODE = os.environ.get("KELIME_FAST") == "1"
+# Yazılı cevap modu: şık yok, Türkçe karşılık yazılır (büyük/küçük harf,
+# Türkçe karakterler ve küçük yazım hataları tolere edilir; bkz. answers.py).
+# KELIME_TYPED=1 ya da `python main.py --typed`
+TYPED_MODE = os.environ.get("KELIME_TYPED") == "1"
+# Boşluk doldurma modu: örnek cümlede fiil (çekimli hali dahil) boşluğa
+# çevrilir, şıklar aynı cümle bağlamına uyan fiillerdir (bkz. cloze.py).
+# KELIME_CLOZE=1 ya da `python main.py --cloze`; --typed ile birlikte fiil yazılır
+CLOZE_MODE = os.environ.get("KELIME_CLOZE") == "1"
 
 class Game:
-    def __init__(self):
-        self.deck = []
+    def __init__(self, fast=FAST_MODE, typed=TYPED_MODE, cloze=CLOZE_MODE):
+        # Ekran ANSI ile çizilir, sadece değişen satırlar yeniden yazılır
+        self.screen = Screen()
+        self.fast = fast
+        self.typed = typed
+        self.cloze_mode = cloze
+        # Hızlı modda son cevabın sonucu (sonraki karenin ilk satırları)
+        self.feedback = []
+        # Kartlar sütun halinde tutulur; self.deck[i] bir VerbCard görünümüdür
+        self.deck = CardStore()
+        self.storage = open_storage(DATA_FILE)
+        # Her cevap (kart, zaman, doğru mu, süre) olarak kaydedilir
+        self.reviews = ReviewLog(reviews_path(DATA_FILE))
+        # Günlük yeni kart / tekrar limitleri, bugünkü cevaplardan başlar
+        self.budget = DailyBudget()
+        self.budget.load_log(self.reviews)
         self.load_data()
+        # Cevaplar bellekte birleştirilir, arka planda toplu yazılır; cevap
+        # süresine disk işi girmez (bkz. persistence.py)
+        self.writer = WriteBehind(self.storage, compact=self.save_data, hooks=[self.reviews.flush],
+                                  on_error=self.report_save_error)
 
     def load_data(self):
-        if not os.path.exists(DATA_FILE):
-            print(f"{Fore.RED}Hata: {DATA_FILE} bulunamadı!{Style.RESET_ALL}")
-            print("Basit bir verbs.json oluşturuluyor...")
+        if not self.storage.exists():
+            self.screen.print(f"{Fore.RED}Hata: {DATA_FILE} bulunamadı!{Style.RESET_ALL}")
+            self.screen.print(f"Basit bir {DATA_FILE} oluşturuluyor...")
             default_data = [{"id":1, "verb":"run", "turkish":"koşmak", "sentence":"I run fast.", "category":"General"}]
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(default_data, f)
-            self.deck = [VerbCard(d) for d in default_data]
+            self.storage.save_all(default_data)
+            self.deck = CardStore.from_dicts(default_data)
+            self.session = None
             return
         
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.deck = [VerbCard(item) for item in data]
+            # Son sıkıştırmadan sonraki ilerleme de uygulanmış olarak gelir
+            with metrics.timer("load"):
+                self.deck = self.storage.load_store()
+            # Kuyruk ve şık havuzları ilk soruda kurulur; menü hemen açılır
+            self.session = None
             # print(f"{Fore.GREEN}{len(self.deck)} kelime yüklendi.{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.RED}Veri yüklenirken hata oluştu: {e}{Style.RESET_ALL}")
+            self.screen.print(f"{Fore.RED}Veri yüklenirken hata oluştu: {e}{Style.RESET_ALL}")
             sys.exit(1)
 
+    def build_indexes(self):
+        # Seçim kuyruğu, vade tahmini ve şık havuzları (ilk soruda bir kez)
+        with metrics.timer("build_indexes"):
+            self.deck.queue = CardQueue(self.deck.queue_items())
+            self.deck.policy = SchedulePolicy(DueForecast(self.deck.progress.next_review))
+            self.distractors = DistractorEngine(self.deck.vocab)
+            # Yazılı cevap modunda normalize anlam indeksi
+            self.answers = AnswerIndex(self.deck.vocab) if self.typed else None
+            # Örnek cümlelerin ters indeksi (boşluk doldurma modunda)
+            self.cloze = ClozeIndex(self.deck.vocab) if self.cloze_mode else None
+        # Soru seçimi, şıklar ve cevap işleme (arayüzden bağımsız)
+        self.session = QuizSession(self.deck, self.distractors, self.budget, self.reviews,
+                                   save=self.save_progress, hard=HARD_DISTRACTORS,
+                                   flush_reviews=False, answers=self.answers, typed=self.typed,
+                                   cloze=self.cloze)
+
     def save_data(self):
+        # Tüm desteyi yazar ve günlüğü sıkıştırır (arka plandaki yazıcıdan da
+        # çağrılır; io_lock aynı anda iki yazmayı önler)
         data = [card.to_dict() for card in self.deck]
         try:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with self.writer.io_lock, metrics.timer("save_all"):
+                self.storage.save_all(data, store=self.deck)
         except Exception as e:
-            print(f"Veri kaydedilirken hata oluştu: {e}")
+            self.screen.print(f"Veri kaydedilirken hata oluştu: {e}")
 
-    def get_valid_distractors(self, correct_card):
-        # Kendisi hariç tüm kartlar
-        candidates = [c for c in self.deck if c.id != correct_card.id]
-        if len(candidates) < 3:
-            return [c.turkish for c in candidates] # Change to returning text to match return type
-        
-        # Rastgele 3 tane seç, Türkçe anlamlarını al
-        distractors = random.sample(candidates, 3)
-        return [d.turkish for d in distractors]
+    def save_progress(self, card):
+        # Cevap yolunda sadece işaretlenir; yazma ve sıkıştırma WriteBehind'da
+        self.writer.mark(card)
 
-    def select_next_card(self):
-        if not self.deck:
-            return None
-        
-        now = time.time()
-        
-        # 1. Öncelik: Vakti gelmiş kartlar (SRS)
-        due_cards = [c for c in self.deck if c.next_review <= now]
-        
-        if due_cards:
-            # Vakti gelmişlerden ağırlığa göre seç
-            weights = [c.weight for c in due_cards]
-            return random.choices(due_cards, weights=weights, k=1)[0]
-        
-        # 2. Öncelik: Hiç çözülmemiş kartlar (Yeni kelimeler) - Küçük gruplar halinde
-        new_cards = [c for c in self.deck if c.correct_count == 0]
-        if new_cards:
-            subset_size = min(len(new_cards), 10)
-            return random.choice(new_cards[:subset_size])
-
-        # 3. Öncelik: Eğer hepsi çözülmüş ve vadesi gelmemişse -> Ağırlıklı rastgele
-        weights = [c.weight for c in self.deck]
-        return random.choices(self.deck, weights=weights, k=1)[0]
+    def report_save_error(self, error):
+        self.screen.print(f"İlerleme kaydedilirken hata oluştu: {error}")
 
     def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.screen.clear()
 
-    def play_round(self):
-        self.clear_screen()
-        current_card = self.select_next_card()
-        if not current_card:
-            print("Kart destesi boş!")
-            input("Devam etmek için Enter...")
-            return
+    def ask(self, prompt):
+        # Hızlı modda tek tuş, normal modda satır + Enter
+        return read_key(prompt) if self.fast else self.screen.input(prompt)
 
-        print("\n" + "="*50)
-        print(f"{Fore.CYAN}SORU: '{current_card.verb}' kelimesinin Türkçe karşılığı nedir?{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}[Kategori: {current_card.category}]{Style.RESET_ALL}")
-        print("="*50 + "\n")
-
-        # Şıkları hazırla
-        correct_answer = current_card.turkish
-        distractors = self.get_valid_distractors(current_card)
-        options = distractors + [correct_answer]
-        random.shuffle(options)
+    def play_round(self):
+        if self.session is None:
+            self.build_indexes()
+        question = self.session.next_question()
+        if question is None:
+            self.clear_screen()
+            if self.session.finished:
+                self.screen.print(f"{Fore.GREEN}Kategori oturumu tamamlandı!{Style.RESET_ALL}")
+                self.session.set_scope(None)
+            elif len(self.deck):
+                self.screen.print(f"{Fore.GREEN}Bugünlük limit doldu! Yarın tekrar gelin.{Style.RESET_ALL}")
+            else:
+                self.screen.print("Kart destesi boş!")
+            self.feedback = []
+            self.ask("Devam etmek için Enter...")
+            return "EXIT"
 
+        current_card = question.card
+        options = question.options
+        if question.prompt is not None:
+            title = [f"{Fore.CYAN}SORU: Boşluğa hangi fiil gelir?{Style.RESET_ALL}",
+                     f"  {question.prompt}  ({current_card.turkish})"]
+        else:
+            title = [f"{Fore.CYAN}SORU: '{current_card.verb}' kelimesinin Türkçe karşılığı nedir?{Style.RESET_ALL}"]
+        lines = self.feedback + [
+            "",
+            "="*50,
+            *title,
+            f"{Fore.YELLOW}[Kategori: {current_card.category}]{Style.RESET_ALL}",
+            "="*50,
+            "",
+        ]
         # Şıkları göster
         for i, option in enumerate(options):
-            print(f"{i+1}) {option}")
-        
-        print("\n0) Ana Menüye Dön")
+            lines.append(f"{i+1}) {option}")
+        lines += ["", "0) Ana Menüye Dön", ""]
+        self.screen.draw(lines)
+
+        if self.typed:
+            # Yazılı cevap her zaman satır + Enter ile alınır
+            while True:
+                text = self.screen.input("Fiil: " if question.prompt is not None else "Türkçe karşılığı: ").strip()
+                if text:
+                    break
+            if text == '0':
+                self.feedback = []
+                return "EXIT"
+            result = self.session.submit_text(text)
+            return self.show_result(current_card, result)
 
         # Kullanıcı girişi
         while True:
             try:
-                choice = input("\nCevabınız (1-4): ")
+                choice = self.ask("Cevabınız (1-4): ")
                 if choice == '0':
+                    self.feedback = []
                     return "EXIT" 
                 
                 choice_idx = int(choice) - 1
                 if 0 <= choice_idx < len(options):
                     selected_answer = options[choice_idx]
                     break
-                else:
-                    print("Lütfen geçerli bir seçenek girin.")
+                elif not self.fast:
+                    self.screen.print("Lütfen geçerli bir seçenek girin.")
             except ValueError:
-                print("Lütfen sayı girin.")
+                if not self.fast:
+                    self.screen.print("Lütfen sayı girin.")
+
+        # Kontrol (kayıt, SRS ve kaydetme QuizSession.submit içinde)
+        result = self.session.submit(selected_answer)
+        return self.show_result(current_card, result)
 
-        # Kontrol
-        if selected_answer == correct_answer:
-            print(f"\n{Fore.GREEN}✅ TEBRİKLER! Doğru bildiniz.{Style.RESET_ALL}")
-            print(f"{Fore.BLUE}Örnek Cümle: {current_card.sentence}{Style.RESET_ALL}")
-            current_card.update_weight(True)
+    def show_result(self, current_card, result):
+        if result["correct"] and result.get("typos"):
+            message = (f"{Fore.GREEN}✅ DOĞRU (küçük bir yazım hatasıyla): "
+                       f"'{result['expected']}'{Style.RESET_ALL}")
+        elif result["correct"]:
+            message = f"{Fore.GREEN}✅ TEBRİKLER! Doğru bildiniz.{Style.RESET_ALL}"
         else:
-            print(f"\n{Fore.RED}❌ YANLIŞ. Doğru cevap: '{correct_answer}'{Style.RESET_ALL}")
-            print(f"{Fore.BLUE}Örnek Cümle: {current_card.sentence}{Style.RESET_ALL}")
-            current_card.update_weight(False)
+            message = f"{Fore.RED}❌ YANLIŞ. Doğru cevap: '{result['expected']}'{Style.RESET_ALL}"
+            confused = result.get("confused")
+            if confused is not None:
+                message += f"{Fore.YELLOW} ('{result['answer']}' → '{confused.verb}'){Style.RESET_ALL}"
+        sentence = f"{Fore.BLUE}Örnek Cümle: {current_card.sentence}{Style.RESET_ALL}"
+        if self.cloze is not None:
+            # Fiilin destedeki diğer cümleleri (ters indeksten, deste taranmaz)
+            others = [self.deck.vocab.sentences[p]
+                      for p in self.cloze.sentences_with(current_card.verb, limit=3)
+                      if p != current_card.index][:2]
+            if others:
+                sentence += "".join(f"\n{Fore.BLUE}  · {other}{Style.RESET_ALL}" for other in others)
 
-        self.save_data()
-        input("\nDevam etmek için Enter'a basın...")
+        if self.fast:
+            # Beklemeden sonraki soruya geç; sonuç onun üstünde görünür
+            self.feedback = [f"{current_card.verb} → {message}", *sentence.split("\n")]
+            return "CONTINUE"
+        self.screen.print(f"\n{message}")
+        self.screen.print(sentence)
+        self.screen.input("\nDevam etmek için Enter'a basın...")
         return "CONTINUE"
 
     def show_stats(self):
         self.clear_screen()
-        total_cards = len(self.deck)
-        learned_cards = len([c for c in self.deck if c.correct_count >= 5])
-        in_progress = len([c for c in self.deck if c.correct_count > 0 and c.correct_count < 5])
-        new_cards = len([c for c in self.deck if c.correct_count == 0])
+        stats = compute_stats(self.deck, self.reviews)
 
-        print(f"\n{Fore.MAGENTA}--- İSTATİSTİKLER ---{Style.RESET_ALL}\n")
-        print(f"Toplam Kelime : {total_cards}")
-        print(f"Öğrenilen     : {Fore.GREEN}{learned_cards}{Style.RESET_ALL} (5+ doğru)")
-        print(f"Çalışılıyor   : {Fore.YELLOW}{in_progress}{Style.RESET_ALL}")
-        print(f"Yeni          : {Fore.BLUE}{new_cards}{Style.RESET_ALL}")
+        self.screen.print(f"\n{Fore.MAGENTA}--- İSTATİSTİKLER ---{Style.RESET_ALL}\n")
+        self.screen.print(f"Toplam Kelime : {stats['total']}")
+        self.screen.print(f"Öğrenilen     : {Fore.GREEN}{stats['learned']}{Style.RESET_ALL} ({LEARNED_THRESHOLD}+ doğru)")
+        self.screen.print(f"Çalışılıyor   : {Fore.YELLOW}{stats['in_progress']}{Style.RESET_ALL}")
+        self.screen.print(f"Yeni          : {Fore.BLUE}{stats['new']}{Style.RESET_ALL}")
         
-        if total_cards > 0:
-            percent = (learned_cards / total_cards) * 100
-            print(f"\nBaşarı Oranı  : %{percent:.1f}")
+        if stats['total'] > 0:
+            self.screen.print(f"\nBaşarı Oranı  : %{stats['learned_percent']:.1f}")
 
-        input("\nGeri dönmek için Enter...")
+        self.screen.print(f"\nBugün Tekrar  : {stats['due_today']}")
+        self.screen.print("7 Gün Tahmini : " + " ".join(str(n) for n in stats['forecast']))
+
+        if stats['reviews']:
+            self.screen.print(f"\nToplam Cevap  : {stats['reviews']} (doğru %{stats['accuracy']:.1f}, "
+                  f"ort. {stats['avg_response_ms'] / 1000:.1f} sn)")
+            self.screen.print("Son 7 gün     : " + " ".join(str(n) for n in stats['daily_reviews']))
+            self.screen.print("\nKategorilere göre doğruluk:")
+            for category, accuracy in stats['category_accuracy'].items():
+                self.screen.print(f"  {category:<20} %{accuracy:.1f}")
+
+        self.screen.input("\nGeri dönmek için Enter...")
 
     def add_new_word(self):
         self.clear_screen()
-        print(f"\n{Fore.MAGENTA}--- YENİ KELİME EKLE ---{Style.RESET_ALL}\n")
+        self.screen.print(f"\n{Fore.MAGENTA}--- YENİ KELİME EKLE ---{Style.RESET_ALL}\n")
         
-        verb = input("İngilizce Fiil: ").strip()
+        verb = self.screen.input("İngilizce Fiil: ").strip()
         if not verb: return
         
-        # Basit bir tekrar kontrolü
-        for c in self.deck:
-            if c.verb.lower() == verb.lower():
-                print(f"{Fore.RED}Bu kelime zaten var!{Style.RESET_ALL}")
-                input("Enter...")
-                return
+        # Tekrar kontrolü (küçük harfli fiil indeksi)
+        if self.deck.deck_index.has_verb(verb):
+            self.screen.print(f"{Fore.RED}Bu kelime zaten var!{Style.RESET_ALL}")
+            self.screen.input("Enter...")
+            return
 
-        turkish = input("Türkçe Karşılığı: ").strip()
-        sentence = input("Örnek Cümle: ").strip()
-        category = input("Kategori (Opsiyonel): ").strip()
+        turkish = self.screen.input("Türkçe Karşılığı: ").strip()
+        sentence = self.screen.input("Örnek Cümle: ").strip()
+        category = self.screen.input("Kategori (Opsiyonel): ").strip()
         if not category: category = "General"
 
-        new_id = max([c.id for c in self.deck], default=0) + 1
+        new_id = self.deck.deck_index.next_id()
         new_data = {
             "id": new_id,
             "verb": verb,
@@ -234,24 +277,58 @@ class Game:
             "correct_count": 0
         }
         
-        self.deck.append(VerbCard(new_data))
-        self.save_data()
-        print(f"\n{Fore.GREEN}Kelime başarıyla eklendi!{Style.RESET_ALL}")
-        input("Enter...")
+        # Kart kilit bırakılmadan desteye de eklenir: arada çalışan bir
+        # sıkıştırma desteyi yeni kart olmadan yazıp günlüğü silmesin
+        with self.writer.io_lock:
+            try:
+                # SQLite'ta id başka bir süreçte alınmışsa add_cards yenisini verir
+                self.storage.add_cards([new_data])
+            except Exception as e:
+                self.screen.print(f"Veri kaydedilirken hata oluştu: {e}")
+            self.deck.append(new_data)
+        self.screen.print(f"\n{Fore.GREEN}Kelime başarıyla eklendi!{Style.RESET_ALL}")
+        self.screen.input("Enter...")
+
+    def scope_label(self):
+        scope = self.session.scope if self.session else None
+        if not scope:
+            return "Tümü"
+        return ", ".join(f"{name}:{quota}" if quota else name for name, quota in scope.items())
+
+    def choose_categories(self):
+        # Oturumu bir ya da birkaç kategoriye daralt; "1:10" o kategoriden 10 soru
+        if self.session is None:
+            self.build_indexes()
+        self.clear_screen()
+        self.screen.print(f"\n{Fore.MAGENTA}--- KATEGORİ SEÇ ---{Style.RESET_ALL}\n")
+        categories = sorted(self.deck.deck_index.categories.items())
+        for i, (name, ids) in enumerate(categories):
+            self.screen.print(f"{i+1:>3}) {name} ({len(ids)})")
+        self.screen.print("\nÖrnek: 1,4 ya da kotalı 1:10,4:5 (boş bırakılırsa tüm deste)")
+
+        tokens = []
+        for token in self.screen.input("Seçiminiz: ").split(","):
+            number, _, quota = token.strip().partition(":")
+            if number.isdigit() and 1 <= int(number) <= len(categories):
+                tokens.append(categories[int(number) - 1][0] + ":" + quota)
+        self.session.set_scope(parse_scope(tokens))
 
     def run(self):
         while True:
-            self.clear_screen()
-            print(f"{Fore.CYAN}--- İNGİLİZCE KELİME KARTI OYUNU ---{Style.RESET_ALL}")
-            print(f"Toplam Kelime: {len(self.deck)}")
-            print("-" * 30)
-            print("1. Oyuna Başla")
-            print("2. İstatistikler")
-            print("3. Yeni Kelime Ekle")
-            print("4. Çıkış")
-            print("-" * 30)
+            self.screen.draw([
+                f"{Fore.CYAN}--- İNGİLİZCE KELİME KARTI OYUNU ---{Style.RESET_ALL}",
+                f"Toplam Kelime: {len(self.deck)}",
+                f"Kategori: {self.scope_label()}",
+                "-" * 30,
+                "1. Oyuna Başla",
+                "2. İstatistikler",
+                "3. Yeni Kelime Ekle",
+                "4. Kategori Seç",
+                "5. Çıkış",
+                "-" * 30,
+            ])
             
-            choice = input("Seçiminiz: ")
+            choice = self.ask("Seçiminiz: ")
             
             if choice == '1':
                 while True:
@@ -263,11 +340,21 @@ class Game:
             elif choice == '3':
                 self.add_new_word()
             elif choice == '4':
-                print("Görüşmek üzere!")
+                self.choose_categories()
+            elif choice == '5':
+                # Bekleyen cevapları yaz, sonra günlüğü desteye sıkıştır
+                self.writer.close()
+                if self.storage.pending():
+                    self.save_data()
+                self.screen.print("Görüşmek üzere!")
                 break
             else:
                 pass
 
 if __name__ == "__main__":
-    game = Game()
+    # KELIME_METRICS / KELIME_PROFILE (bkz. metrics.py)
+    metrics.install()
+    game = Game(fast=FAST_MODE or "--fast" in sys.argv[1:],
+                typed=TYPED_MODE or "--typed" in sys.argv[1:],
+                cloze=CLOZE_MODE or "--cloze" in sys.argv[1:])
     game.run()
@@ -0,0 +1,201 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+
+# KELIME_METRICS=metrics.json: sayaç ve süre histogramlarını bu dosyaya yaz
+METRICS_PATH = os.environ.get("KELIME_METRICS")
+# KELIME_PROFILE=cprofile | sample: süreci profille (çıktı KELIME_PROFILE_OUT).
+# cprofile sadece install() çağıran iş parçacığını ölçer (terminal oyunu,
+# sunucu); Streamlit için sample kullanılmalı.
+PROFILE_MODE = os.environ.get("KELIME_PROFILE")
+PROFILE_OUT = os.environ.get("KELIME_PROFILE_OUT")
+# Uzun yaşayan süreçlerde (Streamlit, sunucu) dosya en fazla bu aralıkla yazılır
+EXPORT_INTERVAL = 30.0
+# Örnekleyici profil aralığı (saniye)
+SAMPLE_INTERVAL = 0.005
+BUCKETS = 40
+
+
+class Histogram:
+    # Süre histogramı: i. kova [2^(i-1), 2^i) mikrosaniye. Sabit bellek,
+    # kayıt başına tek bir bit_length; yüzdelikler kova üst sınırından tahmin edilir.
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, seconds):
+        micros = int(seconds * 1e6)
+        self.counts[min(BUCKETS - 1, micros.bit_length())] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        # Kova üst sınırı (ms); gerçek en büyük değeri aşmaz
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return min((1 << bucket) / 1000, self.max * 1000)
+        return self.max * 1000
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "min_ms": round(self.min * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p90_ms": round(self.percentile(0.9), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "max_ms": round(self.max * 1000, 3),
+            # [üst sınır ms, adet], sadece dolu kovalar
+            "buckets": [[(1 << bucket) / 1000, count] for bucket, count in enumerate(self.counts) if count],
+        }
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_TIMER = nullcontext()
+
+
+class Metrics:
+    # Sayaçlar ve süre histogramları. Kapalıyken timer() paylaşılan boş bir
+    # context manager döndürür; ölçüm noktalarının maliyeti bir öznitelik okuması.
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = path is not None
+        self.counters = Counter()
+        self.histograms = {}
+        self.last_export = time.monotonic()
+
+    def timer(self, name):
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def observe(self, name, seconds):
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(seconds)
+
+    def incr(self, name, count=1):
+        if self.enabled:
+            self.counters[name] += count
+
+    def snapshot(self):
+        return {
+            "generated": time.time(),
+            "pid": os.getpid(),
+            "counters": dict(self.counters),
+            "histograms": {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+        }
+
+    def export(self, path=None):
+        path = path or self.path
+        if not path:
+            return
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+        self.last_export = time.monotonic()
+
+    def maybe_export(self):
+        # Uzun yaşayan süreçler için: son yazımdan EXPORT_INTERVAL geçtiyse yaz
+        if self.enabled and time.monotonic() - self.last_export >= EXPORT_INTERVAL:
+            self.export()
+
+
+class SamplingProfiler:
+    # Ayrı bir iş parçacığı tüm iş parçacıklarının yığınlarını aralıklarla okur
+    # ve sadece bu projenin kodunu içeren yığınları sayar (Streamlit betiği her
+    # çalıştırmada başka bir iş parçacığında koşar). Çıktı flamegraph.pl /
+    # speedscope ile açılabilen "collapsed stacks" biçimi.
+    def __init__(self, interval=SAMPLE_INTERVAL, root=os.path.dirname(os.path.abspath(__file__))):
+        self.interval = interval
+        self.root = root
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                ours = False
+                while frame is not None:
+                    code = frame.f_code
+                    ours = ours or code.co_filename.startswith(self.root)
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                if ours:
+                    self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self, path):
+        self._stop.set()
+        self._thread.join()
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+METRICS = Metrics(METRICS_PATH)
+timer = METRICS.timer
+observe = METRICS.observe
+incr = METRICS.incr
+_installed = False
+
+
+def install():
+    # Süreç başına bir kez: profil açıksa başlat, çıkışta metrikleri ve profili yaz
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    if METRICS.enabled:
+        atexit.register(METRICS.export)
+    if PROFILE_MODE == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        atexit.register(lambda: (profiler.disable(), profiler.dump_stats(PROFILE_OUT or "kelime.prof")))
+    elif PROFILE_MODE == "sample":
+        sampler = SamplingProfiler()
+        sampler.start()
+        atexit.register(lambda: sampler.stop(PROFILE_OUT or "kelime.stacks"))
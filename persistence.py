@@ -0,0 +1,120 @@
+import atexit
+import os
+import threading
+
+import metrics
+
+# Kirli kartlar en fazla bu kadar saniye bellekte bekler...
+FLUSH_INTERVAL = 2.0
+# ...ya da bu kadar kart birikince hemen yazılır
+FLUSH_EVERY = 50
+
+
+def atomic_write(path, write, binary=False):
+    # Dosyayı yerinde ezmek yerine geçici dosyaya yaz, diske indir (fsync) ve
+    # tek adımda değiştir: yazma sırasında çökme eski ya da yeni dosyayı
+    # bırakır, hiçbir zaman yarım dosya bırakmaz. write(f) içeriği yazar.
+    tmp_path = path + ".tmp"
+    if binary:
+        f = open(tmp_path, "wb")
+    else:
+        f = open(tmp_path, "w", encoding="utf-8")
+    with f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+
+def _fsync_dir(directory):
+    # Yeniden adlandırmanın kendisi de kalıcı olsun (POSIX; Windows'ta yok)
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteBehind:
+    # Cevap başına diske yazmak yerine değişen kartlar bellekte birleştirilir
+    # (kart id -> kart; aynı kartın art arda cevapları tek kayıt olur) ve
+    # arka plandaki bir iş parçacığı FLUSH_INTERVAL saniyede bir ya da
+    # FLUSH_EVERY kart birikince tek seferde storage.save_progress ile yazar.
+    # Çıkışta (close / atexit) bekleyenler yazılır. Kayıt yazma anında
+    # kartın son durumundan üretilir; kart yazılırken değişirse mark() onu
+    # yeniden işaretler.
+    #   storage: JsonStorage / SQLiteStorage
+    #   compact: günlük sıkıştırılacak kadar büyüyünce çağrılır (Game.save_data)
+    #   hooks: her yazmada çağrılır (ör. ReviewLog.flush)
+    #   on_error: yazma hatası (istisna); kayıtlar bir sonraki denemeye kalır
+    # Aynı storage'a başka yerden yazılacaksa `with writer.io_lock:` kullanılır.
+    def __init__(self, storage, compact=None, hooks=(), on_error=None,
+                 interval=FLUSH_INTERVAL, max_pending=FLUSH_EVERY):
+        self.storage = storage
+        self.compact = compact
+        self.hooks = list(hooks)
+        self.on_error = on_error
+        self.interval = interval
+        self.max_pending = max_pending
+        self.pending = {}
+        self.lock = threading.Lock()        # pending sözlüğü
+        self.io_lock = threading.RLock()    # storage üzerindeki tüm yazmalar
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def mark(self, card):
+        # Cevap yolunda tek iş: kartı kirli olarak işaretle (disk yok)
+        with self.lock:
+            self.pending[card.id] = card
+            full = len(self.pending) >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self.io_lock:
+            with self.lock:
+                cards = self.pending
+                self.pending = {}
+            try:
+                if cards:
+                    with metrics.timer("flush"):
+                        self.storage.save_progress([card.progress_dict() for card in cards.values()])
+                for hook in self.hooks:
+                    hook()
+                if cards and self.compact is not None and self.storage.needs_compaction:
+                    self.compact()
+            except Exception as e:
+                # Yazılamayanları geri koy (bu arada yeniden işaretlenenler öncelikli)
+                with self.lock:
+                    for card_id, card in cards.items():
+                        self.pending.setdefault(card_id, card)
+                if self.on_error is None:
+                    raise
+                self.on_error(e)
+
+    def close(self):
+        # Bekleyenleri yaz ve iş parçacığını durdur (birden fazla çağrılabilir)
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
@@ -0,0 +1,63 @@
+import os
+import struct
+from array import array
+
+# Tek bir cevap: kart id, zaman damgası, doğru mu, cevap süresi (ms)
+RECORD = struct.Struct("<qdBI")
+
+
+class ReviewLog:
+    # Cevap geçmişi. Diskte sabit boyutlu (21 bayt) kayıtlardan oluşan
+    # sadece-ekleme bir dosya, bellekte her alan için bir array sütunu.
+    def __init__(self, path):
+        self.path = path
+        self.card_ids = array('q')
+        self.timestamps = array('d')
+        self.correct = bytearray()
+        self.response_ms = array('I')
+        self._file = None
+        self.load()
+
+    def __len__(self):
+        return len(self.card_ids)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        usable = len(raw) - len(raw) % RECORD.size
+        if usable != len(raw):
+            # Yarım kalmış son kaydı at
+            with open(self.path, "r+b") as f:
+                f.truncate(usable)
+        for card_id, timestamp, correct, response_ms in RECORD.iter_unpack(raw[:usable]):
+            self.card_ids.append(card_id)
+            self.timestamps.append(timestamp)
+            self.correct.append(correct)
+            self.response_ms.append(response_ms)
+
+    def append(self, card_id, timestamp, correct, response_ms=0, flush=True):
+        # flush=False: kayıt dosya tamponunda bekler, flush() ile toplu yazılır
+        response_ms = max(0, min(int(response_ms), 0xFFFFFFFF))
+        self.card_ids.append(card_id)
+        self.timestamps.append(timestamp)
+        self.correct.append(1 if correct else 0)
+        self.response_ms.append(response_ms)
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "ab")
+        self._file.write(RECORD.pack(card_id, timestamp, 1 if correct else 0, response_ms))
+        if flush:
+            self._file.flush()
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,379 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import signal
+import sys
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+from answers import AnswerIndex
+from card_queue import CardQueue, OverlayQueue
+from card_store import CardStore, OverlayProgress
+from distractors import DistractorEngine
+from journal import ProgressJournal
+from review_log import ReviewLog
+from session import QuizSession, parse_scope
+from srs import DailyBudget, DueForecast, SchedulePolicy
+from stats import compute_stats
+from storage import open_storage
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Streamlit ile aynı kullanıcı dosyaları: progress/<kullanıcı>.jsonl ve .reviews.bin
+PROGRESS_DIR = "progress"
+# Bellekte tutulan en fazla kullanıcı; fazlası (kaydedildikten sonra) atılır
+MAX_USERS = 10_000
+# Bekleyen ilerleme bu aralıkla toplu yazılır (write-behind)
+FLUSH_INTERVAL = 1.0
+MAX_BODY = 64 * 1024
+
+STATUS_TEXT = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large"}
+
+
+def rss_mb():
+    # Sürecin güncel bellek kullanımı (Linux); başka sistemlerde en yüksek değer
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bayt
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def safe_user(name):
+    # Dosya adı için güvenli kullanıcı adı (streamlit_app.current_user ile aynı kural)
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name or "default")[:64] or "default"
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class UserState:
+    # Tek öğrencinin oturumu: paylaşılan kelimeler üzerinde seyrek ilerleme
+    # katmanı, kendi kuyruğu, günlük limitleri ve dosyaları
+    def __init__(self, server, user):
+        base = server.base
+        self.deck = CardStore(base.vocab, OverlayProgress(base.progress))
+        self.journal = ProgressJournal(os.path.join(server.progress_dir, f"{user}.jsonl"))
+        for card_id, record in self.journal.replay().items():
+            card = self.deck.by_id(card_id)
+            if card is not None:
+                card.apply_progress(record)
+        self.reviews = ReviewLog(os.path.join(server.progress_dir, f"{user}.reviews.bin"))
+        # Paylaşılan kuyruk salt okunur; kullanıcının değiştirdiği kartlar
+        # seyrek katmanda (OverlayQueue) tutulur, bellek deste boyutuyla
+        # büyümez. Vade tahmini gün başına bir sayaç, kopyası küçük.
+        self.deck.queue = OverlayQueue(server.queue)
+        forecast = server.forecast.copy()
+        base_reviews = base.progress.next_review
+        for index in self.deck.progress.changes:
+            self.deck.sync(index)
+            forecast.move(base_reviews[index], self.deck.progress.next_review[index])
+        self.deck.policy = SchedulePolicy(forecast)
+        budget = DailyBudget()
+        budget.load_log(self.reviews)
+        # Değişen kartlar burada birikir, QuizServer.flush diske yazar
+        self.pending = {}
+        self.session = QuizSession(self.deck, server.distractors, budget, self.reviews,
+                                   save=self.mark, flush_reviews=False, answers=server.answers)
+
+    def mark(self, card):
+        self.pending[card.index] = card
+
+    def take_pending(self):
+        # Yazılacak kayıtlar olay döngüsünde hazırlanır; dosya işi ayrı iş parçacığında
+        records = [card.progress_dict() for card in self.pending.values()]
+        self.pending = {}
+        rewrite = None
+        changes = self.deck.progress.changes
+        if self.journal.count + len(records) > max(100, 4 * len(changes)):
+            rewrite = [self.deck[i].progress_dict() for i in changes]
+        return records, rewrite
+
+    def write(self, records, rewrite):
+        if rewrite is not None:
+            self.journal.rewrite(rewrite)
+        elif records:
+            self.journal.append_many(records)
+        self.reviews.flush()
+
+    def close(self):
+        self.journal.close()
+        self.reviews.close()
+
+
+class QuizServer:
+    # asyncio üzerinde küçük bir HTTP/1.1 + JSON sunucusu. Kelimeler ve şık
+    # havuzları süreç başına bir kez yüklenir; kullanıcı durumu ilk istekte
+    # oluşturulur ve en uzun süredir kullanılmayan kullanıcılar bellekten atılır.
+    #
+    #   GET  /api/next?user=ad     -> {"id", "verb", "category", "options"} ya da {"done": true}
+    #        &category=Travel[:10]    oturumu kategorilere daraltır (kota isteğe bağlı)
+    #   POST /api/answer?user=ad   {"id": .., "answer": ".."} -> sonuç
+    #        {"id": .., "text": ".."}  yazılı cevap (bkz. answers.py)
+    #   GET  /api/stats?user=ad    -> stats.compute_stats
+    #   GET  /api/categories       -> {kategori: kart sayısı}
+    #   GET  /api/health
+    def __init__(self, deck_path=None, progress_dir=PROGRESS_DIR, max_users=MAX_USERS,
+                 flush_interval=FLUSH_INTERVAL):
+        storage = open_storage(deck_path)
+        try:
+            self.base = storage.load_store() if storage.exists() else CardStore()
+        finally:
+            storage.close()
+        self.distractors = DistractorEngine(self.base.vocab)
+        self.answers = AnswerIndex(self.base.vocab)
+        self.queue = CardQueue(self.base.queue_items())
+        self.forecast = DueForecast(self.base.progress.next_review)
+        self.progress_dir = progress_dir
+        os.makedirs(progress_dir, exist_ok=True)
+        self.max_users = max_users
+        self.flush_interval = flush_interval
+        self.users = OrderedDict()
+        # Aynı anda tek flush: kapanıştaki son flush süren yazmayı bekler
+        self.flush_lock = asyncio.Lock()
+        self.requests = 0
+        self.started = time.time()
+
+    def user(self, query):
+        name = safe_user(query.get("user", ["default"])[0])
+        state = self.users.get(name)
+        if state is None:
+            state = self.users[name] = UserState(self, name)
+        else:
+            self.users.move_to_end(name)
+        return state
+
+    # --- Uç noktalar ---
+
+    def next_card(self, query, body):
+        session = self.user(query).session
+        if "category" in query:
+            # ?category=Travel&category=Work:10 oturumu daraltır, boş değer kaldırır
+            scope = parse_scope(query["category"])
+            if scope != session.scope:
+                session.set_scope(scope)
+        question = session.next_question()
+        if question is None:
+            return {"done": True, "finished": session.finished, "total": len(self.base)}
+        card = question.card
+        return {"id": card.id, "verb": card.verb, "category": card.category,
+                "options": question.options}
+
+    def answer(self, query, body):
+        session = self.user(query).session
+        question = session.current
+        if question is None:
+            raise HTTPError(409, "no open question")
+        if body.get("id", question.card.id) != question.card.id:
+            raise HTTPError(409, "answer does not match the current question")
+        if isinstance(body.get("text"), str):
+            result = session.submit_text(body["text"])
+        elif isinstance(body.get("answer"), str):
+            result = session.submit(body["answer"])
+        else:
+            raise HTTPError(400, "answer or text is required")
+        card = result["card"]
+        response = {"id": card.id, "correct": result["correct"], "expected": result["expected"],
+                    "sentence": card.sentence, "correct_count": card.correct_count,
+                    "next_review": card.next_review}
+        if "typos" in result:
+            confused = result["confused"]
+            response["typos"] = result["typos"]
+            response["confused"] = None if confused is None else confused.verb
+        return response
+
+    def stats(self, query, body):
+        state = self.user(query)
+        return compute_stats(state.deck, state.reviews)
+
+    def categories(self, query, body):
+        return {name: len(ids) for name, ids in sorted(self.base.deck_index.categories.items())}
+
+    def health(self, query, body):
+        rss = rss_mb()
+        return {"ok": True, "cards": len(self.base), "users": len(self.users),
+                "requests": self.requests, "uptime": round(time.time() - self.started, 1),
+                "rss_mb": None if rss is None else round(rss, 1)}
+
+    ROUTES = {
+        ("GET", "/api/next"): next_card,
+        ("POST", "/api/answer"): answer,
+        ("GET", "/api/stats"): stats,
+        ("GET", "/api/categories"): categories,
+        ("GET", "/api/health"): health,
+    }
+
+    # --- HTTP ---
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    self.respond(writer, 400, {"error": "bad Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    self.respond(writer, 413, {"error": "body too large"}, False)
+                    break
+                raw = await reader.readexactly(length) if length else b""
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version == "HTTP/1.1")
+                status, payload = self.dispatch(method, target, raw)
+                self.respond(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, method, target, raw):
+        self.requests += 1
+        if method == "OPTIONS":
+            # CORS ön kontrolü (web-app başka bir porttan çağırır)
+            return 204, None
+        url = urlsplit(target)
+        route = self.ROUTES.get((method, url.path))
+        if route is None:
+            known = any(path == url.path for _, path in self.ROUTES)
+            return (405, {"error": "method not allowed"}) if known else (404, {"error": "not found"})
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return 400, {"error": "invalid JSON"}
+        if not isinstance(body, dict):
+            return 400, {"error": "JSON object expected"}
+        try:
+            # Uç başına süre histogramı (KELIME_METRICS, bkz. metrics.py)
+            with metrics.timer("server" + url.path):
+                return 200, route(self, parse_qs(url.query), body)
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+
+    def respond(self, writer, status, payload, keep_alive):
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Access-Control-Allow-Origin: *\r\n"
+                "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                "Access-Control-Allow-Headers: Content-Type\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+
+    # --- Kalıcılık ---
+
+    async def flush(self):
+        # Bekleyen ilerlemeyi tek seferde yaz; dosya işi olay döngüsünü bloklamaz
+        async with self.flush_lock:
+            batch = []
+            for state in self.users.values():
+                if state.pending:
+                    batch.append((state,) + state.take_pending())
+            if batch:
+                loop = asyncio.get_running_loop()
+                with metrics.timer("flush"):
+                    write = loop.run_in_executor(None, self.write_batch, batch)
+                    try:
+                        await asyncio.shield(write)
+                    except asyncio.CancelledError:
+                        # İptal iş parçacığını durdurmaz: yazma bitmeden kilit
+                        # bırakılmasın, dosyalar kapatılmasın
+                        await write
+                        raise
+            # Fazla kullanıcıları at (yazılacak kaydı olmayanlar)
+            while len(self.users) > self.max_users:
+                name, state = next(iter(self.users.items()))
+                if state.pending:
+                    break
+                del self.users[name]
+                state.close()
+
+    @staticmethod
+    def write_batch(batch):
+        for state, records, rewrite in batch:
+            state.write(records, rewrite)
+
+    async def flush_forever(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            metrics.METRICS.maybe_export()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        flusher = asyncio.create_task(self.flush_forever())
+        # Ctrl+C / SIGTERM: bekleyen ilerlemeyi yazıp temiz çık
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):  # Windows
+                pass
+        print(f"{len(self.base)} kelime, http://{host}:{port}/api/health", flush=True)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            await self.flush()
+            for state in self.users.values():
+                state.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-user JSON quiz server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--deck", help="deck file (default: KELIME_DATA or verbs.json)")
+    parser.add_argument("--progress-dir", default=PROGRESS_DIR)
+    parser.add_argument("--max-users", type=int, default=MAX_USERS)
+    args = parser.parse_args()
+
+    metrics.install()
+    server = QuizServer(args.deck, args.progress_dir, args.max_users)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+import random
+import threading
+import time
+from collections import deque
+
+import metrics
+from answers import distance, normalize, typo_limit
+from card_queue import CategoryQueue
+from srs import DailyBudget
+
+# SessionPlanner: bir seferde planlanan soru sayısı, arka planda yeniden
+# doldurma eşiği ve planın geçerlilik süresi (saniye; bu sürede vakti gelen
+# kartlar bir sonraki planda öne alınır)
+PLAN_SIZE = 20
+PLAN_LOW = 5
+PLAN_TTL = 120.0
+
+
+def parse_scope(tokens):
+    # ["Travel:10", "Work"] -> {"Travel": 10, "Work": None}; boşsa None (tüm deste)
+    scope = {}
+    for token in tokens:
+        name, _, quota = token.strip().partition(":")
+        name = name.strip()
+        if name:
+            scope[name] = int(quota) if quota.strip().isdigit() else None
+    return scope or None
+
+
+class Question:
+    # Sorulan kart, karıştırılmış şıklar ve gösterilme zamanı. Boşluk doldurma
+    # sorusunda prompt boşluklu cümle, expected boşluğa gelen (çekimli) fiildir;
+    # normal soruda prompt None, expected kartın Türkçe anlamı.
+    __slots__ = ("card", "options", "shown_at", "prompt", "expected")
+
+    def __init__(self, card, options, shown_at, prompt=None, expected=None):
+        self.card = card
+        self.options = options
+        self.shown_at = shown_at
+        self.prompt = prompt
+        self.expected = card.turkish if expected is None else expected
+
+
+class QuizSession:
+    # Arayüzden bağımsız oyun döngüsü: next_question() -> şıklar -> submit().
+    # Terminal oyunu, Streamlit ve benchmarks/simulate.py aynı kuralları kullanır;
+    # ekrana yazmak ve girdi almak çağırana kalır.
+    #   deck: kuyruğu ve politikası kurulmuş CardStore
+    #   distractors: DistractorEngine
+    #   reviews: ReviewLog (isteğe bağlı), save: cevaptan sonra çağrılır (kart)
+    #   clock: zaman kaynağı; simülasyonda sanal saat verilir
+    #   flush_reviews: False ise cevap günlüğü toplu yazılır (server.py)
+    #   answers: AnswerIndex; verilirse submit_text ile yazılı cevap kabul edilir
+    #   typed: True ise şıklar hiç üretilmez (sadece yazılı cevap)
+    #   cloze: ClozeIndex; verilirse örnek cümlede fiil boşluğa çevrilerek sorulur
+    def __init__(self, deck, distractors, budget=None, reviews=None, save=None,
+                 hard=False, clock=time.time, rng=random, flush_reviews=True,
+                 answers=None, typed=False, cloze=None):
+        self.deck = deck
+        self.distractors = distractors
+        self.budget = budget if budget is not None else DailyBudget()
+        self.reviews = reviews
+        self.save = save
+        self.hard = hard
+        self.clock = clock
+        self.rng = rng
+        self.flush_reviews = flush_reviews
+        self.answers = answers
+        self.typed = typed
+        self.cloze = cloze
+        self.current = None
+
+    def set_scope(self, scope):
+        # Oturumu kategorilere daralt: None (tüm deste), kategori listesi ya da
+        # {kategori: kota}. Kategori kuyrukları ilk daraltmada bir kez kurulur.
+        queue = self.deck.queue
+        if not isinstance(queue, CategoryQueue):
+            if not scope:
+                return
+            queue = self.deck.queue = CategoryQueue(queue, self.deck.progress,
+                                                    self.deck.vocab.categories, self.clock())
+        queue.set_scope(scope)
+
+    @property
+    def scope(self):
+        return getattr(self.deck.queue, "scope", None)
+
+    @property
+    def finished(self):
+        # Kotalı oturumda tüm kotalar doldu mu
+        return getattr(self.deck.queue, "finished", False)
+
+    def select_card(self, now=None):
+        # Öncelik: vakti gelmiş (SRS) -> yeni kelimeler -> ağırlıklı rastgele
+        # Sıralama CardQueue içinde O(log n) ile yapılır; günlük limit dolan
+        # grup (yeni / tekrar) seçime girmez
+        now = self.clock() if now is None else now
+        position = self.deck.queue.select(now, allow_new=self.budget.allow_new(now),
+                                          allow_review=self.budget.allow_review(now))
+        if position is None:
+            return None
+        return self.deck[position]
+
+    def options(self, card):
+        # Rastgele 3 farklı Türkçe anlam (eş anlamlılar ve tekrarlar hariç)
+        options = self.distractors.sample(card.index, 3, hard=self.hard) + [card.turkish]
+        self.rng.shuffle(options)
+        return options
+
+    def make_question(self, card, now):
+        # Cümlesinde fiil bulunamayan kart boşluk doldurma modunda da normal sorulur
+        with metrics.timer("options"):
+            blank = None if self.cloze is None else self.cloze.blank(card.index)
+            if blank is None:
+                return Question(card, [] if self.typed else self.options(card), now)
+            options = []
+            if not self.typed:
+                # Aynı cümle bağlamına uyan fiiller, doğru cevapla aynı çekimde
+                options = self.cloze.distractors(card.index, 3)
+                if len(options) < 3:
+                    # Çok küçük deste: yeterli çeldirici yok
+                    return Question(card, self.options(card), now)
+                options.append(blank.text)
+                self.rng.shuffle(options)
+            return Question(card, options, now, self.cloze.prompt(card.index), blank.text)
+
+    def next_question(self):
+        # Kart kalmadıysa (boş deste ya da günlük limit) None
+        now = self.clock()
+        with metrics.timer("select"):
+            card = self.select_card(now)
+        if card is None:
+            self.current = None
+            return None
+        self.current = self.make_question(card, now)
+        return self.current
+
+    def submit(self, answer):
+        # answer: seçilen şık metni. Sonuç sözlüğü döner; aynı soru iki kez
+        # cevaplanamaz (Streamlit'te çift tıklama)
+        question = self.current
+        if question is None:
+            return None
+        return self._record(question, answer, answer == question.expected)
+
+    def submit_text(self, text):
+        # Yazılı cevap: AnswerIndex ile Türkçe harf / aksan / küçük yazım
+        # hatası toleranslı eşleşme. Sonuçta ayrıca typos (kabul edilen harf
+        # hatası) ve confused (cevap başka bir kartın anlamıysa o kart) olur.
+        # Boşluk doldurmada cevap boşluğa gelen İngilizce fiille karşılaştırılır.
+        question = self.current
+        if question is None:
+            return None
+        if question.prompt is not None:
+            with metrics.timer("check"):
+                typos = distance(normalize(text), question.expected)
+            correct = typos <= typo_limit(question.expected)
+            result = self._record(question, text, correct)
+            result["typos"] = typos if correct else 0
+            result["confused"] = None
+            return result
+        with metrics.timer("check"):
+            match = self.answers.check(question.card.index, text)
+        result = self._record(question, text, match.correct)
+        result["typos"] = match.typos
+        result["confused"] = None if match.confused is None else self.deck[match.confused]
+        return result
+
+    def _record(self, question, answer, is_correct):
+        self.current = None
+        card = question.card
+        now = self.clock()
+        response_ms = (now - question.shown_at) * 1000
+        if self.reviews is not None:
+            self.reviews.append(card.id, now, is_correct, response_ms, flush=self.flush_reviews)
+        self.budget.record(card.next_review <= 0, now)
+        card.update_weight(is_correct, now)
+        if self.save is not None:
+            with metrics.timer("save"):
+                self.save(card)
+        # Öğrencinin cevap süresi de aynı histogram biçiminde
+        metrics.observe("answer", response_ms / 1000)
+        metrics.incr("answers")
+        metrics.incr("correct" if is_correct else "wrong")
+        return {
+            "card": card,
+            "answer": answer,
+            "correct": is_correct,
+            "expected": question.expected,
+            "response_ms": response_ms,
+        }
+
+
+class SessionPlanner:
+    # QuizSession'ın önüne konan soru planı (Streamlit): sonraki PLAN_SIZE soru
+    # (kart + karıştırılmış şıklar) tek geçişte seçilir, her tıklamada sadece
+    # plandan bir soru alınır. Cevaplanan kartın plandaki girdisi atılır
+    # (aralığı değişti); günlük yeni / tekrar limiti dolunca plan
+    # yeniden kurulur. Plan PLAN_LOW altına inince prefetch() yeni
+    # partiyi arka plandaki bir iş parçacığında hazırlar. Kuyruk ve ilerleme
+    # sütunlarına tüm erişim self.lock altında yapılır.
+    def __init__(self, session, size=PLAN_SIZE, low=PLAN_LOW, ttl=PLAN_TTL):
+        self.session = session
+        self.size = size
+        self.low = low
+        self.ttl = ttl
+        self.plan = deque()         # Question (gösterilme zamanı alınınca güncellenir)
+        self.planned = set()
+        self.planned_at = 0.0
+        self.limits = None          # planlandığı andaki (allow_new, allow_review)
+        self.lock = threading.Lock()
+        self._worker = None
+
+    @property
+    def scope(self):
+        return self.session.scope
+
+    @property
+    def finished(self):
+        with self.lock:
+            return not self.plan and self.session.finished
+
+    def set_scope(self, scope):
+        with self.lock:
+            # Eski kapsamın planı geçersiz; sayaçlar set_scope ile sıfırlanır
+            self._clear(release=False)
+            self.session.set_scope(scope)
+
+    def _clear(self, release=True):
+        if release:
+            for question in self.plan:
+                self._release(question.card.index)
+        self.plan.clear()
+        self.planned.clear()
+
+    def _release(self, position):
+        release = getattr(self.session.deck.queue, "release", None)
+        if release is not None:
+            release(position)
+
+    def fill(self, now=None):
+        # Planı PLAN_SIZE'a tamamla; aynı kart planda iki kez yer almaz
+        with self.lock:
+            self._fill(self.session.clock() if now is None else now)
+
+    def _fill(self, now):
+        session = self.session
+        if now - self.planned_at > self.ttl:
+            self._clear()
+        self.limits = self._limits(now)
+        if not self.plan:
+            # En eski girdinin planlandığı zaman
+            self.planned_at = now
+        with metrics.timer("plan"):
+            misses = 0
+            while len(self.plan) < self.size and misses < 3:
+                card = session.select_card(now)
+                if card is None:
+                    break
+                if card.index in self.planned:
+                    # Küçük havuz (az sayıda vakti gelmiş kart): planı kısa tut
+                    self._release(card.index)
+                    misses += 1
+                    continue
+                self.plan.append(session.make_question(card, now))
+                self.planned.add(card.index)
+
+    def set_cloze(self, cloze):
+        # Soru türü değişti (boşluk doldurma açıldı / kapandı): plan yeniden kurulur
+        with self.lock:
+            self._clear()
+            self.session.cloze = cloze
+
+    def prefetch(self, background=True):
+        # Plan azaldıysa yeni partiyi hazırla (sayfa çizildikten sonra çağrılır)
+        if len(self.plan) >= self.low or (self._worker is not None and self._worker.is_alive()):
+            return
+        if not background:
+            self.fill()
+            return
+        self._worker = threading.Thread(target=self.fill, name="planner", daemon=True)
+        self._worker.start()
+
+    def next_question(self):
+        with self.lock:
+            session = self.session
+            now = session.clock()
+            # Planlandıktan sonra dolan günlük limit (yeni / tekrar) seçimi
+            # değiştirir; plan güncel limitlerle yeniden kurulur
+            if self.plan and self._limits(now) != self.limits:
+                self._clear()
+            if not self.plan or now - self.planned_at > self.ttl:
+                self._fill(now)
+            if not self.plan:
+                session.current = None
+                return None
+            question = self.plan.popleft()
+            self.planned.discard(question.card.index)
+            question.shown_at = now
+            session.current = question
+            return question
+
+    def _limits(self, now):
+        budget = self.session.budget
+        return budget.allow_new(now), budget.allow_review(now)
+
+    def submit(self, answer):
+        with self.lock:
+            result = self.session.submit(answer)
+            if result is not None:
+                self._invalidate(result["card"].index)
+            return result
+
+    def submit_text(self, text):
+        with self.lock:
+            result = self.session.submit_text(text)
+            if result is not None:
+                self._invalidate(result["card"].index)
+            return result
+
+    def _invalidate(self, position):
+        # Soru ekrandayken yapılan ön planlama aynı kartı plana almış olabilir;
+        # aralığı değişen kartın o girdisi artık geçerli değil
+        if position not in self.planned:
+            return
+        self.planned.discard(position)
+        self.plan = deque(question for question in self.plan if question.card.index != position)
+        self._release(position)
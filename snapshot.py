@@ -0,0 +1,53 @@
+import os
+import pickle
+
+from card_store import PROGRESS_FIELDS, CardStore, Progress, Vocabulary
+from persistence import atomic_write
+
+# Biçim değişirse artırılır; eski snapshot'lar yok sayılıp yeniden üretilir
+SNAPSHOT_VERSION = 1
+VOCAB_COLUMNS = ("ids", "verbs", "turkish", "sentences", "categories")
+
+
+def snapshot_path(path):
+    # verbs.json -> verbs.snapshot (deste dosyasının yanında)
+    return os.path.splitext(path)[0] + ".snapshot"
+
+
+def source_key(path):
+    # Deste dosyası değişti mi? Boyut + değişiklik zamanı (içeriği okumadan)
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def save_snapshot(path, store):
+    # Destenin sütunları tek bir pickle dosyasına yazılır (array'ler ham
+    # bayt olarak); JSON ayrıştırmaktan ve kartları tek tek kurmaktan çok hızlı.
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "source": source_key(path),
+        "vocab": {column: getattr(store.vocab, column) for column in VOCAB_COLUMNS},
+        "progress": {field: getattr(store.progress, field) for field in PROGRESS_FIELDS},
+    }
+    atomic_write(snapshot_path(path), lambda f: pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL),
+                 binary=True)
+
+
+def load_snapshot(path):
+    # Güncel bir snapshot varsa CardStore, yoksa (ya da bozuksa) None.
+    # Snapshot yerel bir önbellektir; başka yerden gelen dosyalar açılmamalı.
+    try:
+        with open(snapshot_path(path), "rb") as f:
+            data = pickle.load(f)
+        if (data["version"] != SNAPSHOT_VERSION or tuple(data["source"]) != source_key(path)
+                or set(data["progress"]) != set(PROGRESS_FIELDS)):
+            return None
+    except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError, AttributeError):
+        return None
+    vocab = Vocabulary()
+    for column in VOCAB_COLUMNS:
+        setattr(vocab, column, data["vocab"][column])
+    progress = Progress()
+    for field in PROGRESS_FIELDS:
+        setattr(progress, field, data["progress"][field])
+    return CardStore(vocab, progress)
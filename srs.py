@@ -0,0 +1,318 @@
+import math
+import os
+import random
+import time
+from collections import Counter
+from datetime import datetime
+
+from stats import DAY, day_start
+
+# Aralıklar (saniye): 1. doğru 1 dk, 2. doğru 10 dk, 3. doğru 1 gün, sonra ikiye katla
+LEARNING_STEPS = (60, 600)
+MAX_INTERVAL_DAYS = 365
+# Gün cinsinden aralıklar ±%10 (en az 1 gün) oynatılır, aynı gün öğrenilen
+# kartlar aynı güne yığılmaz
+FUZZ_FACTOR = 0.1
+# Kullanılan algoritma: heuristic, sm2 ya da fsrs
+DEFAULT_ALGORITHM = os.environ.get("KELIME_SRS", "heuristic")
+DEFAULT_EASE = 2.5
+# Günlük limitler: yeni kart sayısı ve tekrar sayısı
+NEW_PER_DAY = 20
+REVIEWS_PER_DAY = 200
+
+# Yerel saat farkı; gün numarası hesaplamak için (datetime'dan çok daha hızlı)
+_UTC_OFFSET = datetime.now().astimezone().utcoffset().total_seconds()
+
+
+def day_number(timestamp):
+    return int((timestamp + _UTC_OFFSET) // DAY)
+
+
+def base_interval(correct_count):
+    # Doğru sayısına göre ham aralık (saniye), MAX_INTERVAL_DAYS ile sınırlı
+    if correct_count <= 0:
+        return 0
+    if correct_count <= len(LEARNING_STEPS):
+        return LEARNING_STEPS[correct_count - 1]
+    # Üs sınırlanır; çok büyük correct_count taşma yapmasın
+    exponent = min(correct_count - 3, MAX_INTERVAL_DAYS.bit_length())
+    return min(DAY * (2 ** exponent), DAY * MAX_INTERVAL_DAYS)
+
+
+class DueForecast:
+    # Gün numarası -> o gün vadesi gelecek kart sayısı. Deste yüklenirken bir
+    # kez hesaplanır, her yeniden planlamada artımlı güncellenir.
+    def __init__(self, next_reviews=()):
+        self.days = Counter(day_number(ts) for ts in next_reviews if ts > 0)
+
+    def copy(self):
+        clone = DueForecast()
+        clone.days = self.days.copy()
+        return clone
+
+    def move(self, old, new):
+        if old > 0:
+            day = day_number(old)
+            self.days[day] -= 1
+            if self.days[day] <= 0:
+                del self.days[day]
+        if new > 0:
+            self.days[day_number(new)] += 1
+
+    def counts(self, now=None, days=7):
+        # Bugünden itibaren günlük vade sayıları (gecikmişler bugüne eklenir)
+        today = day_number(time.time() if now is None else now)
+        result = [self.days.get(today + i, 0) for i in range(days)]
+        result[0] += sum(count for day, count in self.days.items() if day < today)
+        return result
+
+
+class DailyBudget:
+    # Günlük yeni kart ve tekrar limitleri
+    def __init__(self, new_limit=NEW_PER_DAY, review_limit=REVIEWS_PER_DAY):
+        self.new_limit = new_limit
+        self.review_limit = review_limit
+        self.day = None
+        self.new_done = 0
+        self.reviews_done = 0
+
+    def _roll(self, now):
+        today = day_number(now)
+        if today != self.day:
+            self.day = today
+            self.new_done = 0
+            self.reviews_done = 0
+
+    def load_log(self, log, now=None):
+        # Bugünkü sayaçları cevap geçmişinden çıkar (ilk kez görülen kart = yeni)
+        now = time.time() if now is None else now
+        self._roll(now)
+        today = day_start(now)
+        seen = set()
+        for card_id, timestamp in zip(log.card_ids, log.timestamps):
+            if timestamp >= today:
+                if card_id in seen:
+                    self.reviews_done += 1
+                else:
+                    self.new_done += 1
+            seen.add(card_id)
+
+    def allow_new(self, now=None):
+        self._roll(time.time() if now is None else now)
+        return self.new_done < self.new_limit
+
+    def allow_review(self, now=None):
+        self._roll(time.time() if now is None else now)
+        return self.reviews_done < self.review_limit
+
+    def record(self, was_new, now=None):
+        self._roll(time.time() if now is None else now)
+        if was_new:
+            self.new_done += 1
+        else:
+            self.reviews_done += 1
+
+
+# --- Algoritmalar ---
+# Her algoritma kart başına iki sayı tutar (Progress.ease ve Progress.stability):
+#   heuristic: kullanılmaz (stability = son aralık, gün)
+#   sm2:       ease = kolaylık katsayısı (EF), stability = son aralık (gün)
+#   fsrs:      ease = zorluk (1-10), stability = kararlılık (gün)
+# Algoritma değiştirilince alanlar reschedule_deck ile yeniden hesaplanmalıdır.
+
+class HeuristicAlgorithm:
+    # Oyunun ilk sürümündeki kural: 1 dk, 10 dk, 1 gün, sonra ikiye katla
+    name = "heuristic"
+
+    def review(self, correct_count, ease, stability, elapsed_days, correct):
+        # (aralık saniye, yeni ease, yeni stability); correct_count güncellenmiş değer
+        interval = base_interval(correct_count) if correct else 0
+        return interval, ease, interval / DAY
+
+    def initial(self, correct_count):
+        # Sadece doğru sayısından durum (toplu yeniden planlama için)
+        interval = base_interval(correct_count)
+        return interval, DEFAULT_EASE, interval / DAY
+
+
+class SM2Algorithm:
+    # SuperMemo-2: doğru = kalite 4 (EF değişmez), yanlış = kalite 1.
+    # İlk iki doğru öğrenme adımlarıdır (1 dk, 10 dk), sonra 1 gün, 6 gün, aralık * EF.
+    name = "sm2"
+    MIN_EASE = 1.3
+
+    def review(self, correct_count, ease, stability, elapsed_days, correct):
+        if not correct:
+            # EF' = EF + 0.1 - (5 - q) * (0.08 + (5 - q) * 0.02), q = 1
+            return 0, max(self.MIN_EASE, ease - 0.54), 0.0
+        if correct_count <= len(LEARNING_STEPS):
+            return LEARNING_STEPS[correct_count - 1], ease, 0.0
+        graduated = correct_count - len(LEARNING_STEPS)
+        if graduated == 1 or stability <= 0:
+            days = 1.0
+        elif graduated == 2:
+            days = 6.0
+        else:
+            days = stability * ease
+        return days * DAY, ease, days
+
+    def initial(self, correct_count):
+        interval, ease, stability = 0, DEFAULT_EASE, 0.0
+        for count in range(1, correct_count + 1):
+            interval, ease, stability = self.review(count, ease, stability, stability, True)
+            if stability >= MAX_INTERVAL_DAYS:
+                break
+        return interval, ease, stability
+
+
+class FSRSAlgorithm:
+    # FSRS v4 tarzı model: kararlılık (S) ve zorluk (D) ile hatırlama olasılığı
+    # R = (1 + t / 9S)^-1; hedef hatırlama %90 için aralık = S gün.
+    # Cevaplar ikili olduğundan doğru = "Good" (3), yanlış = "Again" (1).
+    name = "fsrs"
+    W = (0.4, 0.6, 2.4, 5.8, 4.93, 0.94, 0.86, 0.01, 1.49, 0.14, 0.94,
+         2.18, 0.05, 0.34, 1.26, 0.29, 2.61)
+
+    def initial_difficulty(self, grade):
+        return min(10.0, max(1.0, self.W[4] - (grade - 3) * self.W[5]))
+
+    def retrievability(self, elapsed_days, stability):
+        return (1 + elapsed_days / (9 * stability)) ** -1
+
+    def review(self, correct_count, ease, stability, elapsed_days, correct):
+        w = self.W
+        if not correct:
+            if stability <= 0:
+                return 0, self.initial_difficulty(1), w[0]
+            r = self.retrievability(elapsed_days, stability)
+            stability = (w[11] * ease ** -w[12] * ((stability + 1) ** w[13] - 1)
+                         * math.exp(w[14] * (1 - r)))
+            return 0, min(10.0, ease + 2 * w[6]), stability
+        if correct_count <= len(LEARNING_STEPS):
+            return LEARNING_STEPS[correct_count - 1], ease, stability
+        if stability <= 0:
+            # İlk mezuniyet: S0(Good), D0(Good)
+            stability, ease = w[2], self.initial_difficulty(3)
+        else:
+            r = self.retrievability(elapsed_days, stability)
+            stability *= 1 + (math.exp(w[8]) * (11 - ease) * stability ** -w[9]
+                              * (math.exp(w[10] * (1 - r)) - 1))
+            # Ortalamaya dönüş (Good için zorluk değişmez)
+            ease = w[7] * self.initial_difficulty(3) + (1 - w[7]) * ease
+        return stability * DAY, ease, stability
+
+    def initial(self, correct_count):
+        interval, ease, stability = 0, DEFAULT_EASE, 0.0
+        for count in range(1, correct_count + 1):
+            interval, ease, stability = self.review(count, ease, stability, stability, True)
+            if stability >= MAX_INTERVAL_DAYS:
+                break
+        return interval, ease, stability
+
+
+ALGORITHMS = {cls.name: cls for cls in (HeuristicAlgorithm, SM2Algorithm, FSRSAlgorithm)}
+
+
+def get_algorithm(name=None):
+    name = name or DEFAULT_ALGORITHM
+    if name not in ALGORITHMS:
+        raise ValueError(f"Bilinmeyen SRS algoritması: {name} ({', '.join(ALGORITHMS)})")
+    return ALGORITHMS[name]()
+
+
+class SchedulePolicy:
+    # Algoritma + üst sınır + fuzz + yük dengeleme. Gün cinsinden aralıklarda
+    # fuzz aralığındaki günlerden vadesi en az olanı seçilir.
+    def __init__(self, forecast=None, fuzz=FUZZ_FACTOR, algorithm=None):
+        self.forecast = forecast if forecast is not None else DueForecast()
+        self.fuzz = fuzz
+        self.algorithm = algorithm if algorithm is not None else get_algorithm()
+
+    def review(self, card, correct, now):
+        # Kartın ease/stability alanlarını günceller ve yeni vadeyi döndürür.
+        # card.correct_count bu cevaba göre güncellenmiş olmalıdır.
+        previous = card.next_review
+        elapsed = (now - card.last_reviewed) / DAY if card.last_reviewed > 0 else 0.0
+        interval, card.ease, card.stability = self.algorithm.review(
+            card.correct_count, card.ease, card.stability, elapsed, correct)
+        return self.place(interval, now, previous)
+
+    def place(self, interval, now, previous=0):
+        # Ham aralığı sınırla, gün cinsindeyse fuzz + yük dengeleme uygula ve
+        # vade tahminini güncelle; yeni vadeyi döndürür
+        interval = min(interval, MAX_INTERVAL_DAYS * DAY)
+        if interval >= DAY:
+            interval = self._balanced_days(int(round(interval / DAY)), now) * DAY
+        due = now + interval
+        self.forecast.move(previous, due)
+        return due
+
+    def _balanced_days(self, days, now):
+        spread = int(max(1, round(days * self.fuzz))) if days >= 2 and self.fuzz else 0
+        low = max(1, days - spread)
+        high = min(MAX_INTERVAL_DAYS, days + spread)
+        today = day_number(now)
+        load = self.forecast.days
+        candidates = list(range(low, high + 1))
+        random.shuffle(candidates)
+        return min(candidates, key=lambda d: load.get(today + d, 0))
+
+
+def reschedule_deck(progress, algorithm, now=None, policy=None):
+    # Tüm desteyi tek geçişte yeni algoritmaya taşır; cevaplar tek tek yeniden
+    # oynatılmaz. Durum sadece doğru sayısına bağlı olduğundan her farklı
+    # correct_count için bir kez hesaplanır, sonra sütunlara yazılır.
+    # Hiç doğru bilinmemiş kartların ease/stability alanları da algoritmanın
+    # varsayılanına döner (eski algoritmanın değerleri anlamsız). Aralıklar
+    # policy üzerinden fuzz + yük dengeleme ile yerleştirilir; policy'nin vade
+    # tahmini baştan kurulur, deste aynı günlere yığılmaz.
+    now = time.time() if now is None else now
+    if policy is None:
+        policy = SchedulePolicy(algorithm=algorithm)
+    policy.forecast.days.clear()
+    _, default_ease, default_stability = algorithm.initial(0)
+    cache = {}
+    changed = 0
+    counts = progress.correct_count
+    for index in range(len(counts)):
+        count = counts[index]
+        if count <= 0:
+            progress.ease[index] = default_ease
+            progress.stability[index] = default_stability
+            # Vadesi (yanlış cevaplanmış kart) aynen kalır
+            policy.forecast.move(0, progress.next_review[index])
+            continue
+        state = cache.get(count)
+        if state is None:
+            state = cache[count] = algorithm.initial(count)
+        interval, progress.ease[index], progress.stability[index] = state
+        base = progress.last_reviewed[index] or now
+        progress.next_review[index] = policy.place(interval, base)
+        changed += 1
+    return changed
+
+
+def main():
+    # Toplu yeniden planlama: python srs.py --algorithm sm2 [--deck verbs.json]
+    import argparse
+
+    from card_store import CardStore
+    from storage import DEFAULT_PATH, open_storage
+
+    parser = argparse.ArgumentParser(description="Reschedule a whole deck with another SRS algorithm.")
+    parser.add_argument("--algorithm", choices=sorted(ALGORITHMS), default=DEFAULT_ALGORITHM)
+    parser.add_argument("--deck", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    storage = open_storage(args.deck)
+    deck = CardStore.from_dicts(storage.load())
+    start = time.perf_counter()
+    changed = reschedule_deck(deck.progress, get_algorithm(args.algorithm))
+    elapsed = time.perf_counter() - start
+    storage.save_all([card.to_dict() for card in deck])
+    storage.close()
+    print(f"Rescheduled {changed} of {len(deck)} cards with {args.algorithm} in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import time
+from datetime import date, datetime
+
+# Bu kadar doğru cevaptan sonra kelime "öğrenildi" sayılır
+LEARNED_THRESHOLD = 5
+DAY = 86400
+
+
+def day_start(timestamp):
+    # Yerel saatle günün başlangıcı (gece yarısı)
+    return datetime.combine(date.fromtimestamp(timestamp), datetime.min.time()).timestamp()
+
+
+def compute_stats(deck, log=None, now=None, days=7):
+    # deck: CardStore, log: ReviewLog (isteğe bağlı).
+    # Deste sütunları ve cevap günlüğü birer kez taranır; terminal menüsü ve
+    # Streamlit istatistikleri aynı sonucu kullanır.
+    if now is None:
+        now = time.time()
+    today = day_start(now)
+
+    learned = in_progress = new = 0
+    # forecast[0]: bugün (gecikmişler dahil), forecast[i]: i gün sonra
+    forecast = [0] * days
+    progress = deck.progress
+    for count, next_review in zip(progress.correct_count, progress.next_review):
+        if count >= LEARNED_THRESHOLD:
+            learned += 1
+        elif count > 0:
+            in_progress += 1
+        else:
+            new += 1
+        # Hiç planlanmamış (next_review == 0) yeni kartlar tahmine girmez
+        if next_review > 0:
+            day = max(0, int((next_review - today) // DAY))
+            if day < days:
+                forecast[day] += 1
+
+    categories = {}         # kategori -> [doğru, toplam]
+    daily_reviews = [0] * days  # eskiden yeniye, son eleman bugün
+    correct_total = 0
+    response_total = 0
+    reviews = 0
+    if log is not None:
+        positions = deck.deck_index.positions
+        card_categories = deck.vocab.categories
+        for card_id, timestamp, correct, response_ms in zip(
+                log.card_ids, log.timestamps, log.correct, log.response_ms):
+            position = positions.get(card_id)
+            category = card_categories[position] if position is not None else "?"
+            entry = categories.get(category)
+            if entry is None:
+                entry = categories[category] = [0, 0]
+            entry[0] += correct
+            entry[1] += 1
+            ago = max(0, -int((timestamp - today) // DAY))
+            if ago < days:
+                daily_reviews[days - 1 - ago] += 1
+            correct_total += correct
+            response_total += response_ms
+            reviews += 1
+
+    total = len(deck)
+    return {
+        "total": total,
+        "learned": learned,
+        "in_progress": in_progress,
+        "new": new,
+        "learned_percent": learned / total * 100 if total else 0.0,
+        "due_today": forecast[0] if days else 0,
+        "forecast": forecast,
+        "reviews": reviews,
+        "accuracy": correct_total / reviews * 100 if reviews else 0.0,
+        "avg_response_ms": response_total / reviews if reviews else 0.0,
+        "daily_reviews": daily_reviews,
+        "category_accuracy": {
+            category: correct / count * 100 for category, (correct, count) in sorted(categories.items())
+        },
+    }
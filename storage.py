@@ -0,0 +1,278 @@
+import argparse
+import json
+import os
+import sqlite3
+
+from card_store import PROGRESS_FIELDS, CardStore
+from journal import ProgressJournal
+from persistence import atomic_write
+from snapshot import load_snapshot, save_snapshot
+from srs import DEFAULT_EASE
+
+# Deste dosyası; uzantısı .db/.sqlite ise SQLite arka ucu kullanılır
+DEFAULT_PATH = os.environ.get("KELIME_DATA", "verbs.json")
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+# JSON arka ucunda günlük en az bu kadar ve deste boyutu kadar kayda ulaşınca
+# desteye sıkıştırılır; tüm desteyi yazmanın maliyeti kayıt başına O(1) kalır
+COMPACT_EVERY = 200
+# KELIME_COMPACT_JSON=1: deste girintisiz yazılır (daha küçük, daha hızlı;
+# elle düzenlemek zorlaşır)
+JSON_INDENT = None if os.environ.get("KELIME_COMPACT_JSON") == "1" else 2
+
+CARD_FIELDS = ("id", "verb", "turkish", "sentence", "category") + PROGRESS_FIELDS
+CARD_DEFAULTS = {"category": "General", "correct_count": 0, "weight": 100,
+                 "last_reviewed": 0, "next_review": 0, "ease": DEFAULT_EASE, "stability": 0}
+
+
+def journal_path(path):
+    # verbs.json -> progress.jsonl (eski adı korur), diğerleri -> <ad>.progress.jsonl
+    if os.path.basename(path) == "verbs.json":
+        return os.path.join(os.path.dirname(path), "progress.jsonl")
+    return os.path.splitext(path)[0] + ".progress.jsonl"
+
+
+def reviews_path(path):
+    # Cevap geçmişi (review_log.ReviewLog): verbs.json -> reviews.bin
+    if os.path.basename(path) == "verbs.json":
+        return os.path.join(os.path.dirname(path), "reviews.bin")
+    return os.path.splitext(path)[0] + ".reviews.bin"
+
+
+class JsonStorage:
+    # Tek bir JSON dosyası + sadece-ekleme ilerleme günlüğü (progress.jsonl)
+    def __init__(self, path):
+        self.path = path
+        self.journal = ProgressJournal(journal_path(path))
+        # Son yüklenen / yazılan destedeki kart sayısı (sıkıştırma eşiği için)
+        self.cards = 0
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _read(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self, items, indent=JSON_INDENT):
+        # Geçici dosya + fsync + rename: yazma sırasında çökme desteyi bozmaz
+        separators = (",", ":") if indent is None else None
+        atomic_write(self.path, lambda f: json.dump(items, f, ensure_ascii=False, indent=indent,
+                                                    separators=separators))
+
+    def load(self):
+        items = self._read()
+        # Son sıkıştırmadan sonraki ilerlemeyi uygula
+        records = self.journal.replay()
+        if records:
+            for item in items:
+                record = records.pop(item["id"], None)
+                if record is not None:
+                    for field in PROGRESS_FIELDS:
+                        if field in record:
+                            item[field] = record[field]
+            # Kalan tam kayıtlar günlüğe eklenmiş yeni kartlardır
+            items.extend(record for record in records.values() if "verb" in record)
+        self.cards = len(items)
+        return items
+
+    def load_store(self):
+        # load() ile aynı içerik, doğrudan CardStore olarak. Deste dosyası son
+        # yüklemeden beri değişmediyse JSON yerine snapshot okunur.
+        store = load_snapshot(self.path)
+        if store is None:
+            store = CardStore.from_dicts(self._read())
+            self._save_snapshot(store)
+        for card_id, record in self.journal.replay().items():
+            card = store.by_id(card_id)
+            if card is not None:
+                card.apply_progress(record)
+            elif "verb" in record:
+                store.append(record)
+        self.cards = len(store)
+        return store
+
+    def _save_snapshot(self, store):
+        try:
+            save_snapshot(self.path, store)
+        except OSError:
+            # Snapshot sadece hızlandırır; yazılamazsa JSON'dan devam
+            pass
+
+    def iter_cards(self):
+        return iter(self.load())
+
+    @property
+    def needs_compaction(self):
+        return self.journal.count >= max(COMPACT_EVERY, self.cards)
+
+    def pending(self):
+        # Desteye henüz sıkıştırılmamış kayıt sayısı
+        return self.journal.count
+
+    def save_all(self, items, store=None):
+        # Tüm desteyi yaz ve günlüğü sıfırla. store: items ile aynı CardStore
+        # verilirse snapshot da güncellenir (sonraki açılış JSON okumaz)
+        self._write(items)
+        self.cards = len(items)
+        self.journal.clear()
+        if store is not None:
+            self._save_snapshot(store)
+
+    def save_progress(self, records):
+        self.journal.append_many(records)
+
+    def add_cards(self, items):
+        # Yeni kartlar da günlüğe eklenir, sıkıştırmada desteye yazılır
+        # (JSON destesini tek süreç yazar; id'ler olduğu gibi kalır)
+        if not self.exists():
+            self.save_all(list(items))
+            return
+        self.journal.append_many(items)
+        self.cards += len(items)
+
+    def compact(self):
+        if self.journal.count:
+            self.save_all(self.load())
+
+    def close(self):
+        self.journal.close()
+
+
+class SQLiteStorage:
+    # SQLite arka ucu: WAL modu sayesinde birden fazla süreç aynı desteyi
+    # güvenle paylaşabilir; ilerleme güncellemeleri tek satırlık UPDATE'lerdir.
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cards (
+            id INTEGER PRIMARY KEY,
+            verb TEXT NOT NULL,
+            turkish TEXT NOT NULL,
+            sentence TEXT NOT NULL,
+            category TEXT NOT NULL DEFAULT 'General',
+            correct_count INTEGER NOT NULL DEFAULT 0,
+            weight REAL NOT NULL DEFAULT 100,
+            last_reviewed REAL NOT NULL DEFAULT 0,
+            next_review REAL NOT NULL DEFAULT 0,
+            ease REAL NOT NULL DEFAULT 2.5,
+            stability REAL NOT NULL DEFAULT 0
+        );
+        -- Vade sırası bellekteki kuyrukta (card_queue.py) tutulur; ilerleme
+        -- sütunlarındaki indeksler hiçbir sorguda kullanılmadan her cevapta
+        -- güncelleniyordu, eski veritabanlarından da kaldırılır
+        DROP INDEX IF EXISTS idx_cards_next_review;
+        DROP INDEX IF EXISTS idx_cards_correct_count;
+        CREATE INDEX IF NOT EXISTS idx_cards_category ON cards(category);
+        CREATE INDEX IF NOT EXISTS idx_cards_verb ON cards(verb COLLATE NOCASE);
+    """
+    # Eski veritabanlarına sonradan eklenen sütunlar
+    MIGRATIONS = (
+        ("ease", "REAL NOT NULL DEFAULT 2.5"),
+        ("stability", "REAL NOT NULL DEFAULT 0"),
+    )
+    needs_compaction = False
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(cards)")}
+        with self.conn:
+            for name, definition in self.MIGRATIONS:
+                if name not in columns:
+                    self.conn.execute(f"ALTER TABLE cards ADD COLUMN {name} {definition}")
+
+    def pending(self):
+        return 0
+
+    def exists(self):
+        return self.conn.execute("SELECT 1 FROM cards LIMIT 1").fetchone() is not None
+
+    def load(self):
+        return list(self.iter_cards())
+
+    def load_store(self):
+        return CardStore.from_dicts(self.iter_cards())
+
+    def iter_cards(self):
+        cursor = self.conn.execute(f"SELECT {', '.join(CARD_FIELDS)} FROM cards ORDER BY rowid")
+        return (dict(zip(CARD_FIELDS, row)) for row in cursor)
+
+    def save_all(self, items, store=None):
+        # Tüm deste: var olan id'ler güncellenir (upsert)
+        placeholders = ", ".join("?" * len(CARD_FIELDS))
+        updates = ", ".join(f"{field}=excluded.{field}" for field in CARD_FIELDS[1:])
+        rows = ([item.get(field, CARD_DEFAULTS.get(field)) for field in CARD_FIELDS]
+                for item in items)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO cards ({', '.join(CARD_FIELDS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(id) DO UPDATE SET {updates}", rows)
+
+    def add_cards(self, items):
+        # Yeni kartlar düz INSERT ile eklenir, var olan kart asla ezilmez.
+        # Çağıranın verdiği id (bellekteki deste ya da içe aktarma başındaki
+        # en büyük id) bu arada başka bir süreçte alınmış olabilir: o zaman
+        # aynı yazma işlemi içinde MAX(id)+1 verilir. id'si olmayan karta
+        # SQLite id atar. Son id item["id"]'ye yazılır.
+        sql = (f"INSERT INTO cards ({', '.join(CARD_FIELDS)}) "
+               f"VALUES ({', '.join('?' * len(CARD_FIELDS))})")
+
+        def row(item):
+            return [item.get(field, CARD_DEFAULTS.get(field)) for field in CARD_FIELDS]
+
+        # IMMEDIATE: yazma kilidi baştan alınır, MAX(id) işlem boyunca geçerli kalır
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for item in items:
+                if item.get("id") is not None and self.conn.execute(
+                        "SELECT 1 FROM cards WHERE id=?", (item["id"],)).fetchone():
+                    item["id"] = self.conn.execute(
+                        "SELECT COALESCE(MAX(id), 0) + 1 FROM cards").fetchone()[0]
+                cursor = self.conn.execute(sql, row(item))
+                item["id"] = cursor.lastrowid
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+
+    def compact(self):
+        pass
+
+    def save_progress(self, records):
+        assignments = ", ".join(f"{field}=?" for field in PROGRESS_FIELDS)
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE cards SET {assignments} WHERE id=?",
+                ([record[field] for field in PROGRESS_FIELDS] + [record["id"]] for record in records))
+
+    def close(self):
+        self.conn.close()
+
+
+def open_storage(path=None):
+    path = path or DEFAULT_PATH
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SQLiteStorage(path)
+    return JsonStorage(path)
+
+
+def import_json(json_path, db_path):
+    # Tek seferlik JSON -> SQLite aktarımı (günlükteki ilerleme dahil)
+    items = JsonStorage(json_path).load()
+    storage = SQLiteStorage(db_path)
+    storage.save_all(items)
+    storage.close()
+    return len(items)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import a JSON deck into a SQLite database.")
+    parser.add_argument("source", nargs="?", default="verbs.json")
+    parser.add_argument("target", nargs="?", default="verbs.db")
+    args = parser.parse_args()
+    count = import_json(args.source, args.target)
+    print(f"Imported {count} cards into {args.target}")
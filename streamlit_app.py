@@ -1,8 +1,31 @@
 import streamlit as st
-import json
-import random
-import time
 import os
+import re
+import threading
+import time
+
+import metrics
+from answers import AnswerIndex
+from cloze import ClozeIndex
+from card_queue import CardQueue, OverlayQueue
+from card_store import CardStore, OverlayProgress
+from distractors import DistractorEngine
+from journal import ProgressJournal
+from review_log import ReviewLog
+from session import QuizSession, SessionPlanner
+from srs import DailyBudget, DueForecast, SchedulePolicy, day_number
+from stats import compute_stats
+from storage import open_storage
+
+# Betik her etkileşimde baştan çalışır; süresi "streamlit.rerun" histogramına
+# yazılır (KELIME_METRICS, bkz. metrics.py). st.rerun() ile kesilen
+# çalıştırmalar sayılmaz, cevap işleme ayrıca "save" olarak ölçülür.
+RUN_STARTED = time.perf_counter()
+metrics.install()
+
+# Kullanıcı başına ilerleme günlükleri (progress/<kullanıcı>.jsonl) ve
+# cevap geçmişi (progress/<kullanıcı>.reviews.bin)
+PROGRESS_DIR = "progress"
 
 # Sayfa Ayarları (Mobil uyumlu görünüm için)
 st.set_page_config(
@@ -81,116 +104,174 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Veri Yükleme ve Hazırlık ---
-@st.cache_data
+@st.cache_resource
 def load_data():
+    # Kelime içeriği süreç başına bir kez yüklenir ve tüm oturumlarca paylaşılır
+    # (st.cache_data her oturuma listenin tam kopyasını döndürüyordu)
+    # Deste JSON ya da SQLite olabilir (KELIME_DATA, bkz. storage.py); JSON
+    # değişmediyse sütunlar snapshot dosyasından okunur
+    storage = open_storage()
     try:
-        with open('verbs.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # Veri formatını standardize et
-        processed = []
-        for item in data:
-            processed.append({
-                "id": item["id"],
-                "verb": item["verb"],
-                "turkish": item["turkish"],
-                "sentence": item["sentence"],
-                "category": item.get("category", "General"),
-                "weight": item.get("weight", 100),
-                "correct_count": item.get("correct_count", 0),
-                "next_review": item.get("next_review", 0)
-            })
-        return processed
-    except FileNotFoundError:
-        return []
+        if not storage.exists():
+            return CardStore()
+        with metrics.timer("load"):
+            return storage.load_store()
+    finally:
+        storage.close()
+
+@st.cache_resource
+def load_distractors():
+    # Şık havuzları paylaşılan kelime içeriğinden bir kez hesaplanır
+    return DistractorEngine(load_data().vocab)
+
+@st.cache_resource
+def load_answers():
+    # Yazılı cevap modu için normalize anlam indeksi (süreç başına bir kez)
+    return AnswerIndex(load_data().vocab)
+
+@st.cache_resource
+def load_cloze():
+    # Boşluk doldurma için örnek cümlelerin ters indeksi (süreç başına bir kez)
+    return ClozeIndex(load_data().vocab)
+
+@st.cache_resource
+def load_queue():
+    # Paylaşılan destenin seçim kuyruğu ve vade tahmini süreç başına bir kez
+    # kurulur. Kuyruğa oturumlar seyrek katmanla (OverlayQueue) bakar; vade
+    # terfisi paylaşılan heap'i değiştirdiği için seçim ortak kilit altında.
+    base = load_data()
+    return (CardQueue(base.queue_items()), DueForecast(base.progress.next_review),
+            threading.Lock())
+
+def current_user():
+    # ?user=ad ile kullanıcı seçilir; dosya adı için güvenli hale getir
+    user = st.query_params.get("user", "default")
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", user)[:64] or "default"
+
+def open_user_progress(deck, user):
+    # Kullanıcının günlüğünü okuyup seyrek katmana uygula
+    os.makedirs(PROGRESS_DIR, exist_ok=True)
+    journal = ProgressJournal(os.path.join(PROGRESS_DIR, f"{user}.jsonl"))
+    for card_id, record in journal.replay().items():
+        card = deck.by_id(card_id)
+        if card is not None:
+            card.apply_progress(record)
+    return journal
+
+def save_user_progress(card):
+    journal = st.session_state.journal
+    journal.append(card.progress_dict())
+    # Günlük, değişen kart sayısının çok üstüne çıkarsa sıkıştır
+    deck = st.session_state.deck
+    if journal.count > max(100, 4 * len(deck.progress.changes)):
+        journal.rewrite([deck[i].progress_dict() for i in deck.progress.changes])
 
 # --- Session State Başlatma ---
 if 'deck' not in st.session_state:
-    st.session_state.deck = load_data()
+    # Kelimeler ve temel ilerleme paylaşılır; oturuma özel olan sadece
+    # kullanıcının değiştirdiği kartlardır (card id ile kalıcı hale gelir)
+    base = load_data()
+    deck = CardStore(base.vocab, OverlayProgress(base.progress))
+    user = current_user()
+    st.session_state.journal = open_user_progress(deck, user)
+    st.session_state.reviews = ReviewLog(os.path.join(PROGRESS_DIR, f"{user}.reviews.bin"))
+    # Kart seçimi için heap + Fenwick tabanlı kuyruk (konum = deck indeksi).
+    # Paylaşılan kuyruk salt okunur; kullanıcının değiştirdiği kartlar seyrek
+    # katmanda tutulur (server.UserState gibi), oturum belleği deste
+    # boyutuyla büyümez. Vade tahmini gün başına bir sayaç, kopyası küçük.
+    queue, forecast, queue_lock = load_queue()
+    deck.queue = OverlayQueue(queue, lock=queue_lock)
+    forecast = forecast.copy()
+    for index in deck.progress.changes:
+        deck.sync(index)
+        forecast.move(base.progress.next_review[index], deck.progress.next_review[index])
+    # Terminal oyunuyla aynı aralık politikası ve günlük limitler
+    deck.policy = SchedulePolicy(forecast)
+    st.session_state.budget = DailyBudget()
+    st.session_state.budget.load_log(st.session_state.reviews)
+    st.session_state.deck = deck
+    # Soru seçimi ve cevap işleme terminal oyunuyla ortak (session.py)
+    st.session_state.session = QuizSession(deck, load_distractors(), st.session_state.budget,
+                                           st.session_state.reviews, save=save_user_progress,
+                                           answers=load_answers())
+    # Sonraki sorular (kart + şıklar) toplu planlanır; tıklama başına plandan
+    # tek soru alınır, plan azalınca arka planda yeniden doldurulur
+    st.session_state.planner = SessionPlanner(st.session_state.session)
 if 'current_card' not in st.session_state:
     st.session_state.current_card = None
 if 'options' not in st.session_state:
     st.session_state.options = []
+if 'prompt' not in st.session_state:
+    st.session_state.prompt = None # Boşluk doldurma sorusunun cümlesi
+    st.session_state.expected = None
 if 'score' not in st.session_state:
     st.session_state.score = 0
 if 'streak' not in st.session_state:
     st.session_state.streak = 0
 if 'feedback' not in st.session_state:
     st.session_state.feedback = None # None, 'correct', 'wrong'
-if 'processed_answer' not in st.session_state:
-    st.session_state.processed_answer = False
+if 'note' not in st.session_state:
+    st.session_state.note = None # Yazılı cevapta yazım hatası / karıştırılan kelime
+if 'stats' not in st.session_state:
+    st.session_state.stats = None # (gün, compute_stats sonucu); cevap verilince silinir
 
 # --- Oyun Mantığı ---
 
-def get_next_card():
-    deck = st.session_state.deck
-    if not deck: return None
-    
-    now = time.time()
-    # SRS Mantığı: Zamanı gelmiş kartları bul
-    due_cards = [c for c in deck if c['next_review'] <= now]
-    
-    selected = None
-    if due_cards:
-        selected = random.choice(due_cards)
-    else:
-        # Yeni kartlar (hiç çözülmemiş)
-        new_cards = [c for c in deck if c['correct_count'] == 0]
-        if new_cards:
-             # İlk 10 yeni karttan birini seç
-            selected = random.choice(new_cards[:10])
-        else:
-            # Hepsi bitmişse rastgele seç
-            selected = random.choice(deck)
-    
-    return selected
-
-def generate_options(correct_card):
-    deck = st.session_state.deck
-    candidates = [c for c in deck if c['id'] != correct_card['id']]
-    # Rastgele 3 yanlış cevap
-    distractors = random.sample([c['turkish'] for c in candidates], min(3, len(candidates)))
-    options = distractors + [correct_card['turkish']]
-    random.shuffle(options)
-    return options
-
 def start_new_round():
-    card = get_next_card()
-    st.session_state.current_card = card
-    st.session_state.options = generate_options(card)
+    question = st.session_state.planner.next_question()
+    st.session_state.current_card = question.card if question else None
+    st.session_state.options = question.options if question else []
+    st.session_state.prompt = question.prompt if question else None
+    st.session_state.expected = question.expected if question else None
     st.session_state.feedback = None
-    st.session_state.processed_answer = False
+    st.session_state.note = None
 
 def handle_answer(selected_option):
-    if st.session_state.processed_answer: return
-    
-    card = st.session_state.current_card
-    is_correct = (selected_option == card['turkish'])
-    
-    now = time.time()
-    
-    # Deck içindeki kartı güncellemek için index bul
-    idx = next((i for i, item in enumerate(st.session_state.deck) if item["id"] == card["id"]), -1)
-    
-    if idx != -1:
-        if is_correct:
-            st.session_state.deck[idx]['correct_count'] += 1
-            count = st.session_state.deck[idx]['correct_count']
-            
-            # SRS Süreleri (Saniye)
-            interval = 60 if count == 1 else 600 if count == 2 else 86400 * (2**(count-3))
-            if count > 2: interval = max(interval, 86400)
-            
-            st.session_state.deck[idx]['next_review'] = now + interval
-            st.session_state.score += 10
-            st.session_state.streak += 1
-            st.session_state.feedback = 'correct'
-        else:
-            st.session_state.deck[idx]['correct_count'] = 0
-            st.session_state.deck[idx]['next_review'] = now
-            st.session_state.streak = 0
-            st.session_state.feedback = 'wrong'
-            
-    st.session_state.processed_answer = True
+    # İkinci tıklamada submit None döner (soru zaten cevaplandı)
+    result = st.session_state.planner.submit(selected_option)
+    if result is None: return
+    show_result(result)
+
+def handle_text_answer():
+    # Yazılı cevap formu; Türkçe harfler ve küçük yazım hataları tolere edilir
+    result = st.session_state.planner.submit_text(st.session_state.typed_answer)
+    if result is None: return
+    if result["correct"] and result["typos"]:
+        st.session_state.note = f"Küçük bir yazım hatası vardı: {result['answer']}"
+    elif result["confused"] is not None:
+        st.session_state.note = f"'{result['answer']}' = {result['confused'].verb}"
+    show_result(result)
+
+def show_result(result):
+    # SRS, günlük limit, cevap günlüğü ve kaydetme QuizSession.submit içinde
+    st.session_state.stats = None
+    if result["correct"]:
+        st.session_state.score += 10
+        st.session_state.streak += 1
+        st.session_state.feedback = 'correct'
+    else:
+        st.session_state.streak = 0
+        st.session_state.feedback = 'wrong'
+
+def session_stats():
+    # compute_stats tüm desteyi ve cevap geçmişini tarar: sadece panel açıkken
+    # çalışır, sonucu cevap verilene (ya da gün değişene) kadar saklanır
+    today = day_number(time.time())
+    cached = st.session_state.stats
+    if cached is None or cached[0] != today:
+        cached = st.session_state.stats = (today, compute_stats(st.session_state.deck,
+                                                                st.session_state.reviews))
+    return cached[1]
+
+def change_categories():
+    # Oturumu seçilen kategorilere daralt (boş seçim: tüm deste)
+    st.session_state.planner.set_scope(st.session_state.categories or None)
+    start_new_round()
+
+def change_cloze():
+    # Boşluk doldurma açılıp kapanınca hazır plan atılır, yeni soru sorulur
+    st.session_state.planner.set_cloze(load_cloze() if st.session_state.cloze else None)
+    start_new_round()
 
 # --- Arayüz ---
 
@@ -202,6 +283,11 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
+st.multiselect("🎯 Kategoriler (boş: tümü)", sorted(st.session_state.deck.deck_index.categories),
+               key="categories", on_change=change_categories)
+st.toggle("✍️ Yazarak cevapla", key="typed")
+st.toggle("🧩 Boşluk doldurma", key="cloze", on_change=change_cloze)
+
 # İlk yükleme
 if st.session_state.current_card is None:
     start_new_round()
@@ -210,11 +296,20 @@ card = st.session_state.current_card
 
 if card:
     # Kart Görünümü (Kategori gizlendi)
-    st.markdown(f"""
-    <div class="main-card">
-        <div class="verb-text">{card['verb']}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    if st.session_state.prompt:
+        # Boşluklu cümle ve Türkçe anlamı ipucu olarak
+        st.markdown(f"""
+        <div class="main-card">
+            <p style="font-size: 24px; font-weight: bold;">{st.session_state.prompt}</p>
+            <p style="opacity: 0.8;">({card.turkish})</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown(f"""
+        <div class="main-card">
+            <div class="verb-text">{card.verb}</div>
+        </div>
+        """, unsafe_allow_html=True)
 
     # Geri Bildirim Ekranı (Cevaplandıysa)
     if st.session_state.feedback:
@@ -223,9 +318,9 @@ if card:
             <div class="main-card" style="background: rgba(34, 197, 94, 0.2); border-color: #22c55e;">
                 <div style="font-size: 50px;">✅</div>
                 <h3 style="color: #4ade80;">DOĞRU!</h3>
-                <span class="category-badge" style="display:inline-block; margin-top:10px;">{card['category']}</span>
-                <p style="font-style: italic; opacity: 0.9; margin-top: 10px;">"{card['sentence']}"</p>
-                <p style="font-weight: bold; margin-top: 10px;">{card['verb']} = {card['turkish']}</p>
+                <span class="category-badge" style="display:inline-block; margin-top:10px;">{card.category}</span>
+                <p style="font-style: italic; opacity: 0.9; margin-top: 10px;">"{card.sentence}"</p>
+                <p style="font-weight: bold; margin-top: 10px;">{card.verb} = {card.turkish}</p>
             </div>
             """, unsafe_allow_html=True)
         else:
@@ -233,17 +328,32 @@ if card:
             <div class="main-card" style="background: rgba(239, 68, 68, 0.2); border-color: #ef4444;">
                 <div style="font-size: 50px;">❌</div>
                 <h3 style="color: #f87171;">YANLIŞ</h3>
-                <span class="category-badge" style="display:inline-block; margin-top:10px;">{card['category']}</span>
-                <p style="font-style: italic; opacity: 0.9; margin-top: 10px;">"{card['sentence']}"</p>
-                <p style="font-weight: bold; margin-top: 10px;">Doğru Cevap: {card['turkish']}</p>
+                <span class="category-badge" style="display:inline-block; margin-top:10px;">{card.category}</span>
+                <p style="font-style: italic; opacity: 0.9; margin-top: 10px;">"{card.sentence}"</p>
+                <p style="font-weight: bold; margin-top: 10px;">Doğru Cevap: {st.session_state.expected}</p>
             </div>
             """, unsafe_allow_html=True)
+        if st.session_state.note:
+            st.caption(st.session_state.note)
+        if st.session_state.prompt:
+            # Fiilin destedeki diğer cümleleri (ters indeksten)
+            vocab = st.session_state.deck.vocab
+            for position in load_cloze().sentences_with(card.verb, limit=3):
+                if position != card.index:
+                    st.caption(f"· {vocab.sentences[position]}")
         
         # Devam Butonu
         if st.button("Sonraki Soru ➡️", type="primary"):
             start_new_round()
             st.rerun()
 
+    # Yazılı cevap (Henüz cevaplanmadıysa)
+    elif st.session_state.typed:
+        with st.form("typed_form", clear_on_submit=True):
+            st.text_input("Boşluğa gelen fiil" if st.session_state.prompt else "Türkçe karşılığı",
+                          key="typed_answer")
+            st.form_submit_button("Cevapla", type="primary", on_click=handle_text_answer)
+
     # Şıklar (Henüz cevaplanmadıysa)
     else:
         options = st.session_state.options
@@ -257,12 +367,28 @@ if card:
                     st.rerun()
 
     # Alt Bilgi
-    with st.expander("📊 İstatistikler"):
-        total = len(st.session_state.deck)
-        learned = len([c for c in st.session_state.deck if c['correct_count'] >= 5])
-        st.write(f"Toplam Kelime: {total}")
-        st.write(f"Öğrenilen: {learned}")
-        st.progress(learned / total if total > 0 else 0)
+    # Açılır panel (expander) kapalıyken de içeriği hesaplanır; anahtar ile
+    # sadece açıkken
+    if st.toggle("📊 İstatistikler", key="show_stats"):
+        stats = session_stats()
+        st.write(f"Toplam Kelime: {stats['total']}")
+        st.write(f"Öğrenilen: {stats['learned']} · Çalışılıyor: {stats['in_progress']} · Yeni: {stats['new']}")
+        st.progress(stats['learned_percent'] / 100)
+        st.write(f"Bugün tekrar edilecek: {stats['due_today']}")
+        if stats['reviews']:
+            st.write(f"Toplam cevap: {stats['reviews']} (doğru %{stats['accuracy']:.1f}, "
+                     f"ort. {stats['avg_response_ms'] / 1000:.1f} sn)")
+            st.write("Kategorilere göre doğruluk: " + ", ".join(
+                f"{category} %{accuracy:.0f}" for category, accuracy in stats['category_accuracy'].items()))
+
+elif len(st.session_state.deck):
+    st.success("🎉 Bugünlük hedef tamamlandı! Yarın tekrar gel.")
 
 else:
     st.error("Kelime verisi yüklenemedi!")
+
+# Sayfa çizildi; sonraki partiyi tıklamayı beklemeden hazırla
+st.session_state.planner.prefetch()
+
+metrics.observe("streamlit.rerun", time.perf_counter() - RUN_STARTED)
+metrics.METRICS.maybe_export()
@@ -0,0 +1,120 @@
+import re
+import shutil
+import sys
+
+try:
+    import msvcrt
+except ImportError:  # Windows dışı
+    msvcrt = None
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
+# ANSI kaçış dizileri (Windows'ta colorama.init bunları konsol çağrılarına çevirir)
+CSI = "\033["
+HOME = CSI + "H"
+CLEAR_SCREEN = CSI + "2J"
+CLEAR_LINE = CSI + "2K"
+CLEAR_BELOW = CSI + "J"
+# Satır genişliği hesaplanırken renk kodları sayılmaz
+ANSI = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+
+def move_to(row):
+    return f"{CSI}{row};1H"
+
+
+def screen_rows(text, width):
+    # Metnin terminalde kapladığı satır sayısı (uzun satırlar alta kayar)
+    return sum(max(1, -(-len(ANSI.sub("", line)) // width)) for line in text.split("\n"))
+
+
+class Screen:
+    # os.system('clear') yerine ANSI ile çizim; her temizlik bir kabuk süreci
+    # başlatıyordu. Son çizilen kare hatırlanır, yeni karede sadece değişen
+    # satırlar yeniden yazılır. Karenin altı (girdi istemleri, mesajlar) her
+    # çizimde silinir. Karenin altına yazılan her şey print / input ile
+    # buradan geçmeli: ekran kayarsa satır numaraları tutmaz, sonraki çizim
+    # tam temizlik yapar.
+    def __init__(self, stream=None):
+        self.stream = stream
+        # None: ekranda ne olduğu bilinmiyor, sonraki çizim tam temizlik yapar
+        self.lines = None
+        # Son karenin altına yazılan satır sayısı
+        self.below = 0
+
+    def write(self, text):
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def clear(self):
+        # Ardından print ile serbest çıktı yazılacak ekranlar için
+        self.write(HOME + CLEAR_SCREEN)
+        self.lines = None
+        self.below = 0
+
+    def _used(self, text):
+        # Karenin altına yazılan metin ekranı kaydırabilir mi
+        size = shutil.get_terminal_size()
+        self.below += screen_rows(text, size.columns)
+        lines = self.lines
+        if lines is not None and len(lines) + self.below >= size.lines:
+            self.lines = None
+
+    def print(self, *values, sep=" "):
+        text = sep.join(str(value) for value in values)
+        self.write(text + "\n")
+        self._used(text)
+
+    def input(self, prompt=""):
+        # Girilen satır ve Enter da bir ekran satırı kaplar
+        answer = input(prompt)
+        self._used(prompt + answer)
+        return answer
+
+    def draw(self, lines):
+        # lines: her eleman tek ekran satırı (içinde \n olmamalı)
+        previous = self.lines
+        # Kare terminale sığmazsa ekran kayar, satır numaraları tutmaz
+        fits = len(lines) < shutil.get_terminal_size().lines
+        out = []
+        if previous is None or not fits:
+            out.append(HOME + CLEAR_SCREEN)
+            previous = []
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                out.append(move_to(row + 1) + CLEAR_LINE + line)
+        out.append(move_to(len(lines) + 1) + CLEAR_BELOW)
+        self.write("".join(out))
+        self.lines = list(lines) if fits else None
+        self.below = 0
+
+
+def read_key(prompt=""):
+    # Enter beklemeden tek tuş okur; girdi terminal değilse satır okunur
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    if not sys.stdin.isatty():
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()[:1]
+    if msvcrt is not None:
+        key = msvcrt.getwch()
+        if key == "\x03":
+            raise KeyboardInterrupt
+        return key
+    if termios is None:
+        return input()[:1]
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        # cbreak: Ctrl+C sinyal olarak kalır, tuş ekrana yazılmaz
+        tty.setcbreak(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
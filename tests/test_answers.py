@@ -0,0 +1,75 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from answers import AnswerIndex, BKTree, answer_forms, distance, normalize
+from card_store import CardStore
+
+
+def naive_distance(a, b):
+    # Klasik dinamik programlama (başvuru)
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def test_normalize_folds_turkish_letters_and_case():
+    assert normalize("  Kaldırmak!") == "kaldirmak"
+    assert normalize("İSTEMEK") == normalize("istemek") == "istemek"
+    assert normalize("IŞIK") == "isik"
+    assert normalize("Yüksek   Çığlık, Ağaç") == "yuksek ciglik agac"
+    assert normalize("café") == "cafe"
+
+
+def test_answer_forms_split_alternatives():
+    assert answer_forms("azaltmak (tüketim) / kesmek (ağaç)") == {
+        "azaltmak tuketim", "azaltmak", "kesmek agac", "kesmek"}
+    assert answer_forms("kapmak/tutmak") == {"kapmak tutmak", "kapmak", "tutmak"}
+
+
+def test_distance_matches_naive_dp():
+    rng = random.Random(0)
+    alphabet = "abcçğıiöşü "
+    for _ in range(2000):
+        a = "".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 12)))
+        b = "".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 12)))
+        assert distance(a, b) == naive_distance(a, b), (a, b)
+    # 64 harften uzun yazımlar (bit maskesi tek makine kelimesini aşar)
+    long_a = "kaldirmak " * 10
+    long_b = "kaldırmak " * 9 + "kaldirma"
+    assert distance(long_a, long_b) == naive_distance(long_a, long_b)
+
+
+def test_bk_tree_finds_all_words_within_limit():
+    rng = random.Random(1)
+    words = {"".join(rng.choice("abcde") for _ in range(rng.randrange(1, 8))) for _ in range(300)}
+    tree = BKTree()
+    for word in words:
+        tree.add(word)
+    assert len(tree) == len(words)
+    for query in ("abc", "eeee", "d"):
+        expected = sorted((naive_distance(query, word), word) for word in words
+                          if naive_distance(query, word) <= 2)
+        assert tree.search(query, 2) == expected
+
+
+def test_check_accepts_typos_and_reports_confused_card():
+    deck = CardStore.from_dicts([
+        {"id": 1, "verb": "lift", "turkish": "kaldırmak / yükseltmek", "sentence": "Lift it."},
+        {"id": 2, "verb": "run", "turkish": "koşmak", "sentence": "I run."},
+        {"id": 3, "verb": "give up", "turkish": "vazgeçmek", "sentence": "Never give up."},
+    ])
+    index = AnswerIndex(deck.vocab)
+    assert index.check(0, "YÜKSELTMEK").correct
+    match = index.check(0, "kaldirmk")
+    assert match.correct and match.typos == 1
+    assert not index.check(1, "kos").correct          # kısa kelimede harf hatası yok
+    match = index.check(1, "vazgecmek")
+    assert not match.correct and match.confused == 2
@@ -0,0 +1,153 @@
+import os
+import random
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_queue import CardQueue, OverlayQueue
+from card_store import CardStore
+from distractors import DistractorEngine
+from session import QuizSession
+from srs import NEW_PER_DAY, DailyBudget, DueForecast, SchedulePolicy
+
+NOW = 1_700_000_000.0
+DAY = 86400
+
+
+def make_queue(fresh, scheduled, failed=0):
+    # fresh: hiç görülmemiş, scheduled: ileride vakti gelecek (doğru bilinmiş),
+    # failed: ileride vakti gelecek ama correct_count sıfırlanmış kartlar
+    items = ([(0.0, 0, 100.0)] * fresh
+             + [(NOW + DAY, 3, 50.0)] * scheduled
+             + [(NOW + DAY, 0, 150.0)] * failed)
+    return CardQueue(items, now=NOW)
+
+
+def test_new_limit_only_selects_scheduled_cards():
+    random.seed(1)
+    queue = make_queue(fresh=50, scheduled=5)
+    for _ in range(500):
+        position = queue.select(NOW, allow_new=False, allow_review=True)
+        assert position is not None and position >= 50
+
+
+def test_new_limit_without_scheduled_cards_selects_nothing():
+    queue = make_queue(fresh=50, scheduled=0)
+    assert queue.select(NOW, allow_new=False, allow_review=True) is None
+
+
+def test_review_limit_skips_failed_scheduled_cards():
+    random.seed(2)
+    queue = make_queue(fresh=0, scheduled=3, failed=3)
+    assert queue.select(NOW, allow_new=True, allow_review=False) is None
+    queue = make_queue(fresh=4, scheduled=3, failed=3)
+    for _ in range(500):
+        assert queue.select(NOW, allow_new=True, allow_review=False) < 4
+
+
+def test_both_limits_select_nothing():
+    queue = make_queue(fresh=5, scheduled=5, failed=5)
+    assert queue.select(NOW, allow_new=False, allow_review=False) is None
+
+
+def test_updated_card_follows_limits():
+    # Cevaplanan yeni kart planlanır; yeni kart limiti dolunca yine seçilebilir
+    random.seed(3)
+    queue = make_queue(fresh=10, scheduled=0)
+    queue.update(7, NOW + 60, 1, 100.0, now=NOW)
+    for _ in range(200):
+        assert queue.select(NOW, allow_new=False, allow_review=True) == 7
+
+
+def test_session_respects_daily_new_limit():
+    random.seed(4)
+    items = [{"id": i, "verb": f"verb{i}", "turkish": f"anlam{i}mak",
+              "sentence": f"I verb{i} daily.", "category": "General"} for i in range(1, 301)]
+    deck = CardStore.from_dicts(items)
+    deck.queue = CardQueue(deck.queue_items(), now=NOW)
+    deck.policy = SchedulePolicy(DueForecast(deck.progress.next_review))
+    budget = DailyBudget()
+    clock = [NOW]
+    session = QuizSession(deck, DistractorEngine(deck.vocab), budget, clock=lambda: clock[0])
+    seen = set()
+    for _ in range(60):
+        question = session.next_question()
+        if question is None:
+            break
+        seen.add(question.card.id)
+        session.submit(question.card.turkish)
+        clock[0] += 5
+    assert budget.new_done <= NEW_PER_DAY
+    assert len(seen) <= NEW_PER_DAY
+
+
+def test_overlay_leaves_base_untouched():
+    base = make_queue(fresh=20, scheduled=20)
+    before = (list(base._next_review), base._due.total(), base._fresh.total())
+    overlay = OverlayQueue(base, now=NOW)
+    overlay.update(3, NOW - 1, 1, 80.0, now=NOW)
+    overlay.update(30, NOW + 60, 4, 25.0, now=NOW)
+    assert (list(base._next_review), base._due.total(), base._fresh.total()) == before
+    assert len(overlay.local) == 2
+
+
+def test_overlay_selects_like_a_copy():
+    # Aynı güncellemeler: paylaşılan kuyruğun kopyası ile seyrek katman aynı
+    # kartları aynı oranlarda seçer
+    base = make_queue(fresh=5, scheduled=5, failed=2)
+    copy = base.copy()
+    overlay = OverlayQueue(base, now=NOW)
+    for queue in (copy, overlay):
+        queue.update(0, NOW - 1, 1, 400.0, now=NOW)
+        queue.update(1, NOW + DAY, 2, 10.0, now=NOW)
+        queue.update(6, NOW - 1, 4, 100.0, now=NOW)
+    for allow_new, allow_review in ((True, True), (False, True), (True, False)):
+        assert overlay.due_weight(NOW, allow_new, allow_review) == copy.due_weight(NOW, allow_new, allow_review)
+        counts = [{}, {}]
+        for counter, queue in zip(counts, (copy, overlay)):
+            random.seed(5)
+            for _ in range(4000):
+                position = queue.select(NOW, allow_new, allow_review)
+                counter[position] = counter.get(position, 0) + 1
+        assert counts[0].keys() == counts[1].keys()
+        for position, count in counts[0].items():
+            assert abs(count - counts[1][position]) < 400
+
+
+def test_overlay_respects_limits():
+    random.seed(6)
+    base = make_queue(fresh=50, scheduled=5)
+    overlay = OverlayQueue(base, now=NOW)
+    overlay.update(0, NOW + 60, 1, 100.0, now=NOW)
+    for _ in range(300):
+        position = overlay.select(NOW, allow_new=False, allow_review=True)
+        assert position == 0 or position >= 50
+    assert overlay.select(NOW + 2 * DAY, allow_new=False, allow_review=False) is None
+
+
+def test_overlays_share_base_across_threads():
+    # Streamlit: oturumlar ayrı iş parçacıklarında aynı temel kuyruğa bakar
+    base = make_queue(fresh=200, scheduled=200)
+    lock = threading.Lock()
+    errors = []
+
+    def learner(seed):
+        rng = random.Random(seed)
+        overlay = OverlayQueue(base, now=NOW, lock=lock)
+        try:
+            for step in range(300):
+                now = NOW + DAY + step * 600
+                position = overlay.select(now)
+                assert position is not None
+                overlay.update(position, now + rng.choice((60, DAY)), 1, 80.0, now=now)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=learner, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert sum(base._is_due) == 400
@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cloze import IRREGULAR, find_blank, inflect, inflections
+
+# Bağımsız başvuru listesi: yaygın düzensiz fiillerin kabul edilen geçmiş
+# zaman / geçmiş ortaç biçimleri (İngiliz ve Amerikan yazımı)
+REFERENCE = {
+    verb: tuple(set(forms.split("|")) for forms in entry.split("/"))
+    for verb, entry in (line.split("=") for line in """
+    arise=arose/arisen awake=awoke/awoken be=was/been bear=bore/born|borne beat=beat/beaten
+    become=became/become begin=began/begun bend=bent/bent bet=bet/bet bind=bound/bound
+    bite=bit/bitten bleed=bled/bled blow=blew/blown break=broke/broken breed=bred/bred
+    bring=brought/brought build=built/built burn=burnt|burned/burnt|burned burst=burst/burst
+    buy=bought/bought cast=cast/cast catch=caught/caught choose=chose/chosen cling=clung/clung
+    come=came/come cost=cost/cost creep=crept/crept cut=cut/cut deal=dealt/dealt dig=dug/dug
+    dive=dived|dove/dived do=did/done draw=drew/drawn dream=dreamt|dreamed/dreamt|dreamed
+    drink=drank/drunk drive=drove/driven dwell=dwelt|dwelled/dwelt|dwelled eat=ate/eaten
+    fall=fell/fallen feed=fed/fed feel=felt/felt fight=fought/fought find=found/found
+    fit=fit|fitted/fit|fitted flee=fled/fled fling=flung/flung fly=flew/flown
+    forbid=forbade/forbidden forecast=forecast/forecast foresee=foresaw/foreseen
+    forget=forgot/forgotten forgive=forgave/forgiven freeze=froze/frozen get=got/got|gotten
+    give=gave/given go=went/gone grind=ground/ground grow=grew/grown hang=hung|hanged/hung|hanged
+    have=had/had hear=heard/heard hide=hid/hidden hit=hit/hit hold=held/held hurt=hurt/hurt
+    keep=kept/kept kneel=knelt|kneeled/knelt|kneeled knit=knit|knitted/knit|knitted
+    know=knew/known lay=laid/laid lead=led/led lean=leant|leaned/leant|leaned
+    leap=leapt|leaped/leapt|leaped learn=learnt|learned/learnt|learned leave=left/left
+    lend=lent/lent let=let/let lie=lay|lied/lain|lied light=lit|lighted/lit|lighted lose=lost/lost
+    make=made/made mean=meant/meant meet=met/met mislead=misled/misled mow=mowed/mown|mowed
+    overcome=overcame/overcome overtake=overtook/overtaken pay=paid/paid prove=proved/proven|proved
+    put=put/put quit=quit/quit read=read/read rid=rid/rid ride=rode/ridden ring=rang/rung
+    rise=rose/risen run=ran/run saw=sawed/sawn|sawed say=said/said see=saw/seen seek=sought/sought
+    sell=sold/sold send=sent/sent set=set/set sew=sewed/sewn|sewed shake=shook/shaken
+    shear=sheared/shorn|sheared shed=shed/shed shine=shone|shined/shone|shined shoot=shot/shot
+    show=showed/shown|showed shrink=shrank/shrunk shut=shut/shut sing=sang/sung sink=sank/sunk
+    sit=sat/sat slay=slew/slain sleep=slept/slept slide=slid/slid sling=slung/slung slit=slit/slit
+    smell=smelt|smelled/smelt|smelled sow=sowed/sown|sowed speak=spoke/spoken speed=sped/sped
+    spell=spelt|spelled/spelt|spelled spend=spent/spent spill=spilt|spilled/spilt|spilled
+    spin=spun/spun spit=spat/spat split=split/split spoil=spoilt|spoiled/spoilt|spoiled
+    spread=spread/spread spring=sprang/sprung stand=stood/stood steal=stole/stolen
+    stick=stuck/stuck sting=stung/stung stink=stank/stunk stride=strode/stridden
+    strike=struck/struck string=strung/strung strive=strove|strived/striven|strived
+    swear=swore/sworn sweep=swept/swept swell=swelled/swollen|swelled swim=swam/swum
+    swing=swung/swung take=took/taken teach=taught/taught tear=tore/torn tell=told/told
+    think=thought/thought throw=threw/thrown thrust=thrust/thrust tread=trod/trodden
+    undergo=underwent/undergone understand=understood/understood undertake=undertook/undertaken
+    upset=upset/upset wake=woke/woken wear=wore/worn weave=wove/woven weep=wept/wept
+    wet=wet|wetted/wet|wetted win=won/won wind=wound/wound withdraw=withdrew/withdrawn
+    wring=wrung/wrung write=wrote/written
+    """.split())
+}
+
+
+def deck_verbs():
+    with open(os.path.join(ROOT, "verbs.json"), encoding="utf-8") as f:
+        return sorted({card["verb"].lower().split()[0] for card in json.load(f)})
+
+
+def test_deck_verbs_inflect_like_the_reference():
+    wrong = []
+    for verb in deck_verbs():
+        if verb not in REFERENCE:
+            continue
+        forms = inflections(verb)
+        pasts, participles = REFERENCE[verb]
+        if forms["past"] not in pasts or forms["participle"] not in participles:
+            wrong.append((verb, forms["past"], forms["participle"]))
+    assert not wrong
+
+
+def test_table_matches_the_reference():
+    for verb, (past, participle) in IRREGULAR.items():
+        assert past in REFERENCE[verb][0] and participle in REFERENCE[verb][1], verb
+
+
+def test_irregular_forms_are_blanked():
+    assert inflect("thrust", "past") == "thrust"
+    blank = find_blank("cast", "She cast her vote early.")
+    assert blank is not None and blank.text == "cast"
+    blank = find_blank("tread", "He trod carefully on the ice.")
+    assert blank is not None and blank.label == "past"
@@ -0,0 +1,72 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from journal import ProgressJournal
+from storage import COMPACT_EVERY, JsonStorage, journal_path
+
+
+def test_replay_merges_records_per_card(tmp_path):
+    journal = ProgressJournal(str(tmp_path / "progress.jsonl"))
+    journal.append_many([{"id": 1, "correct_count": 1, "weight": 100},
+                         {"id": 2, "correct_count": 1},
+                         {"id": 1, "correct_count": 2}])
+    journal.close()
+    reopened = ProgressJournal(journal.path)
+    assert reopened.replay() == {1: {"id": 1, "correct_count": 2, "weight": 100},
+                                 2: {"id": 2, "correct_count": 1}}
+    assert reopened.count == 3
+
+
+def test_replay_truncates_torn_tail(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    path.write_bytes(b'{"id":1,"correct_count":3}\n{"id":2,"corr')
+    journal = ProgressJournal(str(path))
+    assert journal.replay() == {1: {"id": 1, "correct_count": 3}}
+    assert path.read_bytes() == b'{"id":1,"correct_count":3}\n'
+    # Sonraki ekleme yarım satıra yapışmaz
+    journal.append({"id": 2, "correct_count": 1})
+    journal.close()
+    assert ProgressJournal(str(path)).replay()[2] == {"id": 2, "correct_count": 1}
+
+
+def make_storage(tmp_path, count):
+    path = str(tmp_path / "verbs.json")
+    storage = JsonStorage(path)
+    storage.save_all([{"id": i, "verb": f"verb{i}", "turkish": f"anlam{i}mak",
+                       "sentence": f"I verb{i}.", "correct_count": 0} for i in range(1, count + 1)])
+    return storage
+
+
+def test_compaction_threshold_scales_with_deck(tmp_path):
+    storage = make_storage(tmp_path, 3 * COMPACT_EVERY)
+    storage.save_progress([{"id": 1, "correct_count": 1}] * COMPACT_EVERY)
+    assert not storage.needs_compaction
+    storage.save_progress([{"id": 1, "correct_count": 1}] * (2 * COMPACT_EVERY))
+    assert storage.needs_compaction
+    storage.close()
+
+
+def test_small_deck_compacts_after_compact_every(tmp_path):
+    storage = make_storage(tmp_path, 10)
+    storage.save_progress([{"id": 2, "correct_count": 1}] * (COMPACT_EVERY - 1))
+    assert not storage.needs_compaction
+    storage.save_progress([{"id": 2, "correct_count": 4}])
+    assert storage.needs_compaction
+    storage.close()
+
+
+def test_compact_writes_progress_into_deck(tmp_path):
+    storage = make_storage(tmp_path, 5)
+    storage.save_progress([{"id": 3, "correct_count": 2, "next_review": 123.0}])
+    storage.add_cards([{"id": 6, "verb": "swim", "turkish": "yüzmek", "sentence": "I swim."}])
+    storage.compact()
+    storage.close()
+    assert not os.path.exists(journal_path(storage.path))
+    with open(storage.path, encoding="utf-8") as f:
+        items = {item["id"]: item for item in json.load(f)}
+    assert items[3]["correct_count"] == 2 and items[3]["next_review"] == 123.0
+    assert items[6]["verb"] == "swim"
+    assert JsonStorage(storage.path).load() == list(items.values())
@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import QuizServer
+
+
+def make_server(tmp_path):
+    deck = tmp_path / "verbs.json"
+    deck.write_text(json.dumps([
+        {"id": i, "verb": f"verb{i}", "turkish": f"anlam{i}mak", "sentence": f"I verb{i} daily.",
+         "category": "General", "weight": 100, "correct_count": 0} for i in range(1, 21)]))
+    server = QuizServer(str(deck), str(tmp_path / "progress"))
+    query = {"user": ["ada"]}
+    question = server.next_card(query, {})
+    server.answer(query, {"id": question["id"], "answer": question["options"][0]})
+    return server
+
+
+def test_cancelled_flush_finishes_its_write(tmp_path):
+    server = make_server(tmp_path)
+    events = []
+
+    def slow_write(batch):
+        time.sleep(0.2)
+        events.append("written")
+
+    server.write_batch = slow_write
+
+    async def shutdown():
+        flusher = asyncio.create_task(server.flush())
+        await asyncio.sleep(0.05)
+        flusher.cancel()
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+        events.append("closed")
+
+    asyncio.run(shutdown())
+    assert events == ["written", "closed"]
+
+
+def test_final_flush_waits_for_running_flush(tmp_path):
+    server = make_server(tmp_path)
+    events = []
+
+    def slow_write(batch):
+        time.sleep(0.2)
+        events.append("written")
+
+    server.write_batch = slow_write
+
+    async def shutdown():
+        flusher = asyncio.create_task(server.flush())
+        await asyncio.sleep(0.05)
+        await server.flush()
+        events.append("flushed")
+        await flusher
+
+    asyncio.run(shutdown())
+    assert events == ["written", "flushed"]
@@ -0,0 +1,65 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_store import CardStore
+from snapshot import load_snapshot, save_snapshot, snapshot_path
+from storage import JsonStorage
+
+ITEMS = [{"id": i, "verb": f"verb{i}", "turkish": f"anlam{i}mak", "sentence": f"I verb{i}.",
+          "category": "General", "correct_count": i} for i in range(1, 6)]
+
+
+def write_deck(tmp_path, items=ITEMS):
+    path = tmp_path / "verbs.json"
+    path.write_text(json.dumps(items), encoding="utf-8")
+    return str(path)
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = write_deck(tmp_path)
+    save_snapshot(path, CardStore.from_dicts(ITEMS))
+    store = load_snapshot(path)
+    assert [card.to_dict() for card in store] == [card.to_dict() for card in CardStore.from_dicts(ITEMS)]
+
+
+def test_snapshot_invalid_when_size_changes(tmp_path):
+    path = write_deck(tmp_path)
+    save_snapshot(path, CardStore.from_dicts(ITEMS))
+    stat = os.stat(path)
+    write_deck(tmp_path, ITEMS[:3])
+    # Aynı değişiklik zamanı, farklı boyut
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_snapshot(path) is None
+
+
+def test_snapshot_invalid_when_mtime_changes(tmp_path):
+    path = write_deck(tmp_path)
+    save_snapshot(path, CardStore.from_dicts(ITEMS))
+    stat = os.stat(path)
+    # Aynı boyut, farklı içerik ve değişiklik zamanı
+    changed = [dict(item, verb=item["verb"].upper()) for item in ITEMS]
+    write_deck(tmp_path, changed)
+    assert os.stat(path).st_size == stat.st_size
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_snapshot(path) is None
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    path = write_deck(tmp_path)
+    with open(snapshot_path(path), "wb") as f:
+        f.write(b"not a pickle")
+    assert load_snapshot(path) is None
+
+
+def test_storage_rebuilds_stale_snapshot(tmp_path):
+    path = write_deck(tmp_path)
+    JsonStorage(path).load_store()
+    assert load_snapshot(path) is not None
+    edited = ITEMS + [{"id": 6, "verb": "swim", "turkish": "yüzmek", "sentence": "I swim."}]
+    write_deck(tmp_path, edited)
+    store = JsonStorage(path).load_store()
+    assert len(store) == 6 and store.by_id(6).verb == "swim"
+    assert len(load_snapshot(path)) == 6
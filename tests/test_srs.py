@@ -0,0 +1,125 @@
+import math
+import os
+import random
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from card_store import CardStore
+from srs import (DAY, DEFAULT_EASE, MAX_INTERVAL_DAYS, NEW_PER_DAY, DailyBudget, DueForecast,
+                 FSRSAlgorithm, SchedulePolicy, SM2Algorithm, day_number, reschedule_deck)
+
+NOW = 1_700_000_000.0
+
+
+class Card:
+    # SchedulePolicy.review'un kullandığı alanlar
+    def __init__(self, correct_count=0, ease=DEFAULT_EASE, stability=0.0):
+        self.correct_count = correct_count
+        self.ease = ease
+        self.stability = stability
+        self.last_reviewed = 0
+        self.next_review = 0
+
+
+def test_sm2_known_sequence():
+    sm2 = SM2Algorithm()
+    ease, stability = DEFAULT_EASE, 0.0
+    intervals = []
+    for count in range(1, 7):
+        interval, ease, stability = sm2.review(count, ease, stability, stability, True)
+        intervals.append(interval)
+    # 1 dk, 10 dk, 1 gün, 6 gün, 6 * 2.5, 15 * 2.5
+    assert intervals == [60, 600, DAY, 6 * DAY, 15 * DAY, 37.5 * DAY]
+    assert ease == DEFAULT_EASE
+    # Yanlış: EF 0.54 düşer (q = 1), en az 1.3
+    interval, ease, stability = sm2.review(0, ease, stability, stability, False)
+    assert (interval, stability) == (0, 0.0) and math.isclose(ease, 1.96)
+    assert sm2.review(0, 1.5, 10.0, 10.0, False)[1] == SM2Algorithm.MIN_EASE
+
+
+def test_fsrs_known_sequence():
+    fsrs = FSRSAlgorithm()
+    assert fsrs.review(1, 2.5, 0.0, 0.0, True) == (60, 2.5, 0.0)
+    # İlk mezuniyet: S0(Good) = 2.4 gün, D0(Good) = 4.93
+    interval, ease, stability = fsrs.review(3, 2.5, 0.0, 0.0, True)
+    assert (interval, ease, stability) == (2.4 * DAY, 4.93, 2.4)
+    # Vadesinde hatırlama %90; kararlılık yaklaşık 8.04 güne çıkar
+    assert math.isclose(fsrs.retrievability(2.4, 2.4), 0.9)
+    interval, ease, stability = fsrs.review(4, ease, stability, 2.4, True)
+    assert math.isclose(stability, 8.03597, rel_tol=1e-5) and interval == stability * DAY
+    assert math.isclose(ease, 4.93)
+    # Unutma: zorluk 2 * w6 artar, kararlılık düşer
+    interval, ease, stability = fsrs.review(0, ease, stability, stability, False)
+    assert interval == 0
+    assert math.isclose(ease, 6.65) and math.isclose(stability, 2.54262, rel_tol=1e-5)
+
+
+def test_policy_caps_fuzzes_and_balances():
+    random.seed(7)
+    forecast = DueForecast()
+    policy = SchedulePolicy(forecast, algorithm=SM2Algorithm())
+    # Öğrenme adımları (gün altı) oynatılmaz
+    assert policy.place(600, NOW) == NOW + 600
+    # Üst sınır
+    assert policy.place(10 * MAX_INTERVAL_DAYS * DAY, NOW) <= NOW + MAX_INTERVAL_DAYS * DAY
+    # Aynı aralık ±%10 içinde en boş güne dağılır
+    dues = [policy.place(20 * DAY, NOW) for _ in range(100)]
+    days = Counter(round((due - NOW) / DAY) for due in dues)
+    assert set(days) <= set(range(18, 23)) and len(days) == 5
+    assert max(days.values()) - min(days.values()) <= 1
+    assert sum(forecast.days.values()) == 102
+
+
+def test_policy_review_moves_forecast():
+    forecast = DueForecast()
+    policy = SchedulePolicy(forecast, fuzz=0, algorithm=SM2Algorithm())
+    card = Card(correct_count=3)
+    card.next_review = policy.review(card, True, NOW)
+    assert card.next_review == NOW + DAY
+    card.correct_count = 0
+    card.next_review = policy.review(card, False, NOW + DAY)
+    assert card.next_review == NOW + DAY
+    assert sum(forecast.days.values()) == 1
+
+
+def test_daily_budget_resets_each_day():
+    budget = DailyBudget(new_limit=2, review_limit=1)
+    budget.record(True, NOW)
+    budget.record(True, NOW)
+    budget.record(False, NOW)
+    assert not budget.allow_new(NOW) and not budget.allow_review(NOW)
+    assert budget.allow_new(NOW + DAY) and budget.allow_review(NOW + DAY)
+    assert DailyBudget().new_limit == NEW_PER_DAY
+
+
+def make_deck(count, correct_count, ease=6.65, stability=12.0):
+    deck = CardStore.from_dicts([
+        {"id": i, "verb": f"verb{i}", "turkish": f"anlam{i}mak", "sentence": f"I verb{i}.",
+         "correct_count": correct_count, "next_review": NOW + 3 * DAY if correct_count else 0,
+         "last_reviewed": NOW - DAY} for i in range(1, count + 1)])
+    for index in range(count):
+        deck.progress.ease[index] = ease
+        deck.progress.stability[index] = stability
+    return deck
+
+
+def test_unlearned_cards_get_new_algorithm_defaults():
+    # FSRS zorluğu (6.65) SM-2'ye EF olarak geçmemeli
+    deck = make_deck(3, 0)
+    reschedule_deck(deck.progress, SM2Algorithm(), now=NOW)
+    assert list(deck.progress.ease) == [DEFAULT_EASE] * 3
+    assert list(deck.progress.stability) == [0.0] * 3
+    assert list(deck.progress.next_review) == [0.0] * 3
+
+
+def test_reschedule_spreads_cards_over_days():
+    deck = make_deck(500, 8)
+    policy = SchedulePolicy(DueForecast(), algorithm=FSRSAlgorithm())
+    assert reschedule_deck(deck.progress, FSRSAlgorithm(), now=NOW, policy=policy) == 500
+    days = Counter(day_number(due) for due in deck.progress.next_review)
+    assert len(days) > 1
+    assert max(days.values()) - min(days.values()) <= 1
+    # Vade tahmini yeni vadelerden baştan kurulur
+    assert policy.forecast.days == DueForecast(deck.progress.next_review).days
@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import SQLiteStorage
+
+
+def card(card_id, verb):
+    return {"id": card_id, "verb": verb, "turkish": f"{verb}mak", "sentence": f"I {verb}."}
+
+
+def test_concurrent_add_cards_do_not_overwrite(tmp_path):
+    # İki süreç aynı anda kelime ekler; ikisi de bellekteki desteden id 2'yi seçer
+    path = str(tmp_path / "deck.db")
+    first = SQLiteStorage(path)
+    first.save_all([card(1, "run")])
+    second = SQLiteStorage(path)
+    alpha, beta = card(2, "alpha"), card(2, "beta")
+    first.add_cards([alpha])
+    second.add_cards([beta])
+    assert alpha["id"] == 2 and beta["id"] == 3
+    verbs = {item["id"]: item["verb"] for item in first.load()}
+    assert verbs == {1: "run", 2: "alpha", 3: "beta"}
+    first.close()
+    second.close()
+
+
+def test_add_cards_without_id_gets_one(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "deck.db"))
+    storage.save_all([card(5, "run")])
+    item = card(None, "walk")
+    storage.add_cards([item])
+    assert item["id"] == 6
+    storage.close()
+
+
+def test_save_all_still_updates_existing_cards(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "deck.db"))
+    storage.save_all([card(1, "run")])
+    storage.save_all([dict(card(1, "run"), weight=42)])
+    assert [item["weight"] for item in storage.load()] == [42]
+    storage.close()
@@ -0,0 +1,50 @@
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import terminal
+from terminal import CLEAR_SCREEN, Screen
+
+
+def make_screen(monkeypatch, rows=24, columns=80):
+    monkeypatch.setattr(terminal.shutil, "get_terminal_size",
+                        lambda: os.terminal_size((columns, rows)))
+    stream = io.StringIO()
+    return Screen(stream), stream
+
+
+def test_redraw_only_writes_changed_lines(monkeypatch):
+    screen, stream = make_screen(monkeypatch)
+    screen.draw([f"line {i}" for i in range(10)])
+    stream.truncate(0)
+    stream.seek(0)
+    screen.draw([f"line {i}" for i in range(9)] + ["changed"])
+    out = stream.getvalue()
+    assert CLEAR_SCREEN not in out and "changed" in out and "line 3" not in out
+
+
+def test_output_below_the_frame_that_scrolls_forces_full_redraw(monkeypatch):
+    screen, stream = make_screen(monkeypatch)
+    frame = [f"line {i}" for i in range(20)]
+    screen.draw(frame)
+    screen.print("short message")
+    screen.print("\x1b[32m" + "x" * 150 + "\x1b[0m")     # iki satıra taşar
+    assert screen.lines is not None
+    screen.print("one more")
+    assert screen.lines is None
+    stream.truncate(0)
+    stream.seek(0)
+    screen.draw(frame)
+    assert CLEAR_SCREEN in stream.getvalue()
+
+
+def test_input_counts_its_row(monkeypatch):
+    screen, _ = make_screen(monkeypatch, rows=12)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "cevap")
+    screen.draw([str(i) for i in range(10)])
+    assert screen.input("Seçiminiz: ") == "cevap"
+    assert screen.lines is not None
+    screen.input("Seçiminiz: ")
+    assert screen.lines is None
@@ -0,0 +1,29 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from add_words import read_rows
+from validate_deck import validate
+
+
+def test_csv_ids_are_accepted(tmp_path):
+    path = tmp_path / "new_words.csv"
+    path.write_text("id,verb,turkish,sentence\n"
+                    "41,run,koşmak,I run every day.\n"
+                    "42,swim,yüzmek,We swim in the sea.\n"
+                    ",jump,zıplamak,Kids jump on the bed.\n", encoding="utf-8")
+    report = validate(read_rows(str(path)), workers=1, require_ids=False)
+    assert report["ok"] and "invalid_id" not in report["counts"]
+
+
+def test_csv_bad_and_duplicate_ids_are_reported(tmp_path):
+    path = tmp_path / "new_words.tsv"
+    path.write_text("id\tverb\tturkish\tsentence\n"
+                    "7\trun\tkoşmak\tI run every day.\n"
+                    "7\tswim\tyüzmek\tWe swim in the sea.\n"
+                    "x1\tjump\tzıplamak\tKids jump on the bed.\n", encoding="utf-8")
+    report = validate(read_rows(str(path)), workers=1, require_ids=False)
+    assert report["counts"]["duplicate_id"] == 1
+    assert report["counts"]["invalid_id"] == 1
+    assert report["issues"]["duplicate_id"][0]["ids"] == [7, 7]
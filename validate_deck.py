@@ -0,0 +1,305 @@
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from add_words import REQUIRED_FIELDS, batched, read_rows, verb_hash
+from answers import PARENTHESES, normalize
+from cloze import find_blank
+from persistence import atomic_write
+from storage import DEFAULT_PATH, open_storage
+
+BATCH_SIZE = 20000
+# Anahtarlar bu kadar bölüme dağıtılır; tekrar gruplama paralel çalışır ve
+# hiçbir süreç tüm anahtarların sözlüğünü tutmaz
+PARTITIONS = 16
+# Her kayıt: 8 baytlık anahtar özeti, satır numarası, 8 baytlık etiket özeti
+RECORD = struct.Struct("<8sq8s")
+NO_TAG = bytes(8)
+REPORT_VERSION = 1
+# Sadece fiili farklı cümleler, boşluğun çevresinde en az bu kadar kelime
+# varsa raporlanır ("Help me!" / "Call me." önemsenmeyecek kadar kısa)
+TEMPLATE_WORDS = 3
+
+# kod -> (önem, açıklama); hatalar komutun 1 koduyla çıkmasına yol açar
+CHECKS = {
+    "malformed_row": ("error", "row is not a JSON object"),
+    "missing_field": ("error", "verb, turkish or sentence is missing or empty"),
+    "invalid_id": ("error", "id is missing or not a positive integer"),
+    "duplicate_id": ("error", "several cards share one id"),
+    "duplicate_verb": ("warning", "same verb (case-insensitive) on several cards"),
+    "duplicate_meaning": ("warning", "several cards have the same Turkish meaning after normalization"),
+    "near_duplicate_meaning": ("warning", "meanings that only differ in a note in parentheses, "
+                               "e.g. 'iptal etmek' and 'iptal etmek (etkinlik)'"),
+    "verb_not_in_sentence": ("warning", "the sentence does not contain the verb or one of its inflected forms"),
+    "duplicate_sentence": ("warning", "same sentence after normalization on several cards"),
+    "near_duplicate_sentence": ("warning", "sentences that differ only in the verb (ambiguous in cloze mode)"),
+}
+# Grup kontrolleri: anahtar türü -> sorun kodu. Etiketli türlerde sadece
+# üyeleri birden fazla farklı etiket taşıyan gruplar raporlanır.
+GROUP_CHECKS = {
+    "id": "duplicate_id",
+    "verb": "duplicate_verb",
+    "meaning": "duplicate_meaning",
+    "bare": "near_duplicate_meaning",
+    "sentence": "duplicate_sentence",
+    "template": "near_duplicate_sentence",
+}
+
+
+def digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+def parse_id(value):
+    # Pozitif tamsayı id ya da None. CSV/TSV okuyucuları her hücreyi metin
+    # olarak verir; rakamlardan oluşan metinler ("42") de id sayılır.
+    if isinstance(value, str) and value.strip().isascii() and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
+# --- Map aşaması: satır kontrolleri ve gruplama anahtarları (işçi süreçlerde) ---
+
+def check_batch(start, rows, require_ids=True, partitions=PARTITIONS):
+    # (issues, ids, keys) döndürür: (satır, kod, ayrıntı) sorunları, her
+    # satırın id'si (geçersizse 0) ve {(tür, bölüm): paketlenmiş kayıtlar}
+    issues = []
+    ids = array('q')
+    keys = {}
+
+    def emit(kind, key, row, tag=NO_TAG):
+        part = (kind, key[0] % partitions)
+        records = keys.get(part)
+        if records is None:
+            records = keys[part] = bytearray()
+        records += RECORD.pack(key, row, tag)
+
+    for row, item in enumerate(rows, start):
+        if not isinstance(item, dict):
+            issues.append((row, "malformed_row", None))
+            ids.append(0)
+            continue
+        raw_id = item.get("id")
+        card_id = parse_id(raw_id)
+        if card_id is not None:
+            ids.append(card_id)
+            emit("id", card_id.to_bytes(8, "little"), row)
+        else:
+            ids.append(0)
+            # Ayraçlı dosyada boş id hücresi id yok demektir
+            if require_ids or raw_id not in (None, ""):
+                issues.append((row, "invalid_id", None))
+        missing = [field for field in REQUIRED_FIELDS
+                   if not isinstance(item.get(field), str) or not item[field].strip()]
+        if missing:
+            issues.append((row, "missing_field", ",".join(missing)))
+        verb = item.get("verb") if "verb" not in missing else None
+        turkish = item.get("turkish") if "turkish" not in missing else None
+        sentence = item.get("sentence") if "sentence" not in missing else None
+
+        if verb is not None:
+            emit("verb", verb_hash(verb), row)
+        if turkish is not None:
+            meaning = digest(normalize(turkish))
+            emit("meaning", meaning, row)
+            # Şık olarak yan yana gösterilince aynı görünürler
+            emit("bare", digest(normalize(PARENTHESES.sub(" ", turkish))), row, meaning)
+        if sentence is not None:
+            emit("sentence", digest(normalize(sentence)), row)
+        if verb is not None and sentence is not None:
+            blank = find_blank(verb, sentence)
+            if blank is None:
+                issues.append((row, "verb_not_in_sentence", None))
+            else:
+                template = normalize(sentence[:blank.start] + " " + sentence[blank.end:])
+                if len(template.split()) >= TEMPLATE_WORDS:
+                    emit("template", digest(template), row, verb_hash(verb))
+    return issues, ids, keys
+
+
+# --- Reduce aşaması: anahtarların tek bir bölümünü grupla (işçi süreçlerde) ---
+
+def group_partition(code, records, tagged):
+    # Aynı anahtarı paylaşan satırlar; etiketli türlerde sadece birden fazla
+    # etiket taşıyan gruplar
+    groups = {}
+    for key, row, tag in RECORD.iter_unpack(records):
+        groups.setdefault(key, []).append((row, tag))
+    found = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        if tagged and len({tag for _, tag in members}) < 2:
+            continue
+        found.append(sorted({row for row, _ in members}))
+    return code, found
+
+
+class Validator:
+    # Satırları partiler halinde süreç havuzuna akıtır (map: satır kontrolleri
+    # ve gruplama anahtarları), anahtarları bölümlere göre toplar, sonra her
+    # bölümü havuzda gruplar (reduce). Aynı anda en fazla 2 * workers parti
+    # işlenir; bellek satırlarla değil paketlenmiş anahtarlarla sınırlı kalır.
+    def __init__(self, workers=None, batch_size=BATCH_SIZE, require_ids=True, max_examples=1000):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.require_ids = require_ids
+        self.max_examples = max_examples
+
+    def run(self, rows):
+        start = time.perf_counter()
+        self.counts = Counter()
+        self.examples = {}
+        self.ids = array('q')
+        self.keys = {}
+        if self.workers == 1:
+            # Havuz yok: aynı kod bu süreçte çalışır (küçük desteler, hata ayıklama)
+            for results in self._map(rows, None):
+                self._collect(*results)
+            for code, found in self._reduce(None):
+                self._report_groups(code, found)
+        else:
+            with ProcessPoolExecutor(self.workers) as pool:
+                for results in self._map(rows, pool):
+                    self._collect(*results)
+                for code, found in self._reduce(pool):
+                    self._report_groups(code, found)
+        return self._report(time.perf_counter() - start)
+
+    def _map(self, rows, pool):
+        start = 0
+        pending = deque()
+        for batch in batched(rows, self.batch_size):
+            if pool is None:
+                yield check_batch(start, batch, self.require_ids)
+            else:
+                pending.append(pool.submit(check_batch, start, batch, self.require_ids))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            start += len(batch)
+        while pending:
+            yield pending.popleft().result()
+
+    def _collect(self, issues, ids, keys):
+        # Partiler sırayla gelir, satır numaraları self.ids ile hizalı kalır
+        self.ids.extend(ids)
+        for row, code, detail in issues:
+            self._add(code, [row], detail)
+        for part, records in keys.items():
+            existing = self.keys.get(part)
+            if existing is None:
+                self.keys[part] = records
+            else:
+                existing += records
+
+    def _reduce(self, pool):
+        jobs = [(GROUP_CHECKS[kind], records, kind in ("bare", "template"))
+                for (kind, _), records in self.keys.items()]
+        self.keys = {}
+        if pool is None:
+            return (group_partition(*job) for job in jobs)
+        return pool.map(group_partition, *zip(*jobs)) if jobs else iter(())
+
+    def _report_groups(self, code, groups):
+        for rows in sorted(groups):
+            self._add(code, rows)
+
+    def _add(self, code, rows, detail=None):
+        self.counts[code] += 1
+        examples = self.examples.setdefault(code, [])
+        if len(examples) < self.max_examples:
+            issue = {"rows": rows, "ids": [self.ids[row] or None for row in rows]}
+            if detail is not None:
+                issue["detail"] = detail
+            examples.append(issue)
+
+    def _report(self, elapsed):
+        errors = sum(count for code, count in self.counts.items() if CHECKS[code][0] == "error")
+        warnings = sum(self.counts.values()) - errors
+        return {
+            "version": REPORT_VERSION,
+            "rows": len(self.ids),
+            "ok": errors == 0,
+            "errors": errors,
+            "warnings": warnings,
+            "counts": {code: self.counts[code] for code in CHECKS if self.counts[code]},
+            "checks": {code: {"severity": severity, "description": description}
+                       for code, (severity, description) in CHECKS.items()},
+            # Her sorun girdi sırasındaki 0 tabanlı satır numaralarını ve kart
+            # id'lerini listeler
+            "issues": {code: self.examples[code] for code in CHECKS if code in self.examples},
+            "workers": self.workers,
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(len(self.ids) / elapsed) if elapsed > 0 else 0,
+        }
+
+
+def validate(rows, workers=None, batch_size=BATCH_SIZE, require_ids=True, max_examples=1000):
+    return Validator(workers, batch_size, require_ids, max_examples).run(rows)
+
+
+def print_report(report):
+    print(f"Checked {report['rows']} rows in {report['seconds']}s "
+          f"({report['rows_per_sec']} rows/sec, {report['workers']} workers)")
+    print(f"{report['errors']} errors, {report['warnings']} warnings")
+    for code, count in report["counts"].items():
+        severity = report["checks"][code]["severity"]
+        print(f"  {severity:<7} {code}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check a deck (or files about to be imported) for missing fields, duplicate ids, "
+                    "verbs and meanings, sentences without their verb and near-duplicates.")
+    parser.add_argument("inputs", nargs="*", help="CSV, TSV, JSONL or JSON files to check instead of the deck")
+    parser.add_argument("--deck", default=DEFAULT_PATH, help=f"deck to check (default: {DEFAULT_PATH})")
+    parser.add_argument("--format", choices=["csv", "tsv", "jsonl", "ndjson", "json"],
+                        help="input format (default: from file extension)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count; 1 runs in-process)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--max-examples", type=int, default=1000, help="issues listed per check in the report")
+    parser.add_argument("--report", help="write the full report as JSON to this file ('-' for stdout)")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 on warnings too")
+    args = parser.parse_args()
+
+    if args.inputs:
+        # İçe aktarılacak dosyalara id'yi add_words.py verir; sadece var olan
+        # id'ler kontrol edilir
+        def rows():
+            for path in args.inputs:
+                yield from read_rows(path, args.format)
+
+        report = validate(rows(), args.workers, args.batch_size, require_ids=False,
+                          max_examples=args.max_examples)
+    else:
+        storage = open_storage(args.deck)
+        try:
+            if not storage.exists():
+                parser.error(f"deck not found: {args.deck}")
+            report = validate(storage.iter_cards(), args.workers, args.batch_size,
+                              max_examples=args.max_examples)
+        finally:
+            storage.close()
+
+    if args.report == "-":
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.report:
+            atomic_write(args.report, lambda f: json.dump(report, f, ensure_ascii=False, indent=2))
+    failed = not report["ok"] or (args.strict and report["warnings"])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,29 @@ import React, { useState, useEffect } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Play, BarChart2, RotateCcw, Check, X, Trophy } from 'lucide-react';
 import './App.css';
-import rawVerbs from './verbs.json';
+
+// --- Deck Loading ---
+
+// Built by `python export_bundle.py` (runs before `npm run dev` / `npm run build`).
+// The manifest is revalidated on every load; chunk file names carry a content
+// hash, so unchanged chunks come straight from the browser cache.
+const DECK_URL = `${import.meta.env.BASE_URL}deck/`;
+const BUNDLE_FORMAT = 1;
+
+async function loadVocabulary() {
+  const response = await fetch(`${DECK_URL}manifest.json`, { cache: 'no-cache' });
+  const manifest = await response.json();
+  if (manifest.format !== BUNDLE_FORMAT) {
+    throw new Error(`Unsupported deck bundle format: ${manifest.format}`);
+  }
+  const chunks = await Promise.all(manifest.chunks.map(async (chunk) => {
+    const rows = await (await fetch(DECK_URL + chunk.file, { cache: 'force-cache' })).json();
+    // Rows are [id, verb, turkish, sentence]; the category is stored once per chunk
+    return rows.map(([id, verb, turkish, sentence]) => ({ id, verb, turkish, sentence, category: chunk.category }));
+  }));
+  // Chunks are grouped by category; restore the deck (curriculum) order
+  return chunks.flat().sort((a, b) => a.id - b.id);
+}
 
 // --- Game Logic Hooks ---
 
@@ -15,25 +37,30 @@ function useGameLogic() {
   const [streak, setStreak] = useState(0);
   const [feedback, setFeedback] = useState(null); // 'correct' or 'wrong'
 
-  // Load progress from localStorage on mount
+  // Load the deck bundle and progress from localStorage on mount
   useEffect(() => {
-    const savedProgress = JSON.parse(localStorage.getItem('verb_progress') || '{}');
-
-    // Merge raw verbs with saved progress
-    const mergedDeck = rawVerbs.map(verb => {
-      const saved = savedProgress[verb.id];
-      if (saved) {
-        return { ...verb, ...saved };
-      }
-      return {
-        ...verb,
-        weight: 100,
-        correct_count: 0,
-        next_review: 0
-      };
-    });
-
-    setDeck(mergedDeck);
+    let cancelled = false;
+    loadVocabulary().then(rawVerbs => {
+      if (cancelled) return;
+      const savedProgress = JSON.parse(localStorage.getItem('verb_progress') || '{}');
+
+      // Merge raw verbs with saved progress
+      const mergedDeck = rawVerbs.map(verb => {
+        const saved = savedProgress[verb.id];
+        if (saved) {
+          return { ...verb, ...saved };
+        }
+        return {
+          ...verb,
+          weight: 100,
+          correct_count: 0,
+          next_review: 0
+        };
+      });
+
+      setDeck(mergedDeck);
+    }).catch(error => console.error('Could not load the deck bundle:', error));
+    return () => { cancelled = true; };
   }, []);
 
   // Save progress